@@ -77,6 +77,11 @@ def is_good_response(resp):
 #status = API_put(data)  #"put" data using API class
 #print(status)
 
+#the stock history saved by Screen_Scraper_ODSA.py can be loaded without re-parsing the json text on every run
+#from Stock_Data_Cache_ODSA import load_stock_history, to_dataframe
+#stock_hist = load_stock_history('C:\\Python\\Data\\stock_hist.json') #memory-mapped, sorted by (ticker, date)
+#print(to_dataframe(stock_hist).tail())
+
 #Web Scrape experimentation - https://realpython.com/python-web-scraping-practical-introduction/
 raw_html = simple_get('http://www.fabpedigree.com/james/mathmen.htm')
 print(len(raw_html)) #if > 0, then successful
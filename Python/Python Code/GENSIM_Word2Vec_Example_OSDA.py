@@ -7,8 +7,8 @@
 #other verbal or symbolic series in which patterns may be discerned.
 
 import os
-import tempfile
-TEMP_FOLDER = tempfile.gettempdir()
+#each pipeline stage (tokens, dictionary, corpus, model) is cached in TEMP_FOLDER, see Pipeline_Cache_ODSA.py
+from Pipeline_Cache_ODSA import TEMP_FOLDER, text_fingerprint, stage_key, cached_stage, save_tokens, TokenStream
 print('Folder "{}" will be used to save temporary dictionary and corpus.'.format(TEMP_FOLDER))
 """Basic word2vec example."""
 import numpy as np
@@ -44,28 +44,43 @@ raw_corpus = ["Human machine interface for lab abc computer applications",
              "Graph minors IV Widths of trees and well quasi ordering",
              "Graph minors A survey"]
 
-print('Task 2: Preprocessing dataset, including stoplist, word frequencies & filters')
 stoplist = set('for a of the and to in'.split())
-print('Task 2a: Lowercase each document')
-texts = [[word for word in document.lower().split() if word not in stoplist]
-          for document in raw_corpus]
+min_frequency = 2 #only keep words that appear more than once
+cache_prefix = 'word2vec_example'
 
-print('Task 2b:  create a list list of non-distinct parsed words from doc') 
-# Count word frequencies
-from collections import defaultdict
-frequency = defaultdict(int)
-for text in texts:
-    for token in text:
-        frequency[token] += 1
+#every stage key hashes the key of the stage before it + the stage parameters, the first one hashes the input text
+tokens_key = stage_key('tokens', text_fingerprint(raw_corpus), stoplist=sorted(stoplist), min_frequency=min_frequency)
+dictionary_key = stage_key('dictionary', tokens_key)
+corpus_key = stage_key('corpus', dictionary_key)
+model_key = stage_key('tfidf', corpus_key)
 
-print('Task 2c: Only keep words that appear more than once')
-processed_corpus = [[token for token in text if frequency[token] > 1] for text in texts]
-#long list of distinct words
+def build_tokens(path):
+    print('Task 2: Preprocessing dataset, including stoplist, word frequencies & filters')
+    print('Task 2a: Lowercase each document')
+    texts = [[word for word in document.lower().split() if word not in stoplist]
+              for document in raw_corpus]
+
+    print('Task 2b:  create a list list of non-distinct parsed words from doc') 
+    # Count word frequencies
+    from collections import defaultdict
+    frequency = defaultdict(int)
+    for text in texts:
+        for token in text:
+            frequency[token] += 1
+
+    print('Task 2c: Only keep words that appear more than once')
+    processed_corpus = [[token for token in text if frequency[token] >= min_frequency] for text in texts]
+    #long list of distinct words
+    save_tokens(processed_corpus, path)
+
+processed_corpus = cached_stage(cache_prefix, 'tokens', tokens_key, build_tokens, TokenStream, '.txt')
 
 print('Task 2d: Create dictionary/term-document matrix')
 #associate each word in the processed corpus with a unique integer ID, using the gensim.corpora.Dictionary class. 
 #This dictionary defines the vocabulary of all words that our processing knows about.
-dictionary = corpora.Dictionary(processed_corpus)
+dictionary = cached_stage(cache_prefix, 'dictionary', dictionary_key,
+                          lambda path: corpora.Dictionary(processed_corpus).save(path),
+                          corpora.Dictionary.load, '.dict')
 print(dictionary)
 
 print('Task 3:  Extract Knowledge by vectorizing corpus, then applying NLP methodology')
@@ -77,12 +92,17 @@ new_vec = dictionary.doc2bow(new_doc.lower().split())
 #To infer the latent structure in our training corpus we need a way to represent documents
 #that we can manipulate mathematically. One approach is to represent each document as a vector. 
 print('Task 3a: convert training document into id-driven vectors, using dictionary data structure')
-bow_corpus = [dictionary.doc2bow(text) for text in processed_corpus]
+bow_corpus = cached_stage(cache_prefix, 'corpus', corpus_key,
+                          lambda path: corpora.MmCorpus.serialize(path, (dictionary.doc2bow(text) for text in processed_corpus)),
+                          corpora.MmCorpus, '.mm')
 
 print('Task 3b: Apply NLP model to vector space')
 #The tf-idf model transforms vectors from the bag-of-words representation to a vector space,
 #where the frequency counts are weighted according to the relative rarity of each word in the corpus.
-tfidf = models.TfidfModel(bow_corpus) #initalize & train model on vectorized data
+#initalize & train model on vectorized data
+tfidf = cached_stage(cache_prefix, 'tfidf', model_key,
+                     lambda path: models.TfidfModel(bow_corpus).save(path),
+                     models.TfidfModel.load, '.tfidf')
 tfidf2 = tfidf[new_vec] #use tf-idf "trained" model to transform the "new" document vector
 print(tfidf2)
 
@@ -11,8 +11,11 @@
 
 #Note - Using matplot & numpy libraries with pandas examples!
 import matplotlib.pylab as plt  #see graph options at: https://matplotlib.org/gallery/index.html
+import os
 import numpy as np
 import pandas as pd
+#stock history datasets are parsed once into a memory-mapped binary cache, see Stock_Data_Cache_ODSA.py
+from Stock_Data_Cache_ODSA import load_stock_history, date_range, to_dataframe
 
 def file_read_csv(path):
     print("Pandas File I/O Example - CSV Read")
@@ -25,11 +28,16 @@ def file_write_csv(data, path):
     #write Pandas dataframe object to local csv file
     data.to_csv(path)
 
+#opened workbooks, re-used by file_read_excel as long as the file is not modified
+excel_files = {}
+
 def file_read_excel(data,path,sheet):
     print("Pandas File I/O Example - Read")
     #load csv file into Pandas dataframe object
-    xlsx = pd.ExcelFile(path)
-    data = pd.read_excel(xlsx, sheet)
+    key = (path, os.path.getmtime(path))
+    if key not in excel_files:
+        excel_files[key] = pd.ExcelFile(path) #parse the workbook only once, not on every call
+    data = pd.read_excel(excel_files[key], sheet)
     return data
 
 
@@ -98,4 +106,14 @@ x = pd.to_datetime(data4['Date'])   #iterate list to transfor dates for graphica
 data5 = pd.DataFrame({'Close':y, 'Date':x}).set_index(x) 
 data5.plot(kind='line')
 plt.show()
+
+#import S&P 500 (SPY) historical data - the first run converts the csv file to a binary cache,
+#later runs memory-map the cache instead of parsing the text again
+spy = load_stock_history(r"C:\\Python\\Data\\SPY.csv")
+print("Number of trading days in SPY history: {}".format(len(spy)))
+#select the 2008 financial crisis - a binary search on the sorted dates, not a scan of the whole history
+spy_2008 = to_dataframe(date_range(spy, '2008-01-01', '2009-01-01'))
+print(spy_2008.head())
+spy_2008['close'].plot(kind='line')
+plt.show()
 #Time series functions:  http://wavedatalab.github.io/datawithpython/timeseries.html
\ No newline at end of file
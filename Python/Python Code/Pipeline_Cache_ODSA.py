@@ -0,0 +1,77 @@
+#Goal - Cache the artifacts of each CRISP-DM pipeline stage on disk, so re-runs only redo the stages that changed
+#Used by: GENSIM_Word2Vec_LSIModel_OSDA.py, GENSIM_Word2Vec_Example_OSDA.py
+
+#How it works: every stage (tokens -> dictionary -> corpus -> model) gets a key, which is a hash of
+#the key of the stage before it plus the parameters of the stage itself. The first stage hashes the input data.
+#The artifact is saved in TEMP_FOLDER under that key, so e.g. changing only num_topics changes only the model key
+#and the (expensive) preprocessing and vectorization artifacts are simply loaded back from disk.
+import os
+import hashlib
+import tempfile
+
+TEMP_FOLDER = tempfile.gettempdir()
+
+
+#fingerprint the input data: hash of the file content, read in blocks so large files are not loaded in RAM
+def file_fingerprint(path, block_size=1 << 20):
+    sha = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+#fingerprint in-memory input data, e.g. a list of documents
+def text_fingerprint(documents):
+    sha = hashlib.sha1()
+    for document in documents:
+        sha.update(document.encode("utf8") + b"\n")
+    return sha.hexdigest()
+
+
+#key of a stage = hash of the stage name, the key of the stage it is built from and its own parameters
+def stage_key(stage, upstream_key, **params):
+    description = repr((stage, upstream_key, sorted((name, repr(value)) for name, value in params.items())))
+    return hashlib.sha1(description.encode("utf8")).hexdigest()[:16]
+
+
+def stage_path(prefix, stage, key, suffix=""):
+    return os.path.join(TEMP_FOLDER, "{}_{}_{}{}".format(prefix, stage, key, suffix))
+
+
+#load the artifact of a stage from the cache, or build it, save it to the cache and load it back
+#build(path) must write the artifact to path; load(path) returns it
+def cached_stage(prefix, stage, key, build, load, suffix=""):
+    path = stage_path(prefix, stage, key, suffix)
+    if os.path.exists(path):
+        print('Stage "{}": loading cached artifact {}'.format(stage, path))
+    else:
+        print('Stage "{}": building artifact {}'.format(stage, path))
+        #build under a temporary name first, so an interrupted run never leaves a half-written artifact behind
+        tmp_path = stage_path(prefix, stage, key, ".tmp" + suffix)
+        build(tmp_path)
+        #gensim may write companion files (e.g. *.index, *.projection), move those first and the artifact last
+        tmp_name = os.path.basename(tmp_path)
+        tmp_files = [name for name in os.listdir(TEMP_FOLDER) if name.startswith(tmp_name) and name != tmp_name]
+        for tmp_file in tmp_files + [tmp_name]:
+            os.replace(os.path.join(TEMP_FOLDER, tmp_file),
+                       os.path.join(TEMP_FOLDER, tmp_file.replace(".tmp" + suffix, suffix, 1)))
+    return load(path)
+
+
+#token stream artifact: one document per line, tokens separated by spaces
+def save_tokens(texts, path):
+    with open(path, "w", encoding="utf8") as f:
+        for text in texts:
+            f.write(" ".join(text) + "\n")
+
+
+class TokenStream(object):
+    #iterate over the documents of a token stream artifact without loading it all in RAM
+    def __init__(self, path):
+        self.path = path
+
+    def __iter__(self):
+        with open(self.path, "r", encoding="utf8") as f:
+            for line in f:
+                yield line.split()
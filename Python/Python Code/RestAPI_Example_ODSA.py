@@ -1,8 +1,17 @@
 #Purpose: REST API Example using Stored stock market data, along with Google Fusion Tables
+import os
+import sys
 import json
 import csv
+import time
+import itertools
+import threading
 import requests  #GET/POST/PUT API requests
+from requests.adapters import HTTPAdapter #connection pool settings of a requests session
+from requests.exceptions import RequestException, ConnectTimeout, ConnectionError as RequestsConnectionError
+from urllib3.exceptions import NewConnectionError #requests' transport: connection could not be opened
 from contextlib import closing  #utilities for common tasks involving the "with" statement.
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler #local stand-in endpoint for testing
 
 #Step 1 - Identify Resource: set url for json request
 view_url = 'https://accounts.google.com/o/oauth2/token'
@@ -54,6 +63,132 @@ def API_POST_Data(access_token, table_id, data):
         #If response code is not ok (200), print the resulting http error code with description
         return "The API Post Request Was Not Successful"
 
+#Streaming upload path: rows are serialized one at a time by a generator & sent as a chunked request body,
+#in batches of `batch_size` rows over a pooled session, retrying failed batches with exponential backoff
+RETRY_STATUS = (429, 500, 502, 503, 504) #idempotent /replace: retried after any of these
+APPEND_RETRY_STATUS = (429, 503) #/import (append): only when the server surely did not apply the batch
+
+def format_row(row):
+    #one obs of the request body - same comma seperated format as API_POST_Data
+    line = row['date'].replace(",","") + ', ' + row['open'] + ', ' + row['close'] + ', ' + row['volume'].replace(",","") + '\n'
+    return line.encode('utf8')
+
+def iter_body(lines):
+    #requests sends a generator body with "Transfer-Encoding: chunked", without joining it into one string
+    for line in lines:
+        yield line
+
+def iter_batches(rows, batch_size):
+    rows = iter(rows)
+    while True:
+        batch = [format_row(row) for row in itertools.islice(rows, batch_size)]
+        if not batch:
+            return
+        yield batch
+
+def make_session(pool_size=4):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size) #kept-alive connections are re-used
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def failed_before_sending(e):
+    #True if the request never reached the server: connect timeout, or the connection could not be opened
+    if isinstance(e, ConnectTimeout):
+        return True
+    reason = getattr(e.args[0], 'reason', None) if e.args else None #urllib3 MaxRetryError wraps the cause
+    return isinstance(e, RequestsConnectionError) and isinstance(reason, NewConnectionError)
+
+#an idempotent batch (/replace) is retried after any failure, an append batch (/import) only if it cannot have
+#been applied yet - after e.g. a read timeout or a 500 the rows may already be in the table, and would be appended twice
+def post_batch(session, url, lines, headers, retries=3, backoff=0.5, idempotent=True):
+    retry_status = RETRY_STATUS if idempotent else APPEND_RETRY_STATUS
+    for attempt in range(retries + 1):
+        try:
+            myResponse = session.post(url, data=iter_body(lines), headers=headers, timeout=60) #fresh body per attempt
+            if myResponse.status_code not in retry_status:
+                return myResponse
+            error = 'http status {}'.format(myResponse.status_code)
+        except RequestException as e:
+            if not idempotent and not failed_before_sending(e):
+                raise IOError('Append upload failed, not retried to avoid duplicate rows: {}'.format(e))
+            error = str(e)
+        if attempt < retries:
+            delay = backoff * 2 ** attempt
+            print('Upload attempt {} failed ({}), retrying in {:.1f}s'.format(attempt + 1, error, delay))
+            time.sleep(delay)
+    raise IOError('Upload failed after {} attempts: {}'.format(retries + 1, error))
+
+#Step 1-3) Google Fusion Table - Replace with the first batch, then Import (append) the remaining batches
+#`rows` can be any iterable of dicts, e.g. a csv.DictReader - only one batch is held in memory at a time
+def API_POST_Data_Streaming(access_token, table_id, rows, batch_size=5000, retries=3, backoff=0.5,
+                            base_url="https://www.googleapis.com/upload/fusiontables/v2/tables/"):
+    headers = {'Content-type': 'application/octet-stream'}
+    replace_url = base_url + table_id + '/replace?&access_token=' + access_token + '&isStrict=false'
+    import_url = base_url + table_id + '/import?&access_token=' + access_token + '&isStrict=false'
+    session = make_session()
+    sent_rows, sent_bytes, start = 0, 0, time.time()
+    for i, lines in enumerate(iter_batches(rows, batch_size)):
+        myResponse = post_batch(session, replace_url if i == 0 else import_url, lines, headers, retries, backoff,
+                                idempotent=(i == 0))
+        if myResponse.status_code != 200:
+            #If response code is not ok (200), print the resulting http error code with description
+            print(myResponse.status_code)
+            return "The API Post Request Was Not Successful"
+        sent_rows += len(lines)
+        sent_bytes += sum(len(line) for line in lines)
+        elapsed = max(time.time() - start, 1e-6)
+        print('Batch {}: {} rows sent, {:.0f} rows/s, {:.1f} KB/s'.format(
+            i + 1, sent_rows, sent_rows / elapsed, sent_bytes / 1024.0 / elapsed))
+    return "The API Post Request Was Successful"
+
+#local stand-in endpoint for testing: accepts chunked uploads & keeps the received rows in `server.received`
+#the first `server.failures` requests are answered with 503, to exercise the retries
+class StubUploadHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1' #keep-alive
+
+    def read_body(self):
+        if self.headers.get('Transfer-Encoding', '').lower() != 'chunked':
+            return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b';')[0], 16)
+            chunk = self.rfile.read(size + 2)[:size] #chunk data followed by CRLF
+            if not size:
+                return b''.join(chunks)
+            chunks.append(chunk)
+
+    def do_POST(self):
+        body = self.read_body()
+        with self.server.lock:
+            fail = self.server.failures > 0
+            if fail:
+                self.server.failures -= 1
+            else:
+                self.server.received.extend(body.decode('utf8').splitlines())
+        self.send_response(503 if fail else 200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass  #keep the upload output readable
+
+def start_stub_endpoint(failures=0, port=0):
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubUploadHandler)
+    server.received, server.failures, server.lock = [], failures, threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, 'http://127.0.0.1:{}/tables/'.format(server.server_address[1])
+
+if os.environ.get('RESTAPI_STUB'):
+    #test run against the local stand-in endpoint, e.g. RESTAPI_STUB=1 python RestAPI_Example_ODSA.py Data/stock_hist.csv
+    server, base_url = start_stub_endpoint(failures=1)
+    with open(sys.argv[1] if len(sys.argv) > 1 else 'C:\\Python\\Data\\stock_hist.csv') as f:
+        print(API_POST_Data_Streaming('test-token', 'test-table', csv.DictReader(f), batch_size=10, backoff=0.1,
+                                      base_url=base_url))
+    print('stand-in endpoint received {} rows'.format(len(server.received)))
+    sys.exit(0)
+
 #step 4 - create request data structure from csv file, to replace data in the "OSDA Stock History" google fusion table
 #https://fusiontables.google.com/data?docid=1a8EPfomscPkMYksFrlGoyU4utoT0QdLCpH9tySDP#rows:id=1 
 reader = csv.DictReader(open('C:\\Python\\Data\\stock_hist.csv'))
@@ -69,4 +204,7 @@ table_id = '1a8EPfomscPkMYksFrlGoyU4utoT0QdLCpH9tySDP'
 #convert stock_data to json fiel
 status = API_POST_Data(access_token, table_id, stock_data)  #"put" data using API class
 print(status)
+#for long stock histories, stream the csv rows in batches instead of one giant request body:
+#with open('C:\\Python\\Data\\stock_hist.csv') as f:
+#    print(API_POST_Data_Streaming(access_token, table_id, csv.DictReader(f)))
 
@@ -9,9 +9,11 @@ n_samples = 2000 #sample size
 n_features = 1000 #name/entity recgonition & group selection (vectors)
 n_components = 5 #themes
 n_top_words = 10 #words per theme
+chunksize = 100000 #rows per chunk when streaming large comment exports with read_text_chunks
 
 #import libraries for data structures and Gensim Word2Vec API
 import os
+import re
 import tempfile
 TEMP_FOLDER = tempfile.gettempdir()
 print('Folder "{}" will be used to save temporary dictionary and corpus.'.format(TEMP_FOLDER))
@@ -20,12 +22,6 @@ import pandas as pd
 import gensim #open-source achine learning framework
 from gensim import corpora
 from gensim import models
-#data pre-processing tools from gensim package
-from gensim.parsing.preprocessing import strip_non_alphanum 
-from gensim.parsing.preprocessing import strip_numeric
-from gensim.parsing.preprocessing import strip_punctuation
-from gensim.parsing.preprocessing import strip_multiple_whitespaces
-from gensim.parsing.preprocessing import strip_short
 #import scikit-learn & graphical libraries
 # Any results you write to the current directory are saved as output.
 from sklearn import preprocessing #data prep - module includes scaling, centering, normalization, binarization and imputation methods.
@@ -49,20 +45,35 @@ def read_text(path):
     text=pd.read_csv(path) #import to pandas DataFrame
     return text #return pandas dataframe type
 
+#the gensim strip_numeric, strip_punctuation, strip_non_alphanum, strip_short & strip_multiple_whitespaces
+#filters as precompiled regexes - punctuation (incl. "_") and non-alphanumeric characters are combined in one pattern
+RE_NUMERIC = re.compile(r"[0-9]+", re.UNICODE)
+RE_SEPARATORS = re.compile(r"[\W_]+", re.UNICODE)
+RE_SHORT = re.compile(r"\b\w{1,2}\b", re.UNICODE) #words shorter than 3 characters
+RE_WHITESPACE = re.compile(r"\s+", re.UNICODE)
+
+#clean a whole text column at once with the pandas .str accessor, instead of row by row
+def clean_text_column(column):
+    return (column.fillna('').astype(str)
+            .str.replace(RE_NUMERIC, '', regex=True)
+            .str.replace(RE_SEPARATORS, ' ', regex=True)
+            .str.replace(RE_SHORT, '', regex=True)
+            .str.replace(RE_WHITESPACE, ' ', regex=True)
+            .str.strip())
+
 #preprocess data for use in text mining/NLP - refactored for pandas dataframe
 def preprocess_text(corpus,field_name = 'Comment'):
     print("Preprocessing Corpus from pandas data frame")
-    for index, row in corpus.iterrows():  #iterate through rows in dataframe
-        line = row['Comment'].strip('\n')
-        line = strip_punctuation(line)
-        line = strip_non_alphanum(line)
-        line = strip_numeric(line)
-        line = strip_multiple_whitespaces(line)
-        line = strip_short(line)
-        #add cleaned text line to new dataframe
-        corpus.at[index,field_name] = line #set value at row/column in corpus dataframet            
+    corpus[field_name] = clean_text_column(corpus[field_name]) #column-wise, vectorized cleaning
     return corpus
 
+#stream a large csv export in chunks of rows, yielding each chunk's cleaned text as a list of strings
+#- a batch of documents that CountVectorizer accepts, without loading the whole file in memory at once
+def read_text_chunks(path, field_name = 'Comment', chunksize = chunksize):
+    print("Pandas File I/O Example - chunked csv read")
+    for chunk in pd.read_csv(path, usecols=[field_name], chunksize=chunksize):
+        yield clean_text_column(chunk[field_name]).tolist()
+
 print('CRISP-DM Task: Data Preparation')
 print('Task 1: Read-in a text-based document, aka "establishing the corpus')
 documents = read_text(r"C:\\Python\\Data\\Text_Mining_Sample_CSV.csv") #single-line text
@@ -81,8 +92,10 @@ stop_words = text.ENGLISH_STOP_WORDS.union({"have", "with", "are", "JBergmann"})
 print('Task 2b: create a BOW vector for Latent-Dirichlet-Allocation (LDA) Model, using assigned stop words')
 #Convert a collection of text documents to a matrix of token counts - "bag-of-words", unless otherwise specified
 bow_vector = CountVectorizer(stop_words=stop_words)
-#"Comment" column is the 6th column in the dataset - index "5" in dataframe
-value_list = [row[5] for row in raw_corpus.itertuples(index=False, name=None)]
+value_list = raw_corpus['Comment'].tolist()
+#for comment exports with millions of rows, stream the cleaned batches straight into the vectorizer instead:
+#import itertools
+#value_list = itertools.chain.from_iterable(read_text_chunks(r"C:\\Python\\Data\\Text_Mining_Sample_CSV.csv"))
 #print(value_list[0:3])
 #create term-document matrix and and place all relevant terms in vocabulary/dictionary
 bow = bow_vector.fit_transform(value_list)
@@ -145,7 +158,7 @@ test_lda = lda.fit(test_vector)  #fit text vector within existing model - transp
 #Calculate approximate log-likelihood as score.
 print(test_lda.score(test_vector))
 
-print('Step 2: Use formal model evaluation stats "perplexity") 
+print('Step 2: Use formal model evaluation stats "perplexity"')
 # create test/train text documents to evaluate model 
 vectoriser = CountVectorizer(stop_words = 'english', max_features=500)  #max features must be less that "n_features" variable!
 doc_train = vectoriser.fit_transform(train)
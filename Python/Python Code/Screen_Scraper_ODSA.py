@@ -1,27 +1,42 @@
 #https://www.scrapehero.com/scrape-yahoo-finance-stock-market-data/
-#Construct the URL of the search results page from Yahoo Finance. 
+#Construct the URL of the search results page from Yahoo Finance.
 #   For example, here is the one for Apple-http://finance.yahoo.com/quote/AAPL?p=AAPL
 #Step 1) Download HTML of the search result page using Python Requests
 #Step 2) Inspect Data Source via web browser (IE) and Python (Print, BS4 Lib)
 #Step 3) Parse the page using BS4 HTML Parser + HTML Tag Information
 #Step 4) Save the data for Storage - CSV & JSON files.
+#Scaling up: scrape a list of tickers concurrently with a bounded thread pool - see scrape_tickers
 
+import os
+import sys
+import time
+import threading
 import requests  #GET/POST/PUT API requests
+from requests.adapters import HTTPAdapter #connection pool settings of a requests session
+from requests.exceptions import RequestException
 from contextlib import closing  #utilities for common tasks involving the "with" statement.
+from concurrent.futures import ThreadPoolExecutor, as_completed #bounded pool of worker threads
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler #local stub server for saved pages
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup #BeautifulSoup4 - HTML Web Scraping #Scrapy
 import csv #write stock information to csv file
 import json #write stock informaton to json file, for future API use
 #more info on bs4:  https://realpython.com/python-web-scraping-practical-introduction//
 
+BASE_URL = 'https://finance.yahoo.com'
+HISTORY_PATH = '/quote/{ticker}/history?p={ticker}'
+FIELDS = ['ticker', 'date', 'open', 'close', 'volume']
+
 #Web Scrape experimentation - https://realpython.com/blog/
-def simple_get(url):
+def simple_get(url, session=None):
     """
     Attempts to get the content at `url` by making an HTTP GET request.
     If the content-type of response is some kind of HTML/XML, return the
     text content, otherwise return None.
+    Pass a `session` to re-use its kept-alive connections instead of opening a new one.
     """
     try:
-        with closing(requests.get(url, stream=True)) as resp:
+        with closing((session or requests).get(url, stream=True, timeout=30)) as resp:
             if is_good_response(resp):
                 print('http request successful')
                 return resp.content
@@ -36,54 +51,108 @@ def is_good_response(resp):
     """
     Returns True if the response seems to be HTML, False otherwise.
     """
-    content_type = resp.headers['Content-Type'].lower()
-    return (resp.status_code == 200 
-            and content_type is not None 
+    content_type = resp.headers.get('Content-Type', '').lower()
+    return (resp.status_code == 200
+            and content_type is not None
             and content_type.find('html') > -1)
 
-#Web Scrape - bloomberg stock market data - S&P 500 example:  https://www.bloomberg.com/quote/SPX:IND
-raw_html = simple_get('https://finance.yahoo.com/quote/AAPL/history?p=AAPL')
-
-#using BeautifulSoap to scrape and inspect web page
-html = BeautifulSoup(raw_html, 'html.parser')
-#print(html.prettify())
-
-# Take out the <div> of name and get the stock's value
-stock_date = html.findAll("td", attrs={"class": "Py(10px) Ta(start) Pend(10px)"})
-#print(stock_date)
-
-#iterate through elements to get stock dates
-stock_date = []
-for i, text in enumerate(html.findAll("td", attrs={"class": "Py(10px) Ta(start) Pend(10px)"})):
-    stock_date.insert(i,text.span.string)
-print(stock_date)
-
-#create list to store other stock data
-stock_data = []
-for i, text in enumerate(html.findAll("td", attrs={"class": "Py(10px) Pstart(10px)"})):
-    stock_data.insert(i,text.span.string)
-print(stock_data)
-
-#combine date and stock information into dictionary data structure
-i = 0
-stock_info = {}
-for i in range(len(stock_date)-1):  #get stock info for every day
-    stock_info[i] = {"date": stock_date[i], "open": stock_data[(i*6)+0], "close": stock_data[(i*6)+3], "volume": stock_data[(i*6)+5]}
-    print(stock_info[i])
-
-#export stock information to csv
-i = 0
-with open('C:\\Python\\Data\\stock_hist.csv', 'w') as f:  # Just use 'w' mode in 3.x
-    w = csv.DictWriter(f, stock_info[i].keys(), lineterminator = '\n')
-    w.writeheader() 
-    while(i<len(stock_info)):
-        w.writerow(stock_info[i])
-        i += 1
-
-#export stock information to json
-jsonarray = json.dumps(stock_info)
-print(jsonarray)
-
-#write json file to local drive, for future use
-with open('C:\\Python\\Data\\stock_hist.json', 'w') as f:
-    json.dump(jsonarray, f)
\ No newline at end of file
+class HostRateLimiter(object):
+    """
+    Allows at most `max_per_second` requests per host, shared by all worker threads.
+    """
+    def __init__(self, max_per_second=2.0):
+        self.interval = 1.0 / max_per_second
+        self.next_slot = {}  #host -> earliest time of its next request
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:  #reserve the next free slot of the host, then sleep outside the lock
+            now = time.time()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        time.sleep(max(0.0, slot - now))
+
+#one requests session per worker thread: each keeps its connections alive between requests
+_sessions = threading.local()
+
+def get_session(pool_size=4):
+    if not hasattr(_sessions, 'session'):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _sessions.session = session
+    return _sessions.session
+
+#Step 3: parse a stock history page into rows of stock information, one row per trading day
+def parse_history(raw_html, ticker):
+    html = BeautifulSoup(raw_html, 'html.parser')
+    rows = []
+    for date_cell in html.find_all("td", attrs={"class": "Py(10px) Ta(start) Pend(10px)"}):
+        #the price cells of the same table row: open, high, low, close, adj close, volume
+        #(dividend & split rows have no price cells and are skipped)
+        stock_data = [cell.span.string for cell in date_cell.parent.find_all("td", attrs={"class": "Py(10px) Pstart(10px)"})]
+        if len(stock_data) == 6:
+            rows.append({"ticker": ticker, "date": date_cell.span.string,
+                         "open": stock_data[0], "close": stock_data[3], "volume": stock_data[5]})
+    return rows
+
+def fetch_history(ticker, base_url, limiter):
+    url = base_url + HISTORY_PATH.format(ticker=ticker)
+    limiter.wait(url)
+    return simple_get(url, session=get_session())
+
+#Step 1-4 for a list of tickers: fetch concurrently, parse each page as it arrives
+#and append its rows to the CSV & JSON (one JSON object per line) outputs right away
+def scrape_tickers(tickers, csv_path, json_path, base_url=BASE_URL, max_workers=4, max_per_second=2.0):
+    limiter = HostRateLimiter(max_per_second)
+    total = 0
+    with open(csv_path, 'w') as csv_file, open(json_path, 'w') as json_file, \
+            ThreadPoolExecutor(max_workers=max_workers) as pool:
+        w = csv.DictWriter(csv_file, FIELDS, lineterminator = '\n')
+        w.writeheader()
+        futures = {pool.submit(fetch_history, ticker, base_url, limiter): ticker for ticker in tickers}
+        for future in as_completed(futures):
+            ticker = futures[future]
+            raw_html = future.result()
+            if raw_html is None:
+                print('no stock history for {}'.format(ticker))
+                continue
+            rows = parse_history(raw_html, ticker)
+            for row in rows:
+                w.writerow(row)
+                json_file.write(json.dumps(row) + '\n')
+            csv_file.flush()
+            json_file.flush()
+            total += len(rows)
+            print('{}: {} days of stock history'.format(ticker, len(rows)))
+    return total
+
+#local stub server for testing: serves saved pages from `fixture_dir`, <TICKER>.html for the history page of TICKER
+class FixtureHandler(SimpleHTTPRequestHandler):
+    def translate_path(self, path):
+        parts = urlsplit(path).path.strip('/').split('/')  #/quote/<TICKER>/history
+        ticker = parts[1] if len(parts) == 3 and parts[0] == 'quote' else ''
+        return os.path.join(self.server.fixture_dir, ticker + '.html')
+
+    def log_message(self, format, *args):
+        pass  #keep the scraper output readable
+
+def start_stub_server(fixture_dir, port=0):
+    server = ThreadingHTTPServer(('127.0.0.1', port), FixtureHandler)
+    server.fixture_dir = fixture_dir
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+if __name__ == '__main__':
+    #Web Scrape - bloomberg stock market data - S&P 500 example:  https://www.bloomberg.com/quote/SPX:IND
+    tickers = sys.argv[1:] or ['AAPL', 'MSFT', 'AMZN', 'GOOG', 'SPY']
+    base_url = BASE_URL
+    csv_path, json_path = 'C:\\Python\\Data\\stock_hist.csv', 'C:\\Python\\Data\\stock_hist.json'
+    if os.environ.get('SCRAPER_FIXTURES'):
+        #test run against saved pages, e.g. SCRAPER_FIXTURES=Data/scraper_fixtures python Screen_Scraper_ODSA.py SPY QQQ
+        server, base_url = start_stub_server(os.environ['SCRAPER_FIXTURES'])
+        csv_path, json_path = 'stock_hist_test.csv', 'stock_hist_test.json'
+    total = scrape_tickers(tickers, csv_path, json_path, base_url=base_url)
+    print('saved {} rows of stock information to {} and {}'.format(total, csv_path, json_path))
@@ -0,0 +1,218 @@
+#Goal - Parse the stock history datasets (Data/SPY.csv, stock_hist.csv, stock_hist.json) only once
+#Used by: Library_Review_Pandas_ODSA.py, API_Scrape_Review_ODSA.py
+
+#How it works: the first load converts the text file into a binary cache file of a NumPy structured array,
+#one record per ticker & trading day sorted by (ticker, date): "date" as int64 (seconds since 1970-01-01 UTC),
+#"ticker" (only in the multi-ticker scraper output) as fixed-width bytes, every price/volume column as float64.
+#Later loads memory-map that file - zero-copy, nothing is parsed or read until it is used.
+#Because the records are sorted, date_range() finds a ticker & date range with a binary search instead of a full scan.
+#When the source file grows (e.g. the scraper appended new days), only the new lines are parsed & added.
+import os
+import csv
+import json
+import hashlib
+import tempfile
+import calendar
+from datetime import datetime, date
+import numpy as np
+
+CACHE_FOLDER = tempfile.gettempdir()
+DATE_FORMATS = ['%Y-%m-%d', '%b %d, %Y', '%m/%d/%Y'] #SPY.csv, stock_hist.csv/json (Yahoo Finance), excel exports
+CHECK_BYTES = 4096 #bytes before the end of the parsed part of the source, used to detect rewritten files
+TEXT_COLUMNS = ('ticker',) #kept as fixed-width bytes, all other columns except the date are numbers
+TEXT_WIDTH = 16
+CACHE_VERSION = 2 #bump when the record layout changes, older caches are then rebuilt
+
+
+#convert a date string, datetime or date to int64 epoch seconds
+def to_epoch(value):
+    if isinstance(value, (datetime, date)):
+        return calendar.timegm(value.timetuple())
+    for date_format in DATE_FORMATS:
+        try:
+            return calendar.timegm(datetime.strptime(value.strip(), date_format).timetuple())
+        except ValueError:
+            pass
+    raise ValueError('unknown date format: {!r}'.format(value))
+
+def to_number(value):
+    return float(str(value).replace(',', '')) if value not in (None, '', 'null', '-') else np.nan
+
+def to_text(value):
+    return str(value or '').strip().encode('utf8')[:TEXT_WIDTH]
+
+def to_value(name, value):
+    if name == 'date':
+        return to_epoch(value)
+    return to_text(value) if name in TEXT_COLUMNS else to_number(value)
+
+def column_name(name):
+    return name.strip().lower().replace(' ', '_').strip('*')
+
+
+#---- parsing the text formats into (columns, records) ----
+def parse_csv_lines(lines, header):
+    columns = [column_name(name) for name in header]
+    fields = record_columns(columns)
+    records = []
+    for row in csv.reader(lines):
+        if row:
+            values = dict(zip(columns, row))
+            records.append(tuple(to_value(name, values[name]) for name in fields))
+    return records
+
+def parse_json_rows(rows):
+    records, columns = [], None
+    for row in rows:
+        columns = columns or record_columns([column_name(name) for name in row])
+        values = {column_name(name): value for name, value in row.items()}
+        records.append(tuple(to_value(name, values[name]) for name in columns))
+    return columns, records
+
+#the fields of a record: the date, the text columns (e.g. the ticker of the scraper output), then the numbers
+def record_columns(columns):
+    texts = [name for name in columns if name in TEXT_COLUMNS]
+    return ['date'] + texts + [name for name in columns if name != 'date' and name not in TEXT_COLUMNS]
+
+#one json object per line, as written by the Screen_Scraper_ODSA.py scraper
+def is_json_lines(path):
+    with open(path, 'r') as f:
+        try:
+            row = json.loads(f.readline())
+        except ValueError:
+            return False
+    return isinstance(row, dict) and 'date' in [column_name(name) for name in row]
+
+def read_json_rows(path):
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if isinstance(data, str): #stock_hist.json holds the json text of the rows as one json string
+        data = json.loads(data)
+    return list(data.values()) if isinstance(data, dict) else data
+
+
+#---- the binary cache ----
+def cache_paths(path, cache_dir):
+    key = hashlib.sha1(os.path.abspath(path).encode('utf8')).hexdigest()[:12]
+    base = os.path.join(cache_dir or CACHE_FOLDER, '{}.{}'.format(os.path.basename(path), key))
+    return base + '.npy', base + '.meta.json'
+
+def check_hash(path, parsed_bytes):
+    with open(path, 'rb') as f:
+        f.seek(max(0, parsed_bytes - CHECK_BYTES))
+        return hashlib.sha1(f.read(min(parsed_bytes, CHECK_BYTES))).hexdigest()
+
+def make_dtype(columns):
+    return np.dtype([('date', np.int64)] + [(name, 'S{}'.format(TEXT_WIDTH) if name in TEXT_COLUMNS else np.float64)
+                                            for name in columns[1:]])
+
+#sort by (ticker, date), stable so rows of the same day keep the order of the source
+def sort_history(history):
+    keys = [history['date']] + [history[name] for name in TEXT_COLUMNS if name in history.dtype.names]
+    return history[np.lexsort(keys)]
+
+#parse the whole source file, returns the meta information of the cache and the records
+def parse_source(path):
+    size = os.path.getsize(path)
+    if path.lower().endswith('.json') and not is_json_lines(path):
+        columns, records = parse_json_rows(read_json_rows(path))
+        return {'format': 'json', 'columns': columns, 'parsed_bytes': size}, records
+    with open(path, 'rb') as f:
+        text = f.read()
+    end = text.rfind(b'\n') + 1 #only complete lines, a line still being written is parsed on the next refresh
+    lines = text[:end].decode('utf-8-sig').splitlines()
+    if path.lower().endswith('.json'):
+        columns, records = parse_json_rows(json.loads(line) for line in lines if line.strip())
+        meta = {'format': 'jsonl', 'columns': columns}
+    else:
+        header = next(csv.reader(lines[:1]))
+        records = parse_csv_lines(lines[1:], header)
+        meta = {'format': 'csv', 'header': header, 'columns': record_columns([column_name(name) for name in header])}
+    meta['parsed_bytes'] = end
+    return meta, records
+
+#parse only the lines appended since the last refresh
+def parse_appended(path, meta):
+    with open(path, 'rb') as f:
+        f.seek(meta['parsed_bytes'])
+        text = f.read()
+    end = text.rfind(b'\n') + 1
+    lines = text[:end].decode('utf8').splitlines()
+    if meta['format'] == 'csv':
+        records = parse_csv_lines(lines, meta['header'])
+    else:
+        records = parse_json_rows(json.loads(line) for line in lines if line.strip())[1]
+    return records, meta['parsed_bytes'] + end
+
+def write_cache(npy_path, meta_path, path, meta, history):
+    np.save(npy_path + '.tmp.npy', history)
+    os.replace(npy_path + '.tmp.npy', npy_path)
+    meta.update({'version': CACHE_VERSION, 'size': os.path.getsize(path), 'mtime': os.path.getmtime(path),
+                 'rows': len(history), 'check': check_hash(path, meta['parsed_bytes'])})
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f)
+
+#load the stock history of a csv/json source file as a read-only, memory-mapped structured array sorted by
+#(ticker, date), e.g. history['close'], history['date'], history['ticker'] - see date_range() & to_dataframe()
+def load_stock_history(path, cache_dir=None):
+    npy_path, meta_path = cache_paths(path, cache_dir)
+    meta = None
+    if os.path.exists(npy_path) and os.path.exists(meta_path):
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        if meta.get('version') != CACHE_VERSION:
+            meta = None
+    size, mtime = os.path.getsize(path), os.path.getmtime(path)
+    if meta is not None and (meta['size'], meta['mtime']) == (size, mtime):
+        return np.load(npy_path, mmap_mode='r') #unchanged source: zero-copy load
+    if (meta is not None and meta['format'] in ('csv', 'jsonl') and size > meta['parsed_bytes']
+            and check_hash(path, meta['parsed_bytes']) == meta['check']):
+        print('Refreshing cache {} with the rows appended to {}'.format(npy_path, path))
+        records, meta['parsed_bytes'] = parse_appended(path, meta)
+        new_rows = np.array(records, dtype=make_dtype(meta['columns']))
+        history = np.concatenate([np.load(npy_path), new_rows]) #only the new rows are parsed
+    else:
+        print('Converting {} to the binary cache {}'.format(path, npy_path))
+        meta, records = parse_source(path)
+        history = np.array(records, dtype=make_dtype(meta['columns']))
+    history = sort_history(history)
+    write_cache(npy_path, meta_path, path, meta, history)
+    return np.load(npy_path, mmap_mode='r')
+
+#rows of one ticker from start up to (excluding) end - dates or date strings - as a view of the memory-mapped history.
+#Without a ticker a multi-ticker history is filtered with a full scan, the result is still sorted by (ticker, date)
+def date_range(history, start=None, end=None, ticker=None):
+    if ticker is not None:
+        tickers = history['ticker']
+        history = history[np.searchsorted(tickers, to_text(ticker), side='left'):
+                          np.searchsorted(tickers, to_text(ticker), side='right')]
+    elif 'ticker' in history.dtype.names and len(history) and history['ticker'][0] != history['ticker'][-1]:
+        dates = history['date']
+        keep = np.ones(len(history), dtype=bool)
+        if start is not None:
+            keep &= dates >= to_epoch(start)
+        if end is not None:
+            keep &= dates < to_epoch(end)
+        return history[keep]
+    dates = history['date']
+    first = 0 if start is None else np.searchsorted(dates, to_epoch(start), side='left')
+    last = len(history) if end is None else np.searchsorted(dates, to_epoch(end), side='left')
+    return history[first:last]
+
+def to_dataframe(history):
+    import pandas as pd
+    data = pd.DataFrame({name: history[name].astype(str) if name in TEXT_COLUMNS else history[name]
+                         for name in history.dtype.names if name != 'date'},
+                        index=pd.to_datetime(history['date'], unit='s'))
+    data.index.name = 'date'
+    return data
+
+
+if __name__ == '__main__':
+    #e.g. python Stock_Data_Cache_ODSA.py C:\Python\Data\SPY.csv 2008-01-01 2009-01-01
+    #     python Stock_Data_Cache_ODSA.py C:\Python\Data\stock_hist.csv 2008-01-01 2009-01-01 AAPL
+    import sys
+    path = sys.argv[1] if len(sys.argv) > 1 else r"C:\\Python\\Data\\SPY.csv"
+    history = load_stock_history(path)
+    print('{} trading days, columns: {}'.format(len(history), history.dtype.names))
+    print(date_range(history, *sys.argv[2:5])[:5])
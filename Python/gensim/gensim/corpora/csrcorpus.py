@@ -0,0 +1,375 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Corpus stored as a binary, memory-mapped sparse CSR matrix (documents as rows).
+
+Unlike :class:`~gensim.corpora.mmcorpus.MmCorpus`, nothing is parsed when reading: the `indptr`, `indices` and
+`data` arrays of the matrix are memory-mapped straight from a single file, so that
+
+* random access to any document is :math:`{O}(1)`, without a separate index file,
+* slices of the corpus are views of the same arrays, without copying any data,
+* the corpus can be streamed as `scipy.sparse` blocks of documents, see
+  :meth:`~gensim.corpora.csrcorpus.CsrCorpus.iter_chunks`.
+
+.. sourcecode:: pycon
+
+    >>> from gensim.corpora import CsrCorpus, MmCorpus
+    >>> from gensim.test.utils import datapath, get_tmpfile
+    >>>
+    >>> fname = get_tmpfile("corpus.csr")
+    >>> CsrCorpus.serialize(fname, MmCorpus(datapath('testcorpus.mm')))
+    >>> corpus = CsrCorpus(fname)
+    >>> corpus[3]
+    [(1, 1.0), (5, 2.0), (8, 1.0)]
+    >>> len(corpus[2:5])
+    3
+    >>> for block in corpus.iter_chunks(chunksize=4):  # scipy.sparse.csr_matrix of up to 4 documents
+    ...     pass
+
+"""
+
+from __future__ import with_statement
+
+import logging
+import os
+import shutil
+import struct
+import tempfile
+
+import numpy as np
+import scipy.sparse
+import six
+
+from gensim import interfaces, utils
+
+logger = logging.getLogger(__name__)
+
+CSR_FORMAT_MAGIC = b'GENSMCSR'
+CSR_FORMAT_VERSION = 1
+# magic, version, num_docs, num_terms, num_nnz, dtype of indices, dtype of data
+CSR_FORMAT_HEADER = struct.Struct('<8sQQQQ8s8s')
+CSR_FORMAT_ALIGN = 64
+
+
+def _aligned(offset):
+    """Round `offset` up to the next multiple of `CSR_FORMAT_ALIGN` bytes."""
+    return -(-offset // CSR_FORMAT_ALIGN) * CSR_FORMAT_ALIGN
+
+
+def _section_offsets(num_docs, num_nnz, indices_dtype):
+    """Get the byte offsets of the `indptr`, `indices` and `data` sections of a file."""
+    indptr_offset = _aligned(CSR_FORMAT_HEADER.size)
+    indices_offset = _aligned(indptr_offset + (num_docs + 1) * 8)
+    data_offset = _aligned(indices_offset + num_nnz * np.dtype(indices_dtype).itemsize)
+    return indptr_offset, indices_offset, data_offset
+
+
+class CsrCorpus(interfaces.CorpusABC):
+    """Corpus serialized as a binary, memory-mapped CSR matrix with documents as rows.
+
+    Attributes
+    ----------
+    num_docs : int
+        Number of documents in the corpus (or in this slice of it).
+    num_terms : int
+        Number of features (terms, topics).
+    num_nnz : int
+        Number of non-zero elements in the corpus (or in this slice of it).
+    indptr : numpy.ndarray
+        Offsets of the documents in `indices` and `data`, `int64` with `num_docs + 1` elements (whole file).
+    indices : numpy.ndarray
+        Feature ids, `int32` (or `int64` for more than 2**31 features).
+    data : numpy.ndarray
+        Feature weights.
+
+    Notes
+    -----
+    Slicing the corpus (`corpus[2:10]`, `corpus[[1, 5, 7]]`) returns another
+    :class:`~gensim.corpora.csrcorpus.CsrCorpus` over the same memory-mapped arrays,
+    only the document offsets are sliced.
+
+    """
+    def __init__(self, fname, mmap='r'):
+        """
+
+        Parameters
+        ----------
+        fname : str
+            Path to a file written by :meth:`~gensim.corpora.csrcorpus.CsrCorpus.serialize`.
+        mmap : {'r', 'r+', 'c', None}, optional
+            Memory-map the arrays in this mode, or read them all into RAM if None.
+
+        """
+        self.fname = fname
+        self.mmap = mmap
+        self._open()
+        self.starts, self.ends = self.indptr[:-1], self.indptr[1:]
+        self._whole = True  # all documents of the file, in order
+
+    def _open(self):
+        """Read the header of `self.fname` and map its arrays."""
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.data = np.zeros(0, dtype=np.float32)
+        self.num_terms, self._num_nnz = 0, 0
+        if not os.path.getsize(self.fname):
+            return  # empty file = empty corpus
+
+        with utils.smart_open(self.fname, 'rb') as fin:
+            magic, version, num_docs, num_terms, num_nnz, indices_dtype, data_dtype = CSR_FORMAT_HEADER.unpack(
+                fin.read(CSR_FORMAT_HEADER.size))
+        if magic != CSR_FORMAT_MAGIC:
+            raise ValueError("%s is not a CsrCorpus file" % self.fname)
+        if version > CSR_FORMAT_VERSION:
+            raise ValueError("unsupported CsrCorpus format version %i in %s" % (version, self.fname))
+        indices_dtype = indices_dtype.rstrip(b'\0').decode('ascii')
+        data_dtype = data_dtype.rstrip(b'\0').decode('ascii')
+        self.num_terms, self._num_nnz = num_terms, num_nnz
+
+        sections = zip(
+            ['indptr', 'indices', 'data'], _section_offsets(num_docs, num_nnz, indices_dtype),
+            ['<i8', indices_dtype, data_dtype], [num_docs + 1, num_nnz, num_nnz]
+        )
+        for name, offset, dtype, length in sections:
+            if not length:
+                array = np.zeros(0, dtype=dtype)
+            elif self.mmap is None:
+                with utils.smart_open(self.fname, 'rb') as fin:
+                    fin.seek(offset)
+                    array = np.fromfile(fin, dtype=dtype, count=length)
+            else:
+                array = np.memmap(self.fname, dtype=dtype, mode=self.mmap, offset=offset, shape=(length,))
+            setattr(self, name, array)
+
+    def __getstate__(self):
+        """Don't pickle the arrays, map them again from `fname` after unpickling."""
+        state = self.__dict__.copy()
+        for name in ('indptr', 'indices', 'data'):
+            state.pop(name, None)
+        if self._whole:
+            del state['starts'], state['ends']  # re-created from `indptr`
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
+        if self._whole:
+            self.starts, self.ends = self.indptr[:-1], self.indptr[1:]
+
+    @property
+    def num_docs(self):
+        return len(self.starts)
+
+    @property
+    def num_nnz(self):
+        if self._whole:
+            return self._num_nnz
+        return int(np.sum(self.ends - self.starts))
+
+    def __len__(self):
+        """Get the number of documents."""
+        return len(self.starts)
+
+    def _slice(self, starts, ends):
+        """Get a corpus of the documents with the given offsets, sharing the arrays of this one."""
+        sliced = object.__new__(self.__class__)
+        sliced.__dict__.update(self.__dict__)
+        sliced.starts, sliced.ends = starts, ends
+        sliced._whole = False
+        return sliced
+
+    def __getitem__(self, docno):
+        """Get a document, or a corpus of several documents.
+
+        Parameters
+        ----------
+        docno : {int, slice, list of int, numpy.ndarray}
+            Document number(s).
+
+        Returns
+        -------
+        list of (int, float)
+            If `docno` is int - the document in BoW format.
+        :class:`~gensim.corpora.csrcorpus.CsrCorpus`
+            Otherwise - the selected documents, as a corpus sharing the memory-mapped arrays of this one.
+
+        """
+        if isinstance(docno, six.integer_types + (np.integer,)):
+            start, end = self.starts[docno], self.ends[docno]
+            return list(zip(self.indices[start:end].tolist(), self.data[start:end].tolist()))
+        if isinstance(docno, slice):
+            return self._slice(self.starts[docno], self.ends[docno])
+        if isinstance(docno, (list, np.ndarray)):
+            docno = np.asarray(docno, dtype=np.int64)
+            return self._slice(self.starts[docno], self.ends[docno])
+        raise ValueError('Unrecognised value for docno, use either a single integer, a slice or a numpy.ndarray')
+
+    def __iter__(self):
+        """Iterate over the documents.
+
+        Yields
+        ------
+        list of (int, float)
+            Document in BoW format.
+
+        """
+        for block_no in range(0, len(self), 10000):
+            # convert the offsets & values of many documents at once, numpy scalars are slow
+            starts = self.starts[block_no:block_no + 10000].tolist()
+            ends = self.ends[block_no:block_no + 10000].tolist()
+            first, last = min(starts or [0]), max(ends or [0])
+            if ends and last - first <= 4 * sum(end - start for start, end in zip(starts, ends)):
+                indices, data = self.indices[first:last].tolist(), self.data[first:last].tolist()
+                for start, end in zip(starts, ends):
+                    yield list(zip(indices[start - first:end - first], data[start - first:end - first]))
+            else:  # scattered documents, e.g. from fancy indexing
+                for start, end in zip(starts, ends):
+                    yield list(zip(self.indices[start:end].tolist(), self.data[start:end].tolist()))
+
+    def iter_chunks(self, chunksize=256):
+        """Iterate over the corpus in blocks of documents, as sparse matrices.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of documents per block.
+
+        Yields
+        ------
+        scipy.sparse.csr_matrix
+            Block of `chunksize` documents (the last one may be shorter) x `num_terms` features.
+            Use its transposition `block.T` for the gensim layout (a `csc_matrix` of features x documents),
+            as accepted e.g. by :meth:`~gensim.models.lsimodel.LsiModel.add_documents`.
+
+        """
+        for chunk_start in range(0, len(self), chunksize):
+            yield self.csr_matrix(chunk_start, chunk_start + chunksize)
+
+    def csr_matrix(self, start=None, stop=None):
+        """Get a range of documents as a sparse matrix.
+
+        Parameters
+        ----------
+        start : int, optional
+            First document, default from the start.
+        stop : int, optional
+            Document to stop before, default up to the end.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Documents x `num_terms` features. For documents stored contiguously (which is the case unless the corpus
+            was re-ordered by fancy indexing), `indices` and `data` of the matrix are views of the memory-mapped arrays.
+
+        """
+        starts, ends = self.starts[start:stop], self.ends[start:stop]
+        if not len(starts):
+            return scipy.sparse.csr_matrix((0, self.num_terms), dtype=self.data.dtype)
+        first = starts[0]
+        if np.array_equal(starts[1:], ends[:-1]):  # contiguous documents
+            indptr = np.append(starts, ends[-1]) - first
+            indices, data = self.indices[first:ends[-1]], self.data[first:ends[-1]]
+        else:
+            lengths = ends - starts
+            indptr = np.concatenate([[0], np.cumsum(lengths)])
+            positions = np.repeat(starts - indptr[:-1], lengths) + np.arange(indptr[-1])
+            indices, data = self.indices[positions], self.data[positions]
+        return scipy.sparse.csr_matrix((data, indices, indptr), shape=(len(starts), self.num_terms), copy=False)
+
+    @staticmethod
+    def save_corpus(fname, corpus, id2word=None, progress_cnt=10000, metadata=False, dtype=np.float32):
+        """Save a corpus in the binary CSR format.
+
+        The corpus is streamed, only the document offsets (8 bytes per document) are kept in RAM.
+
+        Parameters
+        ----------
+        fname : str
+            Path to output file.
+        corpus : iterable of list of (int, number)
+            Corpus in BoW format.
+        id2word : dict of (int, str), optional
+            Mapping id -> word, used to determine the number of features. Otherwise the highest feature id
+            in `corpus` + 1 is used.
+        progress_cnt : int, optional
+            Log progress every `progress_cnt` documents.
+        metadata : bool, optional
+            Not supported, must be False.
+        dtype : numpy.dtype, optional
+            Data type of the stored weights.
+
+        Raises
+        ------
+        ValueError
+            If `metadata` is set.
+
+        """
+        if metadata:
+            raise ValueError("CsrCorpus does not store document metadata")
+        logger.info("storing corpus in binary CSR format to %s", fname)
+        data_dtype = np.dtype(dtype).newbyteorder('<')
+        indptr, num_nnz, max_id = [0], 0, -1
+        tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(fname)))
+        try:
+            indices_fname, data_fname = os.path.join(tmp_dir, 'indices'), os.path.join(tmp_dir, 'data')
+            with open(indices_fname, 'wb') as indices_out, open(data_fname, 'wb') as data_out:
+                for docno, doc in enumerate(corpus):
+                    if progress_cnt and docno % progress_cnt == 0:
+                        logger.info("PROGRESS: saving document #%i", docno)
+                    if len(doc):
+                        ids, weights = zip(*doc)
+                        indices_out.write(np.asarray(ids, dtype='<i8').tostring())
+                        data_out.write(np.asarray(weights, dtype=data_dtype).tostring())
+                        max_id = max(max_id, max(ids))
+                    num_nnz += len(doc)
+                    indptr.append(num_nnz)
+
+            num_terms = len(id2word) if id2word is not None else max_id + 1
+            num_terms = max(num_terms, max_id + 1)
+            indices_dtype = np.dtype('<i4') if num_terms < 2 ** 31 else np.dtype('<i8')
+            num_docs = len(indptr) - 1
+            offsets = _section_offsets(num_docs, num_nnz, indices_dtype)
+
+            with utils.smart_open(fname, 'wb') as fout:
+                fout.write(CSR_FORMAT_HEADER.pack(
+                    CSR_FORMAT_MAGIC, CSR_FORMAT_VERSION, num_docs, num_terms, num_nnz,
+                    indices_dtype.str.encode('ascii'), data_dtype.str.encode('ascii')))
+                fout.write(b'\0' * (offsets[0] - CSR_FORMAT_HEADER.size))
+                fout.write(np.asarray(indptr, dtype='<i8').tostring())
+                fout.write(b'\0' * (offsets[1] - offsets[0] - 8 * len(indptr)))
+                # ids were buffered as int64, because the number of features is only known at the end
+                with open(indices_fname, 'rb') as indices_in:
+                    for block in iter(lambda: indices_in.read(8 * 2 ** 20), b''):
+                        fout.write(np.frombuffer(block, dtype='<i8').astype(indices_dtype).tostring())
+                fout.write(b'\0' * (offsets[2] - offsets[1] - num_nnz * indices_dtype.itemsize))
+                with open(data_fname, 'rb') as data_in:
+                    shutil.copyfileobj(data_in, fout)
+        finally:
+            shutil.rmtree(tmp_dir)
+        logger.info("saved %ix%i CSR matrix with %i non-zero entries to %s", num_docs, num_terms, num_nnz, fname)
+
+    @classmethod
+    def serialize(serializer, fname, corpus, id2word=None, progress_cnt=10000, metadata=False, dtype=np.float32):
+        """Serialize `corpus` in the binary CSR format, load it back with `CsrCorpus(fname)`.
+
+        Parameters
+        ----------
+        fname : str
+            Path to output file.
+        corpus : iterable of list of (int, number)
+            Corpus in BoW format.
+        id2word : dict of (int, str), optional
+            Mapping id -> word, used to determine the number of features.
+        progress_cnt : int, optional
+            Log progress every `progress_cnt` documents.
+        metadata : bool, optional
+            Not supported, must be False.
+        dtype : numpy.dtype, optional
+            Data type of the stored weights.
+
+        """
+        if getattr(corpus, 'fname', None) == fname:
+            raise ValueError("identical input vs. output corpus filename, refusing to serialize: %s" % fname)
+        serializer.save_corpus(fname, corpus, id2word, progress_cnt=progress_cnt, metadata=metadata, dtype=dtype)
@@ -6,9 +6,18 @@
 
 """Corpus in the `Matrix Market format <https://math.nist.gov/MatrixMarket/formats.html>`_."""
 
+import itertools
 import logging
+import multiprocessing
+import os
+from collections import deque
 
-from gensim import matutils
+import numpy as np
+import scipy.sparse
+from six import string_types
+from six.moves import range
+
+from gensim import interfaces, matutils
 from gensim.corpora import IndexedCorpus
 
 
@@ -124,3 +133,244 @@ class MmCorpus(matutils.MmReader, IndexedCorpus):
         return matutils.MmWriter.write_corpus(
             fname, corpus, num_terms=num_terms, index=True, progress_cnt=progress_cnt, metadata=metadata
         )
+
+
+def _parse_mm_range(fname, start, end, transposed=True):
+    """Parse the lines in the byte range [`start`, `end`) of a Matrix Market file, in a worker process.
+
+    Parameters
+    ----------
+    fname : str
+        Path to an uncompressed file in MM format.
+    start : int
+        Byte offset of the first line.
+    end : int
+        Byte offset after the last line.
+    transposed : bool, optional
+        Do lines represent `doc_id, term_id, value`, instead of `term_id, doc_id, value`?
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        0-based document ids, 0-based term ids and values of the entries, as arrays so they are cheap to send back
+        to the parent process.
+
+    Raises
+    ------
+    ValueError
+        If a line doesn't consist of exactly three numbers.
+
+    """
+    with open(fname, 'rb') as fin:
+        fin.seek(start)
+        text = fin.read(end - start)
+    num_lines = text.count(b'\n') + (not text.endswith(b'\n') and bool(text.strip()))
+    entries = np.fromstring(text, dtype=np.float64, sep=' ')
+    if len(entries) != 3 * num_lines:
+        raise ValueError("unable to parse lines at bytes %i-%i of %s" % (start, end, fname))
+    entries = entries.reshape(-1, 3)
+    docids, termids = entries[:, 0].astype(np.int64) - 1, entries[:, 1].astype(np.int64) - 1
+    if not transposed:
+        termids, docids = docids, termids
+    return docids, termids, np.ascontiguousarray(entries[:, 2])
+
+
+class ParallelMmReader(interfaces.CorpusABC):
+    """Read a corpus in the Matrix Market format using several processes.
+
+    The file is split into byte ranges aligned to document boundaries, the ranges are parsed in a pool of worker
+    processes, and the documents are yielded in their original order. Up to `prefetch` ranges are parsed ahead
+    of the consumer, so parsing overlaps with whatever the consumer (e.g. model training) does with the documents.
+
+    Attributes
+    ----------
+    num_docs : int
+        Number of documents in the market matrix file.
+    num_terms : int
+        Number of features (terms, topics).
+    num_nnz : int
+        Number of non-zero elements in the sparse MM matrix.
+
+    Notes
+    -----
+    Only uncompressed files on disk can be split into byte ranges. Compressed files (and file-like objects)
+    are read sequentially by :class:`~gensim.matutils.MmReader` instead.
+
+    Example
+    -------
+    .. sourcecode:: pycon
+
+        >>> from gensim.corpora.mmcorpus import ParallelMmReader
+        >>> from gensim.models import TfidfModel
+        >>> from gensim.test.utils import datapath
+        >>>
+        >>> corpus = ParallelMmReader(datapath('test_mmcorpus_with_index.mm'), workers=2)
+        >>> tfidf = TfidfModel(corpus)
+
+    """
+    def __init__(self, fname, workers=None, chunk_bytes=16 * 1024 ** 2, prefetch=None, transposed=True):
+        """
+
+        Parameters
+        ----------
+        fname : {str, file-like object}
+            Path to file in MM format.
+        workers : int, optional
+            Number of worker processes, defaults to the number of CPUs - 1.
+        chunk_bytes : int, optional
+            Approximate size of one byte range, in bytes.
+        prefetch : int, optional
+            Number of byte ranges parsed ahead of the consumer, defaults to 2 * `workers`.
+        transposed : bool, optional
+            Do lines represent `doc_id, term_id, value`, instead of `term_id, doc_id, value`?
+
+        """
+        reader = matutils.MmReader(fname, transposed)
+        self.num_docs, self.num_terms, self.num_nnz = reader.num_docs, reader.num_terms, reader.num_nnz
+        self.input, self.transposed = fname, transposed
+        self.workers = workers or max(1, multiprocessing.cpu_count() - 1)
+        self.chunk_bytes = chunk_bytes
+        self.prefetch = prefetch or 2 * self.workers
+
+    def __len__(self):
+        return self.num_docs
+
+    def __str__(self):
+        return ("ParallelMmReader(%i documents, %i features, %i non-zero entries)" %
+                (self.num_docs, self.num_terms, self.num_nnz))
+
+    def is_splittable(self):
+        """Can the input be split into byte ranges (is it an uncompressed file on disk)?"""
+        return isinstance(self.input, string_types) and not self.input.endswith(('.gz', '.bz2'))
+
+    def _docid(self, line):
+        """Get the 0-based document id of a line."""
+        return int(line.split()[0 if self.transposed else 1]) - 1
+
+    def byte_ranges(self):
+        """Split the entries of the file into byte ranges aligned to document boundaries.
+
+        Returns
+        -------
+        list of (int, int)
+            Start and end byte offsets of the ranges. The lines of any single document all lie in one range.
+
+        """
+        with open(self.input, 'rb') as fin:
+            fin.readline()  # the %%MatrixMarket header
+            for line in iter(fin.readline, b''):
+                if not line.startswith(b'%'):
+                    break  # the line with the matrix dimensions
+            data_start, file_size = fin.tell(), os.fstat(fin.fileno()).st_size
+
+            boundaries = {data_start, file_size}
+            for offset in range(data_start + self.chunk_bytes, file_size, self.chunk_bytes):
+                # move to the first line starting at or after `offset`, then past the end of its document
+                fin.seek(offset - 1)
+                fin.readline()
+                line = fin.readline()
+                docid = self._docid(line) if line.strip() else None
+                boundary = fin.tell()
+                for line in iter(fin.readline, b''):
+                    if not line.strip() or self._docid(line) != docid:
+                        break
+                    boundary = fin.tell()
+                boundaries.add(min(boundary, file_size))
+        boundaries = sorted(boundaries)
+        return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+    def _iter_ranges(self):
+        """Parse the byte ranges in the worker processes, keeping up to `self.prefetch` ranges in flight.
+
+        Yields
+        ------
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            Document ids, term ids and values of the entries of each range, in file order.
+
+        """
+        ranges = iter(self.byte_ranges())
+        pool = multiprocessing.Pool(self.workers)
+        try:
+            pending = deque(
+                pool.apply_async(_parse_mm_range, (self.input, start, end, self.transposed))
+                for start, end in itertools.islice(ranges, self.prefetch)
+            )
+            last_docid = -1
+            while pending:
+                docids, termids, values = pending.popleft().get()
+                for start, end in itertools.islice(ranges, 1):
+                    pending.append(pool.apply_async(_parse_mm_range, (self.input, start, end, self.transposed)))
+                if len(docids):
+                    if docids[0] <= last_docid or np.any(np.diff(docids) < 0):
+                        raise ValueError("matrix columns must come in ascending order")
+                    last_docid = docids[-1]
+                yield docids, termids, values
+        finally:
+            pool.terminate()
+
+    def __iter__(self):
+        """Iterate through all documents.
+
+        Yields
+        ------
+        list of (int, float)
+            Document in the `sparse Gensim bag-of-words format <intro.rst#core-concepts>`__. As with
+            :class:`~gensim.corpora.mmcorpus.MmCorpus`, empty documents are yielded where appropriate, so that
+            the number of documents is always equal to the number of rows specified in the header.
+
+        """
+        if not self.is_splittable():
+            logger.warning("cannot split %s into byte ranges, reading it sequentially", self.input)
+            for _, doc in matutils.MmReader(self.input, self.transposed):
+                yield doc
+            return
+
+        next_docid = 0
+        for docids, termids, values in self._iter_ranges():
+            # convert all entries of the range at once, numpy scalars are slow
+            splits = np.flatnonzero(np.diff(docids)) + 1
+            starts, ends = np.r_[0, splits].tolist(), np.r_[splits, len(docids)].tolist()
+            entries = list(zip(termids.tolist(), values.tolist()))
+            for docid, start, end in zip(docids[starts].tolist() if len(docids) else [], starts, ends):
+                for _ in range(next_docid, docid):
+                    yield []  # empty documents are not stored explicitly
+                yield entries[start:end]
+                next_docid = docid + 1
+        for _ in range(next_docid, self.num_docs):
+            yield []
+
+    def iter_blocks(self, dtype=np.float64):
+        """Iterate through the corpus in blocks of consecutive documents, one block per byte range.
+
+        The blocks are built straight from the parsed arrays, without creating a Python object per entry,
+        which is a lot cheaper than iterating over the documents when the consumer works with sparse matrices.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype, optional
+            Data type of the blocks.
+
+        Yields
+        ------
+        (int, scipy.sparse.csc_matrix)
+            Id of the first document of the block and the block itself, `num_terms` x documents. Together
+            the blocks cover all `num_docs` documents, empty documents are empty columns.
+
+        """
+        if not self.is_splittable():
+            raise ValueError("cannot split %s into byte ranges" % self.input)
+
+        ranges = self._iter_ranges()
+        parsed = next(ranges, None)
+        first_docid = 0
+        while parsed is not None:
+            docids, termids, values = parsed
+            parsed = next(ranges, None)
+            # the last block also covers the trailing empty documents
+            end_docid = docids[-1] + 1 if parsed is not None and len(docids) else self.num_docs
+            indptr = np.searchsorted(docids, np.arange(first_docid, end_docid + 1))
+            block = scipy.sparse.csc_matrix(
+                (values.astype(dtype), termids, indptr), shape=(self.num_terms, end_docid - first_docid)
+            )
+            yield first_docid, block
+            first_docid = end_docid
@@ -24,7 +24,9 @@ import os
 import math
 import numpy
 import scipy.sparse as sparse
+import threading
 import time
+from collections import OrderedDict
 
 from six.moves import range
 
@@ -148,10 +150,27 @@ class ShardedCorpus(IndexedCorpus):
     currently open and on a `__getitem__` request, either returns an item from
     the current shard, or opens a new one. The shard size is constant, except
     for the last shard.
+
+    The last `cache_size` shards used stay in memory, so random mini-batch
+    access does not reload the same shards over and over. With `prefetch`
+    set, shard n+1 is loaded on a background thread while shard n is
+    consumed, so that sequential iteration does not stall at every shard
+    boundary. With `mmap_shards` set, the shards are stored as raw numpy
+    arrays and memory-mapped instead of unpickled. How well this works is
+    reported by `shard_stats()`:
+
+    .. sourcecode:: pycon
+
+        >>> corpus = ShardedCorpus(output_prefix, corpus, dim=1000, cache_size=4, prefetch=True)
+        >>> for doc in corpus:
+        ...     pass
+        >>> stats = corpus.shard_stats()  # hit_rate, stall_time, ...
+
     """
     def __init__(self, output_prefix, corpus, dim=None,
                  shardsize=4096, overwrite=False, sparse_serialization=False,
-                 sparse_retrieval=False, gensim=False):
+                 sparse_retrieval=False, gensim=False, cache_size=1, prefetch=False,
+                 mmap_shards=False):
         """Initializes the dataset. If `output_prefix` is not found,
         builds the shards.
 
@@ -222,6 +241,27 @@ class ShardedCorpus(IndexedCorpus):
             sparse vectors (list of tuples (id, value)) to make it behave like
             any other gensim corpus. This **will** slow the dataset down.
 
+        :type cache_size: int
+        :param cache_size: How many shards to keep in memory. The least
+            recently used shard is dropped when another one is loaded.
+
+        :type prefetch: bool
+        :param prefetch: If set, will load the next shard on a background
+            thread whenever a shard is opened.
+
+        :type mmap_shards: bool
+        :param mmap_shards: If set, will save the shards as raw numpy arrays
+            (sparse shards as their data, indices and indptr arrays in three
+            files) and memory-map them on load, instead of pickling them.
+            Retrieved dense rows are then read-only views into the mapped
+            files.
+
+            ..note::
+
+                Like `sparse_serialization`, this is a property of the data
+                on disk: when loading an already built dataset, the value it
+                was built with is used.
+
         """
         self.output_prefix = output_prefix
         self.shardsize = shardsize
@@ -238,11 +278,19 @@ class ShardedCorpus(IndexedCorpus):
         self.sparse_retrieval = sparse_retrieval
         self.gensim = gensim
 
+        # Shard storage, caching and prefetching.
+        self.mmap_shards = mmap_shards
+        self.cache_size = max(1, cache_size)
+        self.prefetch = prefetch
+
         # The "state" of the dataset.
         self.current_shard = None    # The current shard itself (numpy ndarray)
         self.current_shard_n = None  # Current shard is the current_shard_n-th
         self.current_offset = None   # The index into the dataset which
         # corresponds to index 0 of current shard
+        self._shard_cache = OrderedDict()  # shard no. -> shard, least recently used first
+        self._prefetching = None  # (shard no., thread, result dict) of the shard being prefetched
+        self.reset_shard_stats()
 
         logger.info('Initializing sharded corpus with prefix %s', output_prefix)
         if (not os.path.isfile(output_prefix)) or overwrite:
@@ -313,6 +361,8 @@ class ShardedCorpus(IndexedCorpus):
         self.n_shards = temp.n_shards
         self.n_docs = temp.n_docs
         self.offsets = temp.offsets
+        self.shardsize = temp.shardsize
+        self.mmap_shards = temp.mmap_shards
 
         if temp.dim != self.dim:
             if self.dim is None:
@@ -342,39 +392,142 @@ class ShardedCorpus(IndexedCorpus):
 
         if not filename:
             filename = self._shard_name(n)
-        gensim.utils.pickle(shard, filename)
+
+        if not self.mmap_shards:
+            gensim.utils.pickle(shard, filename)
+        elif self.sparse_serialization:
+            shard = sparse.csr_matrix(shard)
+            for name, array in zip(self._shard_files(filename), (shard.data, shard.indices, shard.indptr)):
+                with open(name, 'wb') as fout:
+                    numpy.save(fout, array)
+        else:
+            with open(filename, 'wb') as fout:
+                numpy.save(fout, numpy.asarray(shard))
 
         if new_shard:
             self.offsets.append(self.offsets[-1] + shard.shape[0])
             self.n_docs += shard.shape[0]
             self.n_shards += 1
 
+    def read_shard(self, n):
+        """
+        Read the n-th shard from disk (unpickle or memory-map it) and return
+        it, without touching the state of the dataset. Safe to call from
+        a background thread.
+
+        """
+        filename = self._shard_name(n)
+        if not os.path.isfile(filename):
+            raise ValueError('Attempting to load nonexistent shard no. {0}'.format(n))
+
+        if not self.mmap_shards:
+            return gensim.utils.unpickle(filename)
+        if self.sparse_serialization:
+            data, indices, indptr = [numpy.load(name, mmap_mode='r') for name in self._shard_files(filename)]
+            return sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, self.dim), copy=False)
+        return numpy.load(filename, mmap_mode='r')
+
     def load_shard(self, n):
         """
         Load (unpickle) the n-th shard as the "live" part of the dataset
-        into the Dataset object."""
+        into the Dataset object.
+
+        The shard is taken from the cache of recently used shards or from
+        the background prefetch if possible, and read from disk otherwise.
+        The time spent waiting for the shard is counted as stall time in
+        `shard_stats()`.
+
+        """
 
         # No-op if the shard is already open.
         if self.current_shard_n == n:
             return
 
-        filename = self._shard_name(n)
-        if not os.path.isfile(filename):
-            raise ValueError('Attempting to load nonexistent shard no. {0}'.format(n))
-        shard = gensim.utils.unpickle(filename)
+        start_time = time.time()
+        if n in self._shard_cache:
+            shard = self._shard_cache.pop(n)
+            self._shard_stats['hits'] += 1
+        elif self._prefetching is not None and self._prefetching[0] == n:
+            _, thread, result = self._prefetching
+            self._prefetching = None
+            thread.join()
+            if 'error' in result:
+                raise result['error']
+            shard = result['shard']
+            self._shard_stats['prefetch_hits'] += 1
+        else:
+            shard = self.read_shard(n)
+            self._shard_stats['misses'] += 1
+        self._shard_stats['stall_time'] += time.time() - start_time
+
+        # (Re-)insert as the most recently used shard.
+        self._shard_cache[n] = shard
+        while len(self._shard_cache) > self.cache_size:
+            self._shard_cache.popitem(last=False)
 
         self.current_shard = shard
         self.current_shard_n = n
         self.current_offset = self.offsets[n]
 
+        if self.prefetch:
+            self._start_prefetch(n + 1)
+
+    def _start_prefetch(self, n):
+        """Start reading the n-th shard on a background thread, unless it is
+        already in memory or another shard is still being prefetched."""
+        if n >= self.n_shards or n in self._shard_cache:
+            return
+        if self._prefetching is not None:
+            if self._prefetching[0] == n or self._prefetching[1].is_alive():
+                return
+
+        result = {}
+
+        def worker():
+            try:
+                result['shard'] = self.read_shard(n)
+            except Exception as e:
+                result['error'] = e
+
+        thread = threading.Thread(target=worker, name='ShardedCorpus-prefetch-%d' % n)
+        thread.daemon = True
+        thread.start()
+        self._prefetching = (n, thread, result)
+
     def reset(self):
         """
-        Reset to no shard at all. Used for saving.
+        Reset to no shard at all, dropping the cached shards and waiting
+        for any running prefetch to finish. Used for saving.
 
         """
         self.current_shard = None
         self.current_shard_n = None
         self.current_offset = None
+        self._shard_cache = OrderedDict()
+        if self._prefetching is not None:
+            self._prefetching[1].join()
+        self._prefetching = None
+
+    def reset_shard_stats(self):
+        """Zero the shard loading statistics reported by `shard_stats()`."""
+        self._shard_stats = {'hits': 0, 'prefetch_hits': 0, 'misses': 0, 'stall_time': 0.0}
+
+    def shard_stats(self):
+        """
+        Statistics of shard loading since the dataset was created or
+        `reset_shard_stats()` was called.
+
+        Returns a dict with the number of shard switches served from the
+        cache (`hits`), from the background prefetch (`prefetch_hits`) and
+        read synchronously from disk (`misses`), the fraction of switches
+        that did not have to read from disk (`hit_rate`), and the total time
+        in seconds spent waiting for shards (`stall_time`).
+
+        """
+        stats = dict(self._shard_stats)
+        n_loads = stats['hits'] + stats['prefetch_hits'] + stats['misses']
+        stats['hit_rate'] = float(stats['hits'] + stats['prefetch_hits']) / n_loads if n_loads else 0.0
+        return stats
 
     def shard_by_offset(self, offset):
         """
@@ -454,17 +607,21 @@ class ShardedCorpus(IndexedCorpus):
             except Exception:
                 # Clean up on unsuccessful resize.
                 for new_shard_name in new_shard_names:
-                    os.remove(new_shard_name)
+                    for name in self._shard_files(new_shard_name):
+                        if os.path.isfile(name):
+                            os.remove(name)
                 raise
 
             new_offsets.append(new_stop)
 
         # Move old shard files out, new ones in. Complicated due to possibility
-        # of exceptions.
+        # of exceptions. Drop the (possibly memory-mapped) old shards first.
+        self.reset()
         old_shard_names = [self._shard_name(n) for n in range(self.n_shards)]
         try:
             for old_shard_n, old_shard_name in enumerate(old_shard_names):
-                os.remove(old_shard_name)
+                for name in self._shard_files(old_shard_name):
+                    os.remove(name)
         except Exception as e:
             logger.error(
                 'Exception occurred during old shard no. %d removal: %s.\nAttempting to at least move new shards in.',
@@ -475,7 +632,9 @@ class ShardedCorpus(IndexedCorpus):
             # new guys in.
             try:
                 for shard_n, new_shard_name in enumerate(new_shard_names):
-                    os.rename(new_shard_name, self._shard_name(shard_n))
+                    for name, shard_name in zip(self._shard_files(new_shard_name),
+                                                self._shard_files(self._shard_name(shard_n))):
+                        os.rename(name, shard_name)
             # If something happens when we're in this stage, we're screwed.
             except Exception as e:
                 logger.exception(e)
@@ -498,6 +657,16 @@ class ShardedCorpus(IndexedCorpus):
         """
         return self.output_prefix + '.resize-temp.' + str(n)
 
+    def _shard_files(self, filename):
+        """
+        List the files making up the shard saved under `filename`: sparse
+        shards saved for memory-mapping keep their indices and indptr arrays
+        in two extra files next to the data array.
+        """
+        if self.mmap_shards and self.sparse_serialization:
+            return [filename, filename + '.indices', filename + '.indptr']
+        return [filename]
+
     def _guess_n_features(self, corpus):
         """Attempt to guess number of features in `corpus`."""
         n_features = None
@@ -768,7 +937,9 @@ class ShardedCorpus(IndexedCorpus):
         if len(args) == 0:
             args = (self.output_prefix,)
 
-        attrs_to_ignore = ['current_shard', 'current_shard_n', 'current_offset']
+        attrs_to_ignore = [
+            'current_shard', 'current_shard_n', 'current_offset', '_shard_cache', '_prefetching', '_shard_stats'
+        ]
         if 'ignore' in kwargs:
             attrs_to_ignore.extend(kwargs['ignore'])
         kwargs['ignore'] = frozenset(attrs_to_ignore)
@@ -777,9 +948,18 @@ class ShardedCorpus(IndexedCorpus):
     @classmethod
     def load(cls, fname, mmap=None):
         """
-        Load itself in clean state. `mmap` has no effect here.
-        """
-        return super(ShardedCorpus, cls).load(fname, mmap)
+        Load itself in clean state. `mmap` has no effect here: whether the
+        shards are memory-mapped is given by the `mmap_shards` attribute.
+        """
+        result = super(ShardedCorpus, cls).load(fname, mmap)
+        # Datasets saved before shard caching was added.
+        for attr, default in (('mmap_shards', False), ('cache_size', 1), ('prefetch', False)):
+            if not hasattr(result, attr):
+                setattr(result, attr, default)
+        result._prefetching = None
+        result.reset()
+        result.reset_shard_stats()
+        return result
 
     @staticmethod
     def save_corpus(fname, corpus, id2word=None, progress_cnt=1000, metadata=False, **kwargs):
@@ -18,6 +18,8 @@ from __future__ import with_statement
 
 import logging
 
+import scipy.sparse
+
 from gensim import utils, matutils
 from six.moves import range
 
@@ -164,7 +166,9 @@ class TransformedCorpus(CorpusABC):
     def __iter__(self):
         """Iterate over the corpus, applying the selected transformation.
 
-        If `chunksize` was set in the constructor, works in "batch-manner" (more efficient).
+        If `chunksize` was set in the constructor, works in "batch-manner" (more efficient). Transformations
+        that implement :meth:`~gensim.interfaces.TransformationABC.transform_batch` are then applied to whole chunks
+        as sparse matrices, see :meth:`~gensim.interfaces.TransformedCorpus.iter_batches`.
 
         Yields
         ------
@@ -172,7 +176,11 @@ class TransformedCorpus(CorpusABC):
             Documents in the sparse Gensim bag-of-words format.
 
         """
-        if self.chunksize:
+        if self.chunksize and _has_transform_batch(self.obj):
+            for batch in self.iter_batches():
+                for transformed in matutils.rows2corpus(batch):
+                    yield transformed
+        elif self.chunksize:
             for chunk in utils.grouper(self.corpus, self.chunksize):
                 for transformed in self.obj.__getitem__(chunk, chunksize=None):
                     yield transformed
@@ -208,6 +216,54 @@ class TransformedCorpus(CorpusABC):
         else:
             raise RuntimeError('Type {} does not support slicing.'.format(type(self.corpus)))
 
+    def iter_batches(self, chunksize=None):
+        """Iterate over the corpus in chunks, applying the transformation to each chunk as a whole.
+
+        If the underlying corpus is itself a :class:`~gensim.interfaces.TransformedCorpus` whose transformation
+        supports batches, the chunks are passed along as matrices, without converting them to bag-of-words
+        in between. A chained `lsi[tfidf[corpus]]` then runs as a few sparse and BLAS operations per chunk.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of documents in a chunk, defaults to the `chunksize` set in the constructor.
+
+        Yields
+        ------
+        {scipy.sparse.csr_matrix, numpy.ndarray}
+            Transformed chunk, documents as rows.
+
+        Raises
+        ------
+        ValueError
+            If neither `chunksize` nor the `chunksize` of the constructor is set.
+        NotImplementedError
+            If the transformation doesn't implement :meth:`~gensim.interfaces.TransformationABC.transform_batch`.
+
+        """
+        chunksize = chunksize or self.chunksize
+        if not chunksize:
+            raise ValueError("chunksize must be set to iterate over batches")
+
+        if isinstance(self.corpus, TransformedCorpus) and _has_transform_batch(self.corpus.obj):
+            batches = self.corpus.iter_batches(chunksize)
+        else:
+            batches = (matutils.corpus2csc(chunk).T for chunk in utils.grouper(self.corpus, chunksize))
+        for batch in batches:
+            if not scipy.sparse.issparse(batch):
+                batch = scipy.sparse.csr_matrix(batch)
+            yield self.obj.transform_batch(batch)
+
+
+def _has_transform_batch(obj):
+    """Does the transformation `obj` override :meth:`~gensim.interfaces.TransformationABC.transform_batch`?"""
+    method = getattr(type(obj), 'transform_batch', None)
+    if method is None:
+        return False
+    return getattr(method, '__func__', method) is not getattr(
+        TransformationABC.transform_batch, '__func__', TransformationABC.transform_batch
+    )
+
 
 class TransformationABC(utils.SaveLoad):
     """Transformation interface.
@@ -236,6 +292,27 @@ class TransformationABC(utils.SaveLoad):
         """
         raise NotImplementedError('cannot instantiate abstract base class')
 
+    def transform_batch(self, docs):
+        """Transform a batch of documents at once.
+
+        Transformations which can be expressed as a few matrix operations should implement this;
+        :class:`~gensim.interfaces.TransformedCorpus` then uses it automatically when `chunksize` is set.
+
+        Parameters
+        ----------
+        docs : scipy.sparse.csr_matrix
+            Documents as rows, features as columns. The number of columns is only an upper bound
+            of the feature ids in the batch and needn't match the number of features of the model.
+
+        Returns
+        -------
+        {scipy.sparse.csr_matrix, numpy.ndarray}
+            Transformed documents as rows. Near-zero entries of a dense result are dropped when converting
+            it back to bag-of-words, as by :func:`~gensim.matutils.full2sparse`.
+
+        """
+        raise NotImplementedError('transformation does not support batches')
+
     def _apply(self, corpus, chunksize=None, **kwargs):
         """Apply the transformation to a whole corpus and get the result as another corpus.
 
@@ -133,39 +133,80 @@ def corpus2csc(corpus, num_terms=None, dtype=np.float64, num_docs=None, num_nnz=
         logger.info("creating sparse matrix from corpus")
     if num_terms is not None and num_docs is not None and num_nnz is not None:
         # faster and much more memory-friendly version of creating the sparse csc
-        posnow, indptr = 0, [0]
+        posnow, indptr = 0, [np.zeros(1, dtype=np.int64)]
         indices = np.empty((num_nnz,), dtype=np.int32)  # HACK assume feature ids fit in 32bit integer
         data = np.empty((num_nnz,), dtype=dtype)
-        for docno, doc in enumerate(corpus):
-            if printprogress and docno % printprogress == 0:
-                logger.info("PROGRESS: at document #%i/%i", docno, num_docs)
-            posnext = posnow + len(doc)
-            indices[posnow: posnext] = [feature_id for feature_id, _ in doc]
-            data[posnow: posnext] = [feature_weight for _, feature_weight in doc]
-            indptr.append(posnext)
+        for docno, lengths, feature_ids, feature_weights in _iter_bow_arrays(corpus, printprogress, num_docs):
+            posnext = posnow + len(feature_ids)
+            indices[posnow: posnext] = feature_ids
+            data[posnow: posnext] = feature_weights
+            indptr.append(posnow + np.cumsum(lengths))
             posnow = posnext
         assert posnow == num_nnz, "mismatch between supplied and computed number of non-zeros"
+        indptr = np.concatenate(indptr)
         result = scipy.sparse.csc_matrix((data, indices, indptr), shape=(num_terms, num_docs), dtype=dtype)
     else:
         # slower version; determine the sparse matrix parameters during iteration
-        num_nnz, data, indices, indptr = 0, [], [], [0]
-        for docno, doc in enumerate(corpus):
-            if printprogress and docno % printprogress == 0:
-                logger.info("PROGRESS: at document #%i", docno)
-            indices.extend(feature_id for feature_id, _ in doc)
-            data.extend(feature_weight for _, feature_weight in doc)
-            num_nnz += len(doc)
-            indptr.append(num_nnz)
+        num_nnz, data, indices, indptr = 0, [], [], [np.zeros(1, dtype=np.int64)]
+        for docno, lengths, feature_ids, feature_weights in _iter_bow_arrays(corpus, printprogress):
+            indices.append(feature_ids.astype(np.int64))
+            data.append(feature_weights.astype(dtype))
+            indptr.append(num_nnz + np.cumsum(lengths))
+            num_nnz += len(feature_ids)
+        indices = np.concatenate(indices) if indices else np.empty((0,), dtype=np.int64)
+        data = np.concatenate(data) if data else np.empty((0,), dtype=dtype)
+        indptr = np.concatenate(indptr)
         if num_terms is None:
-            num_terms = max(indices) + 1 if indices else 0
+            num_terms = int(indices.max()) + 1 if len(indices) else 0
         num_docs = len(indptr) - 1
         # now num_docs, num_terms and num_nnz contain the correct values
-        data = np.asarray(data, dtype=dtype)
-        indices = np.asarray(indices)
         result = scipy.sparse.csc_matrix((data, indices, indptr), shape=(num_terms, num_docs), dtype=dtype)
     return result
 
 
+def _iter_bow_arrays(corpus, printprogress=0, num_docs=None, chunksize=10000):
+    """Flatten a streamed corpus into arrays, `chunksize` documents at a time.
+
+    The (id, weight) pairs of a whole chunk are unpacked into a single array with :func:`numpy.fromiter`,
+    without a Python-level loop over the individual entries.
+
+    Parameters
+    ----------
+    corpus : iterable of iterable of (int, number)
+        Input corpus in BoW format.
+    printprogress : int, optional
+        Log a progress message at INFO level once every `printprogress` documents. 0 to turn off progress logging.
+    num_docs : int, optional
+        Number of documents in `corpus`, only used in the progress messages.
+    chunksize : int, optional
+        Number of documents flattened at once.
+
+    Yields
+    ------
+    (int, numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        Position of the first document of the chunk, number of entries of each of its documents,
+        and the feature ids and feature weights of all its entries.
+
+    """
+    docno = 0
+    for chunk in utils.grouper(corpus, chunksize):
+        if printprogress:
+            # first multiple of `printprogress` within this chunk, if any
+            progress_docno = -(-docno // printprogress) * printprogress
+            if progress_docno < docno + len(chunk):
+                if num_docs is None:
+                    logger.info("PROGRESS: at document #%i", progress_docno)
+                else:
+                    logger.info("PROGRESS: at document #%i/%i", progress_docno, num_docs)
+        chunk = [doc if hasattr(doc, '__len__') else list(doc) for doc in chunk]
+        lengths = np.fromiter((len(doc) for doc in chunk), dtype=np.int64, count=len(chunk))
+        entries = np.fromiter(
+            chain.from_iterable(chain.from_iterable(chunk)), dtype=np.float64, count=2 * int(lengths.sum())
+        )
+        yield docno, lengths, entries[0::2].astype(np.int64), entries[1::2]
+        docno += len(chunk)
+
+
 def pad(mat, padrow, padcol):
     """Add additional rows/columns to `mat`. The new rows/columns will be initialized with zeros.
 
@@ -611,6 +652,101 @@ class Sparse2Corpus(object):
         return list(zip(self.sparse.indices[indprev:indnow], self.sparse.data[indprev:indnow]))
 
 
+def resize_columns(mat, num_columns):
+    """Crop or zero-pad a sparse matrix to `num_columns` columns.
+
+    Used to fit a batch of documents, whose width depends on the largest feature id in the batch,
+    to the number of features a model expects.
+
+    Parameters
+    ----------
+    mat : scipy.sparse.csr_matrix
+        Input matrix, documents as rows.
+    num_columns : int
+        Number of columns of the result.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Matrix with `num_columns` columns. Columns beyond `num_columns` (unknown features) are dropped.
+
+    """
+    mat = mat.tocsr()
+    if mat.shape[1] > num_columns:
+        return mat[:, :num_columns]
+    if mat.shape[1] < num_columns:
+        return scipy.sparse.csr_matrix((mat.data, mat.indices, mat.indptr), shape=(mat.shape[0], num_columns))
+    return mat
+
+
+def unitvec_rows(mat, norm='l2'):
+    """Scale each row of a matrix to unit length.
+
+    As opposed to :func:`~gensim.matutils.unitvec`, which treats its whole input as a single vector.
+
+    Parameters
+    ----------
+    mat : {numpy.ndarray, scipy.sparse.csr_matrix}
+        Input matrix, documents as rows. Floating point matrices are scaled in place.
+    norm : {'l1', 'l2'}, optional
+        Metric to normalize in.
+
+    Returns
+    -------
+    {numpy.ndarray, scipy.sparse.csr_matrix}
+        Matrix with normalized rows, in the same format as `mat`. Zero rows are left unchanged.
+
+    """
+    if norm not in ('l1', 'l2'):
+        raise ValueError("'%s' is not a supported norm. Currently supported norms are 'l1' and 'l2'." % norm)
+
+    if scipy.sparse.issparse(mat):
+        mat = mat.tocsr()
+        if np.issubdtype(mat.dtype, np.integer):
+            mat = mat.astype(np.float64)
+        row_lengths = np.diff(mat.indptr)
+        values = np.abs(mat.data) if norm == 'l1' else mat.data ** 2
+        lengths = np.bincount(np.repeat(np.arange(mat.shape[0]), row_lengths), weights=values, minlength=mat.shape[0])
+        if norm == 'l2':
+            lengths = np.sqrt(lengths)
+        lengths[lengths == 0.0] = 1.0
+        mat.data /= np.repeat(lengths, row_lengths).astype(mat.dtype)
+        return mat
+
+    mat = np.asarray(mat)
+    if np.issubdtype(mat.dtype, np.integer):
+        mat = mat.astype(np.float64)
+    lengths = np.abs(mat).sum(axis=1) if norm == 'l1' else np.sqrt((mat ** 2).sum(axis=1))
+    lengths[lengths == 0.0] = 1.0
+    mat /= lengths[:, np.newaxis].astype(mat.dtype)
+    return mat
+
+
+def rows2corpus(mat, eps=1e-9):
+    """Convert the rows of a matrix into documents in the BoW format.
+
+    Parameters
+    ----------
+    mat : {numpy.ndarray, scipy.sparse.csr_matrix}
+        Input matrix, documents as rows.
+    eps : float, optional
+        Drop entries of a dense `mat` with absolute value less than or equal to `eps`, as
+        :func:`~gensim.matutils.full2sparse` does. All stored entries of a sparse `mat` are kept.
+
+    Returns
+    -------
+    list of list of (int, float)
+        Documents in BoW format, with native Python numbers.
+
+    """
+    if not scipy.sparse.issparse(mat):
+        return [full2sparse(row, eps=eps) for row in np.asarray(mat)]
+    mat = mat.tocsr()
+    indptr = mat.indptr.tolist()
+    entries = list(zip(mat.indices.tolist(), mat.data.tolist()))
+    return [entries[start:end] for start, end in zip(indptr, indptr[1:])]
+
+
 def veclen(vec):
     """Calculate L2 (euclidean) length of a vector.
 
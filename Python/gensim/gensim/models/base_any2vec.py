@@ -933,7 +933,8 @@ class BaseWordEmbeddingsModel(BaseAny2VecModel):
 
         """
         total_words, corpus_count = self.vocabulary.scan_vocab(
-            sentences=sentences, corpus_file=corpus_file, progress_per=progress_per, trim_rule=trim_rule)
+            sentences=sentences, corpus_file=corpus_file, progress_per=progress_per, workers=self.workers,
+            trim_rule=trim_rule)
         self.corpus_count = corpus_count
         self.corpus_total_words = total_words
         report_values = self.vocabulary.prepare_vocab(
@@ -80,7 +80,7 @@ from numpy import zeros, float32 as REAL, empty, ones, \
 from gensim.utils import call_on_class_only
 from gensim import utils, matutils  # utility fnc for pickling, common scipy operations etc
 from gensim.models.word2vec import Word2VecKeyedVectors, Word2VecVocab, Word2VecTrainables, train_cbow_pair,\
-    train_sg_pair, train_batch_sg
+    train_sg_pair, train_batch_sg, _is_compressed
 from six.moves import range
 from six import string_types, integer_types, itervalues
 from gensim.models.base_any2vec import BaseWordEmbeddingsModel
@@ -1170,7 +1170,7 @@ class Doc2Vec(BaseWordEmbeddingsModel):
         """
         total_words, corpus_count = self.vocabulary.scan_vocab(
             documents=documents, corpus_file=corpus_file, docvecs=self.docvecs,
-            progress_per=progress_per, trim_rule=trim_rule
+            progress_per=progress_per, workers=self.workers, trim_rule=trim_rule
         )
         self.corpus_count = corpus_count
         self.corpus_total_words = total_words
@@ -1328,7 +1328,8 @@ class Doc2VecVocab(Word2VecVocab):
         self.raw_vocab = vocab
         return total_words, corpus_count
 
-    def scan_vocab(self, documents=None, corpus_file=None, docvecs=None, progress_per=10000, trim_rule=None):
+    def scan_vocab(self, documents=None, corpus_file=None, docvecs=None, progress_per=10000, workers=None,
+                   trim_rule=None):
         """Create the models Vocabulary: A mapping from unique words in the corpus to their frequency count.
 
         Parameters
@@ -1343,6 +1344,11 @@ class Doc2VecVocab(Word2VecVocab):
             The vector representations of the documents in our corpus. Each of them has a size == `vector_size`.
         progress_per : int
             Progress will be logged every `progress_per` documents.
+        workers : int, optional
+            Count the words in this many processes, see
+            :meth:`~gensim.models.word2vec.Word2VecVocab._scan_vocab_multiprocess`. Document tags are still
+            collected in the current process. The default, None, and 1 scan the corpus in the current process,
+            as does any `max_vocab_size`.
         trim_rule : function, optional
             Vocabulary trimming rule, specifies whether certain words should remain in the vocabulary,
             be trimmed away, or handled using the default (discard if word count < min_count).
@@ -1364,10 +1370,34 @@ class Doc2VecVocab(Word2VecVocab):
 
         """
         logger.info("collecting all words and their counts")
-        if corpus_file is not None:
-            documents = TaggedLineDocument(corpus_file)
-
-        total_words, corpus_count = self._scan_vocab(documents, docvecs, progress_per, trim_rule)
+        if workers and workers > 1 and not self.max_vocab_size and \
+                not (corpus_file is not None and _is_compressed(corpus_file)):
+            checked_string_types = []
+
+            def words_of(document):
+                if not checked_string_types:
+                    if isinstance(document.words, string_types):
+                        logger.warning(
+                            "Each 'words' should be a list of words (usually unicode strings). "
+                            "First 'words' here is instead plain %s.",
+                            type(document.words)
+                        )
+                    checked_string_types.append(True)
+                for tag in document.tags:
+                    _note_doctag(tag, len(document.words), docvecs)
+                return document.words
+
+            total_words, corpus_count = self._scan_vocab_multiprocess(
+                documents, corpus_file, workers, progress_per,
+                words_of=words_of, max_sentence_length=None
+            )
+            if corpus_file is not None and corpus_count:
+                # TaggedLineDocument tags each document with its line number
+                _note_doctag(corpus_count - 1, 0, docvecs)
+        else:
+            if corpus_file is not None:
+                documents = TaggedLineDocument(corpus_file)
+            total_words, corpus_count = self._scan_vocab(documents, docvecs, progress_per, trim_rule)
 
         logger.info(
             "collected %i word types and %i unique tags from a corpus of %i examples and %i words",
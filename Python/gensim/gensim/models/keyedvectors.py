@@ -85,6 +85,16 @@ in the original Google's word2vec C format as a KeyedVectors instance
     >>> wv_from_text = KeyedVectors.load_word2vec_format(datapath('word2vec_pre_kv_c'), binary=False)  # C text format
     >>> wv_from_bin = KeyedVectors.load_word2vec_format(datapath("euclidean_vectors.bin"), binary=True)  # C bin format
 
+For fast startup, store the vectors in the native memory-mappable format. Loading it only maps the file into memory:
+the vocabulary is looked up lazily straight from the mapped file, so many processes can share a single copy of the
+data in the OS page cache
+
+.. sourcecode:: pycon
+
+    >>> fname = get_tmpfile("vectors.kvmm")
+    >>> wv_from_bin.save_mmap_format(fname)
+    >>> wv_mmap = KeyedVectors.load_mmap_format(fname)
+
 What can I do with word vectors?
 ================================
 
@@ -158,7 +168,7 @@ and so on.
 
 from __future__ import division  # py3 "true division"
 
-from collections import deque
+from collections import deque, Mapping, Sequence
 from itertools import chain
 import logging
 
@@ -185,7 +195,8 @@ from six import string_types, integer_types
 from six.moves import zip, range
 from scipy import sparse, stats
 from gensim.utils import deprecated
-from gensim.models.utils_any2vec import _save_word2vec_format, _load_word2vec_format, _compute_ngrams, _ft_hash
+from gensim.models.utils_any2vec import _save_word2vec_format, _load_word2vec_format, _compute_ngrams, _ft_hash, \
+    _save_mmap_format, _load_mmap_format
 
 logger = logging.getLogger(__name__)
 
@@ -207,6 +218,109 @@ class Vocab(object):
         return "%s(%s)" % (self.__class__.__name__, ', '.join(vals))
 
 
+class MmapVocab(Mapping):
+    """Read-only, lazy `word => Vocab` mapping backed by the file saved with
+    :meth:`~gensim.models.keyedvectors.Word2VecKeyedVectors.save_mmap_format`.
+
+    Words are located by binary search over the sorted vocabulary block of the mapped file, so nothing has to be
+    parsed upfront. :class:`~gensim.models.keyedvectors.Vocab` objects are created on first access and cached.
+
+    Parameters
+    ----------
+    word_offsets : numpy.ndarray
+        Start offsets of each word in `word_bytes`, with an extra trailing end offset, in index order.
+    word_bytes : numpy.ndarray
+        Concatenated utf8-encoded words, as `uint8`.
+    sorted_ids : numpy.ndarray
+        Word indices, ordered by the utf8 encoding of their word.
+    counts : numpy.ndarray
+        Word counts, in index order. Negative values stand for unknown counts (`None`).
+
+    """
+    def __init__(self, word_offsets, word_bytes, sorted_ids, counts):
+        self.word_offsets = word_offsets
+        self.word_bytes = word_bytes
+        self.sorted_ids = sorted_ids
+        self.counts = counts
+        self.cache = {}
+        self._init_views()
+
+    def _init_views(self):
+        # memoryviews in native byte order: much faster to index from Python than numpy arrays
+        self._offsets = memoryview(np.asarray(self.word_offsets, dtype=np.uint64))
+        self._bytes = memoryview(np.asarray(self.word_bytes, dtype=np.uint8))
+        self._sorted_ids = memoryview(np.asarray(self.sorted_ids, dtype=np.uint64))
+
+    def __getstate__(self):
+        return {key: value for key, value in self.__dict__.items() if not key.startswith('_')}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_views()
+
+    def word_at(self, index, encoded=False):
+        """Get the word stored at position `index`, as unicode or as utf8 `bytes` if `encoded` is set."""
+        index = int(index)
+        word = self._bytes[self._offsets[index]:self._offsets[index + 1]].tobytes()
+        return word if encoded else word.decode('utf8')
+
+    def find(self, word):
+        """Get the index of `word`, or -1 if it is not in the vocabulary."""
+        key = utils.to_utf8(word)
+        lo, hi = 0, len(self._sorted_ids)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.word_at(self._sorted_ids[mid], encoded=True) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self._sorted_ids):
+            index = self._sorted_ids[lo]
+            if self.word_at(index, encoded=True) == key:
+                return index
+        return -1
+
+    def __getitem__(self, word):
+        try:
+            return self.cache[word]
+        except KeyError:
+            pass
+        index = self.find(word)
+        if index < 0:
+            raise KeyError(word)
+        count = int(self.counts[index])
+        result = self.cache[word] = Vocab(index=index, count=count if count >= 0 else None)
+        return result
+
+    def __contains__(self, word):
+        return word in self.cache or self.find(word) >= 0
+
+    def __len__(self):
+        return len(self.sorted_ids)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.word_at(index)
+
+
+class MmapIndex2Word(Sequence):
+    """Read-only, lazy `index => word` sequence backed by a :class:`~gensim.models.keyedvectors.MmapVocab`."""
+    def __init__(self, vocab):
+        self.vocab = vocab
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.vocab.word_at(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        return self.vocab.word_at(index)
+
+    def __len__(self):
+        return len(self.vocab)
+
+
 class BaseKeyedVectors(utils.SaveLoad):
     """Abstract base class / interface for various types of word vectors."""
     def __init__(self, vector_size):
@@ -511,14 +625,44 @@ class WordEmbeddingsKeyedVectors(BaseKeyedVectors):
         list of (str, float)
             Sequence of (word, similarity).
 
+        """
+        self.init_sims()
+        mean, all_words = self._query_vector(positive, negative)
+
+        if indexer is not None:
+            return indexer.most_similar(mean, topn)
+
+        limited = self.vectors_norm if restrict_vocab is None else self.vectors_norm[:restrict_vocab]
+        dists = dot(limited, mean)
+        if not topn:
+            return dists
+        best = matutils.argsort(dists, topn=topn + len(all_words), reverse=True)
+        # ignore (don't return) words from the input
+        result = [(self.index2word[sim], float(dists[sim])) for sim in best if sim not in all_words]
+        return result[:topn]
+
+    def _query_vector(self, positive=None, negative=None):
+        """Compute the unit-length weighted mean of `positive` and `negative` words or vectors,
+        helper for :meth:`~gensim.models.keyedvectors.WordEmbeddingsKeyedVectors.most_similar`.
+
+        Parameters
+        ----------
+        positive : list of (str or numpy.ndarray or (str or numpy.ndarray, float)), optional
+            Words or vectors that contribute positively, optionally with their weights.
+        negative : list of (str or numpy.ndarray or (str or numpy.ndarray, float)), optional
+            Words or vectors that contribute negatively, optionally with their weights.
+
+        Returns
+        -------
+        (numpy.ndarray, set of int)
+            The query vector and the indices of the input words.
+
         """
         if positive is None:
             positive = []
         if negative is None:
             negative = []
 
-        self.init_sims()
-
         if isinstance(positive, string_types) and not negative:
             # allow calls like most_similar('dog'), as a shorthand for most_similar(['dog'])
             positive = [positive]
@@ -544,19 +688,120 @@ class WordEmbeddingsKeyedVectors(BaseKeyedVectors):
                     all_words.add(self.vocab[word].index)
         if not mean:
             raise ValueError("cannot compute similarity with no input")
-        mean = matutils.unitvec(array(mean).mean(axis=0)).astype(REAL)
+        return matutils.unitvec(array(mean).mean(axis=0)).astype(REAL), all_words
 
-        if indexer is not None:
-            return indexer.most_similar(mean, topn)
+    def most_similar_batch(self, queries, topn=10, restrict_vocab=None, block_size=256):
+        """Find the top-N most similar words for many queries at once.
+
+        Gives the same results as calling :meth:`~gensim.models.keyedvectors.WordEmbeddingsKeyedVectors.most_similar`
+        for each query, but scores blocks of queries with a single matrix-matrix product and selects the top-N
+        of each row with :func:`numpy.argpartition`, which is much faster for large numbers of queries.
+
+        Parameters
+        ----------
+        queries : iterable or numpy.ndarray
+            Each query is either a single word, a single vector (1D numpy array), or a `(positive, negative)` pair
+            of lists, as accepted by :meth:`~gensim.models.keyedvectors.WordEmbeddingsKeyedVectors.most_similar`.
+            A 2D numpy array is taken as one raw query vector per row.
+        topn : {int, False}, optional
+            Number of top-N similar words to return for each query. If topn is False, return the
+            `(len(queries), vocabulary size)` matrix of similarity scores instead.
+        restrict_vocab : int, optional
+            Optional integer which limits the range of vectors which
+            are searched for most-similar values. For example, restrict_vocab=10000 would
+            only check the first 10000 word vectors in the vocabulary order. (This may be
+            meaningful if you've sorted the vocabulary by descending frequency.)
+        block_size : int, optional
+            Number of queries scored at once. Bounds the memory used for the scores
+            to `block_size * vocabulary size` floats.
+
+        Returns
+        -------
+        list of list of (str, float)
+            Sequence of (word, similarity) for each query, input words excluded.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.test.utils import common_texts
+            >>> from gensim.models import Word2Vec
+            >>>
+            >>> wv = Word2Vec(common_texts, size=10, min_count=1).wv
+            >>> sims = wv.most_similar_batch(['human', (['graph', 'trees'], ['user'])], topn=3)
+
+        """
+        self.init_sims()
+        if isinstance(queries, ndarray) and queries.ndim == 2:
+            means = array([matutils.unitvec(query) for query in queries], dtype=REAL)
+            exclude = [set() for _ in queries]
+        else:
+            means, exclude = [], []
+            for query in queries:
+                if isinstance(query, string_types + (ndarray,)):
+                    mean, all_words = self._query_vector([query])
+                else:
+                    mean, all_words = self._query_vector(*query)
+                means.append(mean)
+                exclude.append(all_words)
+            means = array(means, dtype=REAL).reshape(len(means), self.vector_size)
 
-        limited = self.vectors_norm if restrict_vocab is None else self.vectors_norm[:restrict_vocab]
-        dists = dot(limited, mean)
         if not topn:
-            return dists
-        best = matutils.argsort(dists, topn=topn + len(all_words), reverse=True)
-        # ignore (don't return) words from the input
-        result = [(self.index2word[sim], float(dists[sim])) for sim in best if sim not in all_words]
-        return result[:topn]
+            limited = self.vectors_norm if restrict_vocab is None else self.vectors_norm[:restrict_vocab]
+            return dot(means, limited.T)
+        return [
+            [(self.index2word[index], float(sim)) for index, sim in zip(best, sims)]
+            for best, sims in self._most_similar_indices(means, exclude, topn, restrict_vocab, block_size)
+        ]
+
+    def _most_similar_indices(self, means, exclude, topn, restrict_vocab=None, block_size=256):
+        """Find the indices of the `topn` vectors closest to each row of `means`, by blocks of queries,
+        helper for :meth:`~gensim.models.keyedvectors.WordEmbeddingsKeyedVectors.most_similar_batch`.
+
+        Parameters
+        ----------
+        means : numpy.ndarray
+            Unit-length query vectors, one per row.
+        exclude : list of set of int
+            For each query, indices of words that must not be returned.
+        topn : int
+            Number of top-N similar words to return for each query.
+        restrict_vocab : int, optional
+            Only search the first `restrict_vocab` word vectors.
+        block_size : int, optional
+            Number of queries scored at once.
+
+        Yields
+        ------
+        (numpy.ndarray, numpy.ndarray)
+            Indices of the most similar words and their similarities, in descending order of similarity.
+
+        """
+        limited = self.vectors_norm if restrict_vocab is None else self.vectors_norm[:restrict_vocab]
+        num_words = len(limited)
+        for start in range(0, len(means), block_size):
+            block_exclude = exclude[start:start + block_size]
+            dists = dot(means[start:start + block_size], limited.T)
+            # never return the input words: push them to the end of each row
+            for row, indices in enumerate(block_exclude):
+                indices = [index for index in indices if index < num_words]
+                dists[row, indices] = -np.inf
+            k = min(topn, num_words)
+            if k <= 0:
+                for row in range(len(dists)):
+                    yield np.empty(0, dtype=np.intp), np.empty(0, dtype=dists.dtype)
+                continue
+            if k < num_words:
+                best = np.argpartition(-dists, k - 1, axis=1)[:, :k]
+            else:
+                best = np.tile(np.arange(num_words), (len(dists), 1))
+            rows = np.arange(len(dists))[:, None]
+            best = best[rows, np.argsort(-dists[rows, best], axis=1, kind='mergesort')]
+            for row, indices in enumerate(block_exclude):
+                row_best = best[row]
+                if indices:
+                    row_best = row_best[[index not in indices for index in row_best.tolist()]]
+                yield row_best, dists[row, row_best]
 
     def similar_by_word(self, word, topn=10, restrict_vocab=None):
         """Find the top-N most similar words.
@@ -1046,6 +1291,56 @@ class WordEmbeddingsKeyedVectors(BaseKeyedVectors):
             logger.info("%s: %.1f%% (%i/%i)", section['section'], 100.0 * score, correct, correct + incorrect)
             return score
 
+    def _solve_word_analogies(self, pending, ok_vocab, restrict_vocab, case_insensitive, block_size=256):
+        """Solve the analogies in `pending` with the 3CosAdd (vector offset) method and record them as correct or
+        incorrect in their section, helper for
+        :meth:`~gensim.models.keyedvectors.WordEmbeddingsKeyedVectors.evaluate_word_analogies`.
+
+        The queries are scored in blocks, see
+        :meth:`~gensim.models.keyedvectors.WordEmbeddingsKeyedVectors.most_similar_batch`.
+
+        Parameters
+        ----------
+        pending : list of (dict, (str, str, str, str), str)
+            Section, quadruplet and original line of each analogy, or `None` instead of the line for analogies
+            with out-of-vocabulary words, which are recorded as incorrect. Emptied in-place.
+        ok_vocab : dict of (str, :class:`~gensim.models.keyedvectors.Vocab`)
+            Vocabulary used for the evaluation.
+        restrict_vocab : int
+            Only search the first `restrict_vocab` word vectors.
+        case_insensitive : bool
+            Whether the words in `ok_vocab` are uppercased.
+        block_size : int, optional
+            Number of queries scored at once.
+
+        """
+        # TODO: implement 3CosMul and set-based methods for solving analogies
+        solvable = [(quadruplet, line) for _, quadruplet, line in pending if line is not None]
+        means, exclude = empty((len(solvable), self.vector_size), dtype=REAL), []
+        for row, ((a, b, c, _), _) in enumerate(solvable):
+            ignore = [ok_vocab[a].index, ok_vocab[b].index, ok_vocab[c].index]
+            a_vec, b_vec, c_vec = self.vectors_norm[ignore]
+            means[row] = matutils.unitvec(array([b_vec, c_vec, -a_vec]).mean(axis=0))
+            exclude.append(set(ignore))
+        results = self._most_similar_indices(means, exclude, 5, restrict_vocab, block_size)
+
+        for section, (a, b, c, expected), line in pending:
+            predicted = None
+            if line is not None:
+                ignore = {a, b, c}  # input words to be ignored
+                best, _ = next(results)
+                for index in best:
+                    predicted = self.index2word[index].upper() if case_insensitive else self.index2word[index]
+                    if predicted in ok_vocab and predicted not in ignore:
+                        if predicted != expected:
+                            logger.debug("%s: expected %s, predicted %s", line.strip(), expected, predicted)
+                        break
+            if predicted == expected:
+                section['correct'].append((a, b, c, expected))
+            else:
+                section['incorrect'].append((a, b, c, expected))
+        del pending[:]
+
     def evaluate_word_analogies(self, analogies, restrict_vocab=300000, case_insensitive=True, dummy4unknown=False):
         """Compute performance of the model on an analogy test set.
 
@@ -1090,7 +1385,9 @@ class WordEmbeddingsKeyedVectors(BaseKeyedVectors):
         ok_vocab = {w.upper(): v for w, v in reversed(ok_vocab)} if case_insensitive else dict(ok_vocab)
         oov = 0
         logger.info("Evaluating word analogies for top %i words in the model on %s", restrict_vocab, analogies)
+        self.init_sims()
         sections, section = [], None
+        pending = []  # (section, quadruplet, line) of in-vocabulary quadruplets, solved in batches
         quadruplets_no = 0
         for line_no, line in enumerate(utils.smart_open(analogies)):
             line = utils.to_unicode(line)
@@ -1098,6 +1395,7 @@ class WordEmbeddingsKeyedVectors(BaseKeyedVectors):
                 # a new section starts => store the old section
                 if section:
                     sections.append(section)
+                    self._solve_word_analogies(pending, ok_vocab, restrict_vocab, case_insensitive)
                     self._log_evaluate_word_analogies(section)
                 section = {'section': line.lstrip(': ').strip(), 'correct': [], 'incorrect': []}
             else:
@@ -1116,31 +1414,15 @@ class WordEmbeddingsKeyedVectors(BaseKeyedVectors):
                     oov += 1
                     if dummy4unknown:
                         logger.debug('Zero accuracy for line #%d with OOV words: %s', line_no, line.strip())
-                        section['incorrect'].append((a, b, c, expected))
+                        pending.append((section, (a, b, c, expected), None))
                     else:
                         logger.debug("Skipping line #%i with OOV words: %s", line_no, line.strip())
                     continue
-                original_vocab = self.vocab
-                self.vocab = ok_vocab
-                ignore = {a, b, c}  # input words to be ignored
-                predicted = None
-                # find the most likely prediction using 3CosAdd (vector offset) method
-                # TODO: implement 3CosMul and set-based methods for solving analogies
-                sims = self.most_similar(positive=[b, c], negative=[a], topn=5, restrict_vocab=restrict_vocab)
-                self.vocab = original_vocab
-                for element in sims:
-                    predicted = element[0].upper() if case_insensitive else element[0]
-                    if predicted in ok_vocab and predicted not in ignore:
-                        if predicted != expected:
-                            logger.debug("%s: expected %s, predicted %s", line.strip(), expected, predicted)
-                        break
-                if predicted == expected:
-                    section['correct'].append((a, b, c, expected))
-                else:
-                    section['incorrect'].append((a, b, c, expected))
+                pending.append((section, (a, b, c, expected), line))
         if section:
             # store the last section, too
             sections.append(section)
+            self._solve_word_analogies(pending, ok_vocab, restrict_vocab, case_insensitive)
             self._log_evaluate_word_analogies(section)
 
         total = {
@@ -1456,6 +1738,50 @@ class Word2VecKeyedVectors(WordEmbeddingsKeyedVectors):
             cls, fname, fvocab=fvocab, binary=binary, encoding=encoding, unicode_errors=unicode_errors,
             limit=limit, datatype=datatype)
 
+    def save_mmap_format(self, fname):
+        """Store the vectors and vocabulary in a single file, in a native format that can be opened instantly
+        with :meth:`~gensim.models.keyedvectors.Word2VecKeyedVectors.load_mmap_format`.
+
+        The file holds a small header, the raw `float32` vectors and a sorted, offset-indexed vocabulary block.
+
+        Parameters
+        ----------
+        fname : str
+            The file path used to save the vectors in.
+
+        """
+        _save_mmap_format(fname, self.vocab, self.vectors)
+
+    @classmethod
+    def load_mmap_format(cls, fname, mmap='r'):
+        """Memory-map a file stored by :meth:`~gensim.models.keyedvectors.Word2VecKeyedVectors.save_mmap_format`.
+
+        Loading takes milliseconds regardless of the vocabulary size: the vectors are a :class:`numpy.memmap`
+        view into the file, and words are looked up lazily in its sorted vocabulary block (see
+        :class:`~gensim.models.keyedvectors.MmapVocab`). Processes that open the same file share one copy of it
+        in the OS page cache.
+
+        Warnings
+        --------
+        The vocabulary of the loaded object is read-only, so new vectors can't be added with
+        :meth:`~gensim.models.keyedvectors.WordEmbeddingsKeyedVectors.add`.
+
+        Parameters
+        ----------
+        fname : str
+            The file path to the saved file.
+        mmap : {'r', 'c', 'r+'}, optional
+            Memory-map mode, see :class:`numpy.memmap`. With the default read-only mode, use `init_sims()`
+            without `replace=True`; 'c' (copy-on-write) allows in-place modifications that don't reach the file.
+
+        Returns
+        -------
+        :class:`~gensim.models.keyedvectors.Word2VecKeyedVectors`
+            Loaded model.
+
+        """
+        return _load_mmap_format(cls, fname, mmap=mmap)
+
     def get_keras_embedding(self, train_embeddings=False):
         """Get a Keras 'Embedding' layer with weights set as the Word2Vec model's learned word embeddings.
 
@@ -0,0 +1,433 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Distributed Latent Dirichlet Allocation (LDA, :class:`~gensim.models.ldamodel.LdaModel`) over
+:mod:`multiprocessing.connection`, without Pyro4 or a name server.
+
+:class:`~gensim.models.lda_connection.ConnectionDispatcher` is a drop-in replacement of the Pyro4
+:class:`~gensim.models.lda_dispatcher.Dispatcher`: pass it to :class:`~gensim.models.ldamodel.LdaModel`, and
+the E step is distributed over its workers. The workers are either processes started on this machine
+(a stand-in cluster, e.g. for testing), or worker scripts started on other machines, which connect to the
+dispatcher, or both.
+
+Unlike the Pyro4 version, no :class:`~gensim.models.ldamodel.LdaState` is pickled per job or EM iteration.
+After the one-off initialization, all messages are compact binary arrays (in the `.npy` format):
+
+* a job is the chunk of documents as a sparse matrix (its `indptr`, `indices` and `data` arrays),
+* at the start of each EM iteration, the workers receive the new `expElogbeta` topics only (nothing if the
+  topics did not change since the last iteration), instead of the whole state with its `eta` and `sstats`,
+* at the end of each EM iteration, the workers return their sufficient statistics and number of documents.
+
+How to use distributed :class:`~gensim.models.ldamodel.LdaModel` over connections
+--------------------------------------------------------------------------------
+
+With worker processes on this machine:
+
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import common_corpus, common_dictionary
+    >>> from gensim.models import LdaModel
+    >>> from gensim.models.lda_connection import ConnectionDispatcher
+    >>>
+    >>> dispatcher = ConnectionDispatcher(workers=2)
+    >>> model = LdaModel(common_corpus, id2word=common_dictionary, distributed=True, dispatcher=dispatcher)
+    >>> dispatcher.exit()
+
+With workers on other machines, listen on a public address and wait for `remote_workers` workers to connect, each
+started with ::
+
+    python -m gensim.models.lda_connection --host DISPATCHER_HOST --port 6000 --authkey SECRET &
+
+.. sourcecode:: pycon
+
+    >>> dispatcher = ConnectionDispatcher(
+    ...     workers=0, remote_workers=4, address=('0.0.0.0', 6000), authkey=b'SECRET')  # doctest: +SKIP
+
+
+Command line arguments
+----------------------
+
+.. program-output:: python -m gensim.models.lda_connection --help
+   :ellipsis: 0, -7
+
+"""
+
+from __future__ import with_statement
+
+import argparse
+import logging
+import os
+import sys
+import threading
+from io import BytesIO
+from multiprocessing import Process, cpu_count
+from multiprocessing.connection import Client, Listener
+
+import numpy as np
+import scipy.sparse
+from six.moves import queue, range
+
+from gensim import matutils
+from gensim.models import ldamodel
+
+logger = logging.getLogger(__name__)
+
+# How many jobs (=chunks of N documents) to keep "pre-fetched" in a queue, see `lda_dispatcher.MAX_JOBS_QUEUE`.
+MAX_JOBS_QUEUE = 10
+
+# commands, the first byte of each message sent to a worker
+JOB = b'J'  # E step on a chunk of documents: indptr, indices, data of its sparse matrix
+TOPICS = b'T'  # new EM iteration with new topics: expElogbeta
+RESET = b'R'  # new EM iteration with the same topics
+STATE = b'S'  # send back the collected sufficient statistics
+EXIT = b'X'  # terminate
+DONE = b'D'  # reply of a worker to every command but STATE
+
+
+def pack_arrays(command, *arrays):
+    """Encode a message of `command` followed by `arrays`, in the binary `.npy` format (no pickle).
+
+    Parameters
+    ----------
+    command : bytes
+        One-byte command.
+    *arrays : numpy.ndarray
+        Payload of the message.
+
+    Returns
+    -------
+    bytes
+        Message.
+
+    """
+    buf = BytesIO()
+    buf.write(command)
+    for array in arrays:
+        np.save(buf, array, allow_pickle=False)
+    return buf.getvalue()
+
+
+def unpack_arrays(message, count):
+    """Decode the command and the first `count` arrays of a message encoded by
+    :func:`~gensim.models.lda_connection.pack_arrays`.
+
+    Parameters
+    ----------
+    message : bytes
+        Message.
+    count : int
+        Number of arrays to decode.
+
+    Returns
+    -------
+    (bytes, list of numpy.ndarray)
+        One-byte command and the arrays.
+
+    """
+    buf = BytesIO(message)
+    command = buf.read(1)
+    return command, [np.load(buf, allow_pickle=False) for _ in range(count)]
+
+
+def run_worker(address, authkey):
+    """Connect to a :class:`~gensim.models.lda_connection.ConnectionDispatcher` and process its commands until told
+    to exit.
+
+    Parameters
+    ----------
+    address : {(str, int), str}
+        Address of the dispatcher.
+    authkey : bytes
+        Shared secret of the dispatcher.
+
+    """
+    conn = Client(address, authkey=authkey)
+    model_params = conn.recv()  # the only pickled message, sent once
+    model = ldamodel.LdaModel(**model_params)
+    model.clear()  # the E step only needs the topics, sent by the dispatcher before the first job
+    # the per-document inference loop cannot work with float16 sparse matrices, nor without batch inference
+    as_sparse = model.batch_inference and model.dtype != np.float16
+    sstats = np.zeros((model.num_topics, model.num_terms), dtype=model.dtype)
+    numdocs = 0
+    jobsdone = 0
+    conn.send_bytes(DONE)
+    logger.info("worker process #%i connected to dispatcher at %s", os.getpid(), address)
+
+    while True:
+        message = conn.recv_bytes()
+        command = message[:1]
+        if command == JOB:
+            _, (indptr, indices, data) = unpack_arrays(message, 3)
+            chunk = scipy.sparse.csc_matrix((data, indices, indptr), shape=(model.num_terms, len(indptr) - 1))
+            if not as_sparse:
+                chunk = list(matutils.Sparse2Corpus(chunk))
+            _, chunk_sstats = model.inference(chunk, collect_sstats=True)
+            sstats += chunk_sstats
+            numdocs += len(indptr) - 1
+            jobsdone += 1
+            logger.debug("worker process #%i finished job #%i", os.getpid(), jobsdone)
+        elif command == TOPICS:
+            _, (expElogbeta,) = unpack_arrays(message, 1)
+            model.expElogbeta = expElogbeta.astype(model.dtype, copy=False)
+            sstats[:] = 0.0
+            numdocs = 0
+        elif command == RESET:
+            sstats[:] = 0.0
+            numdocs = 0
+        elif command == STATE:
+            conn.send_bytes(pack_arrays(STATE, sstats, np.array([numdocs], dtype=np.int64)))
+            continue
+        elif command == EXIT:
+            logger.info("terminating worker process #%i after %i jobs", os.getpid(), jobsdone)
+            conn.send_bytes(DONE)
+            conn.close()
+            return
+        else:
+            raise ValueError("unknown command %r" % command)
+        conn.send_bytes(DONE)
+
+
+class ConnectionDispatcher(object):
+    """Dispatcher of distributed :class:`~gensim.models.ldamodel.LdaModel` over :mod:`multiprocessing.connection`.
+
+    Has the same interface as the Pyro4 :class:`~gensim.models.lda_dispatcher.Dispatcher`, as used by
+    :class:`~gensim.models.ldamodel.LdaModel`. Each worker is served by a thread of the dispatcher, which takes
+    the jobs from a shared queue, so that faster workers process more jobs.
+
+    """
+    def __init__(self, workers=None, remote_workers=0, address=('localhost', 0), authkey=None,
+                 maxsize=MAX_JOBS_QUEUE):
+        """
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of worker processes to start on this machine. If None - use all CPUs but one.
+        remote_workers : int, optional
+            Number of workers started on other machines (see the module docstring), that
+            :meth:`~gensim.models.lda_connection.ConnectionDispatcher.initialize` waits for.
+        address : {(str, int), str}, optional
+            Address to listen on for workers, by default a free port on localhost.
+        authkey : bytes, optional
+            Shared secret the workers must present. If None - a random one, only usable by local workers.
+        maxsize : int, optional
+            Maximum number of jobs to be kept pre-fetched in the queue.
+
+        """
+        if workers is None:
+            workers = max(1, cpu_count() - 1)
+        if workers + remote_workers < 1:
+            raise ValueError("at least one worker required")
+        if remote_workers and authkey is None:
+            raise ValueError("remote workers need an explicit authkey")
+        self.num_local = int(workers)
+        self.num_remote = int(remote_workers)
+        self.address = address
+        self.authkey = authkey if authkey is not None else os.urandom(20)
+        self.maxsize = maxsize
+        self.workers = {}
+        self.processes = []
+        self.listener = None
+
+    def initialize(self, **model_params):
+        """Start the local workers, wait for the remote workers to connect, and initialize them all.
+
+        Parameters
+        ----------
+        **model_params
+            Keyword parameters used to initialize individual workers, see :class:`~gensim.models.ldamodel.LdaModel`.
+
+        """
+        self.jobs = queue.Queue(maxsize=self.maxsize)
+        self.lock_update = threading.Lock()
+        self._jobsdone = 0
+        self._jobsreceived = 0
+        self._error = None
+        self._expElogbeta = None
+        self._eta = None
+
+        self.listener = Listener(self.address, authkey=self.authkey)
+        logger.info("dispatcher listening at %s", self.listener.address)
+        for _ in range(self.num_local):
+            process = Process(target=run_worker, args=(self.listener.address, self.authkey))
+            process.daemon = True
+            process.start()
+            self.processes.append(process)
+
+        logger.info("waiting for %i local and %i remote workers", self.num_local, self.num_remote)
+        for workerid in range(self.num_local + self.num_remote):
+            conn = self.listener.accept()
+            conn.send(model_params)
+            self._expect_done(conn)
+            logger.info("registering worker #%i", workerid)
+            self.workers[workerid] = conn
+            thread = threading.Thread(target=self._serve, args=(workerid, conn))
+            thread.daemon = True
+            thread.start()
+
+    @staticmethod
+    def _expect_done(conn):
+        """Wait for a worker to acknowledge its last command."""
+        reply = conn.recv_bytes()
+        if reply != DONE:
+            raise RuntimeError("unexpected reply %r from worker" % reply[:1])
+
+    def _serve(self, workerid, conn):
+        """Feed jobs from the queue to the worker `workerid`, until a None job is received."""
+        while True:
+            job = self.jobs.get()
+            try:
+                if job is None:
+                    return
+                conn.send_bytes(job)
+                self._expect_done(conn)
+                with self.lock_update:
+                    self._jobsdone += 1
+                    logger.info("worker #%s finished job #%i", workerid, self._jobsdone)
+            except Exception as err:
+                logger.error("worker #%s failed: %s", workerid, err)
+                self._error = err
+            finally:
+                self.jobs.task_done()
+
+    def getworkers(self):
+        """Get the ids of all registered workers.
+
+        Returns
+        -------
+        list of int
+            Worker ids.
+
+        """
+        return list(self.workers)
+
+    def putjob(self, job):
+        """Encode a job and add it to the queue, blocking while the queue is full.
+
+        Parameters
+        ----------
+        job : {iterable of list of (int, float), scipy.sparse.csc}
+            The corpus chunk, in BoW format or as a sparse matrix of shape (`num_terms`, `num_documents`).
+
+        """
+        if self._eta is None:
+            raise RuntimeError("dispatcher must be reset with the model state before receiving jobs")
+        num_terms = self._eta.shape[-1]
+        # scipy.sparse has no float16 support, ship half precision documents as float32
+        dtype = np.float32 if self._dtype == np.float16 else self._dtype
+        if scipy.sparse.issparse(job):
+            job = job.tocsc().astype(dtype)
+        else:
+            job = matutils.corpus2csc(job, num_terms=num_terms, dtype=dtype)
+        self._jobsreceived += 1
+        self.jobs.put(pack_arrays(JOB, job.indptr, job.indices, job.data))
+        logger.info("added a new job (len(queue)=%i items)", self.jobs.qsize())
+
+    def getstate(self):
+        """Wait for all jobs to finish, then collect and sum up the sufficient statistics of all workers.
+
+        Returns
+        -------
+        :class:`~gensim.models.ldamodel.LdaState`
+            Merged resultant state.
+
+        Raises
+        ------
+        RuntimeError
+            If a worker failed to process a job.
+
+        """
+        logger.info("end of input, waiting for all remaining jobs")
+        self.jobs.join()
+        if self._error is not None:
+            raise RuntimeError("distributed LDA worker failed: %s" % self._error)
+
+        logger.info("merging states from %i workers", len(self.workers))
+        result = ldamodel.LdaState(self._eta, self._shape, dtype=self._dtype)
+        for conn in self.workers.values():
+            # all serving threads are idle in `self.jobs.get()` now, the connections are free
+            conn.send_bytes(STATE)
+            _, (sstats, numdocs) = unpack_arrays(conn.recv_bytes(), 2)
+            result.sstats += sstats
+            result.numdocs += int(numdocs[0])
+        return result
+
+    def reset(self, state):
+        """Prepare all workers for a new EM iteration, sending them the new topics if they changed.
+
+        Parameters
+        ----------
+        state : :class:`~gensim.models.ldamodel.LdaState`
+            State of :class:`~gensim.models.ldamodel.LdaModel`.
+
+        """
+        self.jobs.join()  # don't interfere with the serving threads
+        self._eta, self._shape, self._dtype = state.eta, state.sstats.shape, state.dtype
+        expElogbeta = np.exp(state.get_Elogbeta())
+        if self._expElogbeta is not None and np.array_equal(expElogbeta, self._expElogbeta):
+            logger.info("resetting %i workers", len(self.workers))
+            message = RESET
+        else:
+            logger.info("sending new topics to %i workers", len(self.workers))
+            message = pack_arrays(TOPICS, expElogbeta)
+            self._expElogbeta = expElogbeta
+        for conn in self.workers.values():
+            conn.send_bytes(message)
+        for conn in self.workers.values():
+            self._expect_done(conn)
+        self._jobsdone = 0
+        self._jobsreceived = 0
+
+    def jobsdone(self):
+        """Get the number of jobs finished in this EM iteration.
+
+        Returns
+        -------
+        int
+            Number of jobs already completed.
+
+        """
+        return self._jobsdone
+
+    def exit(self):
+        """Terminate all workers, local worker processes included, and stop listening."""
+        if self.workers:
+            for _ in self.workers:
+                self.jobs.put(None)  # stop the serving threads
+            self.jobs.join()
+        for workerid, conn in self.workers.items():
+            logger.info("terminating worker %s", workerid)
+            try:
+                conn.send_bytes(EXIT)
+                self._expect_done(conn)
+            except (EOFError, IOError):
+                pass
+            conn.close()
+        for process in self.processes:
+            process.join()
+        if self.listener is not None:
+            self.listener.close()
+        self.workers, self.processes, self.listener = {}, [], None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__[:-135], formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--host", help="Dispatcher hostname", required=True)
+    parser.add_argument("--port", help="Dispatcher port", required=True, type=int)
+    parser.add_argument("--authkey", help="Shared secret of the dispatcher", required=True)
+    parser.add_argument(
+        '-v', '--verbose', help='Verbose flag', action='store_const', dest="loglevel",
+        const=logging.INFO, default=logging.WARNING
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=args.loglevel)
+    logger.info("running %s", " ".join(sys.argv))
+    run_worker((args.host, args.port), args.authkey.encode('utf8'))
+    logger.info("finished running %s", " ".join(sys.argv))
+
+
+if __name__ == '__main__':
+    main()
@@ -84,16 +84,19 @@ A lot of parameters can be tuned to optimize training for your specific case
 
 """
 
+import copy
 import logging
+import multiprocessing
 import numbers
 import os
 
 import numpy as np
+import scipy.sparse
 import six
 from scipy.special import gammaln, psi  # gamma function utils
 from scipy.special import polygamma
 from six.moves import range
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from gensim import interfaces, utils, matutils
 from gensim.matutils import (
@@ -153,6 +156,38 @@ def update_dir_prior(prior, N, logphat, rho):
     return prior
 
 
+def _rowwise_dot(left, right, left_rows, right_rows, blocksize=65536):
+    """Compute `(left[left_rows] * right[right_rows]).sum(axis=1)`, in blocks to bound memory use.
+
+    Used by the batched E-step to compute the phi normalizer of every (document, word) pair of a chunk,
+    without materializing the full (documents x words) dense product.
+
+    Parameters
+    ----------
+    left : numpy.ndarray
+        2d array, rows indexed by `left_rows`.
+    right : numpy.ndarray
+        2d array with the same number of columns as `left`, rows indexed by `right_rows`.
+    left_rows : numpy.ndarray
+        Row indices into `left`.
+    right_rows : numpy.ndarray
+        Row indices into `right`, same length as `left_rows`.
+    blocksize : int, optional
+        Number of rows to process at once.
+
+    Returns
+    -------
+    numpy.ndarray
+        1d array of the row-wise dot products, same length as `left_rows`.
+
+    """
+    result = np.empty(len(left_rows), dtype=np.result_type(left, right))
+    for start in range(0, len(left_rows), blocksize):
+        end = start + blocksize
+        result[start:end] = np.einsum('ij,ij->i', left[left_rows[start:end]], right[right_rows[start:end]])
+    return result
+
+
 class LdaState(utils.SaveLoad):
     """Encapsulate information for distributed computation of :class:`~gensim.models.ldamodel.LdaModel` objects.
 
@@ -356,7 +391,7 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                  alpha='symmetric', eta=None, decay=0.5, offset=1.0, eval_every=10,
                  iterations=50, gamma_threshold=0.001, minimum_probability=0.01,
                  random_state=None, ns_conf=None, minimum_phi_value=0.01,
-                 per_word_topics=False, callbacks=None, dtype=np.float32):
+                 per_word_topics=False, callbacks=None, dtype=np.float32, batch_inference=True, dispatcher=None):
         """
 
         Parameters
@@ -424,6 +459,14 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             Metric callbacks to log and visualize evaluation metrics of the model during training.
         dtype : {numpy.float16, numpy.float32, numpy.float64}, optional
             Data-type to use during calculations inside model. All inputs are also converted.
+        batch_inference : bool, optional
+            If True, run the E-step on whole chunks at once
+            (see :meth:`~gensim.models.ldamodel.LdaModel.inference_batch`), otherwise one document after another.
+        dispatcher : object, optional
+            Dispatcher distributing the E step over its workers, e.g. a
+            :class:`~gensim.models.lda_connection.ConnectionDispatcher`, which needs no Pyro4.
+            If None, the Pyro4 :class:`~gensim.models.lda_dispatcher.Dispatcher` is looked up in the name server.
+            Only used if `distributed` is set to True.
 
         """
         if dtype not in DTYPE_TO_EPS:
@@ -487,6 +530,7 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         # VB constants
         self.iterations = iterations
         self.gamma_threshold = gamma_threshold
+        self.batch_inference = batch_inference
 
         # set up distributed environment if necessary
         if not distributed:
@@ -498,20 +542,22 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                 raise NotImplementedError("auto-optimizing alpha not implemented in distributed LDA")
             # set up distributed version
             try:
-                import Pyro4
-                if ns_conf is None:
-                    ns_conf = {}
-
-                with utils.getNS(**ns_conf) as ns:
-                    from gensim.models.lda_dispatcher import LDA_DISPATCHER_PREFIX
-                    self.dispatcher = Pyro4.Proxy(ns.list(prefix=LDA_DISPATCHER_PREFIX)[LDA_DISPATCHER_PREFIX])
-                    logger.debug("looking for dispatcher at %s" % str(self.dispatcher._pyroUri))
-                    self.dispatcher.initialize(
-                        id2word=self.id2word, num_topics=self.num_topics, chunksize=chunksize,
-                        alpha=alpha, eta=eta, distributed=False
-                    )
-                    self.numworkers = len(self.dispatcher.getworkers())
-                    logger.info("using distributed version with %i workers", self.numworkers)
+                if dispatcher is None:
+                    import Pyro4
+                    if ns_conf is None:
+                        ns_conf = {}
+
+                    with utils.getNS(**ns_conf) as ns:
+                        from gensim.models.lda_dispatcher import LDA_DISPATCHER_PREFIX
+                        dispatcher = Pyro4.Proxy(ns.list(prefix=LDA_DISPATCHER_PREFIX)[LDA_DISPATCHER_PREFIX])
+                        logger.debug("looking for dispatcher at %s" % str(dispatcher._pyroUri))
+                self.dispatcher = dispatcher
+                self.dispatcher.initialize(
+                    id2word=self.id2word, num_topics=self.num_topics, chunksize=chunksize,
+                    alpha=alpha, eta=eta, distributed=False, dtype=self.dtype, batch_inference=batch_inference
+                )
+                self.numworkers = len(self.dispatcher.getworkers())
+                logger.info("using distributed version with %i workers", self.numworkers)
             except Exception as err:
                 logger.error("failed to initialize distributed LDA (%s)", err)
                 raise RuntimeError("failed to initialize distributed LDA (%s)" % err)
@@ -641,6 +687,10 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             only returned if `collect_sstats` == True and corresponds to the sufficient statistics for the M step.
 
         """
+        if getattr(self, 'batch_inference', True) and self.dtype != np.float16:
+            # scipy.sparse has no float16 support, half precision models stay on the per-document loop
+            return self.inference_batch(chunk, collect_sstats=collect_sstats)
+
         try:
             len(chunk)
         except TypeError:
@@ -722,6 +772,122 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         assert gamma.dtype == self.dtype
         return gamma, sstats
 
+    def inference_batch(self, chunk, collect_sstats=False):
+        """Given a chunk of sparse document vectors, estimate gamma for all documents in the chunk at once.
+
+        Computes the same as the per-document loop of :meth:`~gensim.models.ldamodel.LdaModel.inference`, but
+        vectorized over the whole chunk: the chunk is converted into a CSR matrix restricted to the terms that
+        actually occur in it, and each iteration updates all not-yet-converged documents with one sparse x dense
+        product. Documents that converged are masked out of the following iterations.
+
+        Parameters
+        ----------
+        chunk : {list of list of (int, float), scipy.sparse.csc}
+            The corpus chunk on which the inference step will be performed, either as a list of documents or as
+            a sparse matrix of shape (`num_terms`, `num_documents`).
+        collect_sstats : bool, optional
+            If set to True, also collect (and return) sufficient statistics needed to update the model's topic-word
+            distributions.
+
+        Returns
+        -------
+        (numpy.ndarray, {numpy.ndarray, None})
+            The first element is always returned and it corresponds to the states gamma matrix. The second element is
+            only returned if `collect_sstats` == True and corresponds to the sufficient statistics for the M step.
+
+        """
+        if scipy.sparse.issparse(chunk):
+            # documents as rows of a CSR matrix
+            docs = chunk.T.tocsr()
+            if docs.dtype != self.dtype:
+                docs = docs.astype(self.dtype)
+        else:
+            try:
+                len(chunk)
+            except TypeError:
+                # convert iterators/generators to plain list, so we have len() etc.
+                chunk = list(chunk)
+            docs = matutils.corpus2csc(
+                chunk, num_terms=self.num_terms, num_docs=len(chunk), num_nnz=sum(len(doc) for doc in chunk),
+                dtype=self.dtype
+            ).T.tocsr()
+        num_docs = docs.shape[0]
+        if num_docs > 1:
+            logger.debug("performing batched inference on a chunk of %i documents", num_docs)
+
+        # Initialize the variational distribution q(theta|gamma) for the chunk
+        gamma = self.random_state.gamma(100., 1. / 100., (num_docs, self.num_topics)).astype(self.dtype, copy=False)
+        Elogtheta = dirichlet_expectation(gamma)
+        expElogtheta = np.exp(Elogtheta)
+
+        assert Elogtheta.dtype == self.dtype
+        assert expElogtheta.dtype == self.dtype
+
+        # remap term ids to the terms present in this chunk
+        ids, termnos = np.unique(docs.indices, return_inverse=True)
+        cts = docs.data
+        docnos = np.repeat(np.arange(num_docs), np.diff(docs.indptr))
+        expElogbetad = np.ascontiguousarray(self.expElogbeta[:, ids].T)  # num_used_terms x num_topics
+
+        # The optimal phi_{dwk} is proportional to expElogthetad_k * expElogbetad_w.
+        # phinorm is the normalizer, computed only for the (document, word) pairs present in the chunk.
+        eps = DTYPE_TO_EPS[self.dtype]
+
+        # state of the documents that haven't converged yet
+        active = np.arange(num_docs)
+        gammaa, expElogthetaa = gamma, expElogtheta
+        adocnos, atermnos, acts = docnos, termnos, cts
+        phinorm = _rowwise_dot(expElogthetaa, expElogbetad, adocnos, atermnos) + eps
+        aindptr = docs.indptr
+        converged = 0
+
+        # Iterate between gamma and phi until convergence, for all active documents at once
+        for _ in range(self.iterations):
+            lastgamma = gammaa
+            # We represent phi implicitly, as in `inference`. Cf. Lee&Seung 2001.
+            ratios = scipy.sparse.csr_matrix(
+                (acts / phinorm, atermnos, aindptr), shape=(len(active), len(ids))
+            )
+            gammaa = self.alpha + expElogthetaa * (ratios * expElogbetad)
+            Elogthetaa = dirichlet_expectation(gammaa)
+            expElogthetaa = np.exp(Elogthetaa)
+            phinorm = _rowwise_dot(expElogthetaa, expElogbetad, adocnos, atermnos) + eps
+            # If gamma hasn't changed much, the document is done.
+            done = np.mean(np.abs(gammaa - lastgamma), axis=1) < self.gamma_threshold
+            if done.any():
+                gamma[active[done]] = gammaa[done]
+                expElogtheta[active[done]] = expElogthetaa[done]
+                converged += int(done.sum())
+                # mask converged documents out of the following iterations
+                keep = ~done
+                keepnz = keep[adocnos]
+                lengths = np.diff(aindptr)[keep]
+                active, gammaa, expElogthetaa = active[keep], gammaa[keep], expElogthetaa[keep]
+                adocnos = np.repeat(np.arange(len(active)), lengths)
+                atermnos, acts, phinorm = atermnos[keepnz], acts[keepnz], phinorm[keepnz]
+                aindptr = np.concatenate(([0], np.cumsum(lengths)))
+                if not len(active):
+                    break
+        gamma[active] = gammaa
+        expElogtheta[active] = expElogthetaa
+
+        if num_docs > 1:
+            logger.debug("%i/%i documents converged within %i iterations", converged, num_docs, self.iterations)
+
+        if collect_sstats:
+            # Contribution of all documents to the expected sufficient statistics for the M step,
+            # sstats[k, w] = \sum_d n_{dw} * exp{Elogtheta_{dk} + Elogbeta_{kw}} / phinorm_{dw}.
+            phinorm = _rowwise_dot(expElogtheta, expElogbetad, docnos, termnos) + eps
+            ratios = scipy.sparse.csr_matrix((cts / phinorm, termnos, docs.indptr), shape=(num_docs, len(ids)))
+            sstats = np.zeros_like(self.expElogbeta, dtype=self.dtype)
+            sstats[:, ids] = (ratios.T * expElogtheta).T * self.expElogbeta[:, ids]
+            assert sstats.dtype == self.dtype
+        else:
+            sstats = None
+
+        assert gamma.dtype == self.dtype
+        return gamma, sstats
+
     def do_estep(self, chunk, state=None):
         """Perform inference on a chunk of documents, and accumulate the collected sufficient statistics.
 
@@ -1359,6 +1525,115 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
         return document_topics, word_topic, word_phi  # returns 2-tuple
 
+    def get_document_topics_dense(self, corpus, minimum_probability=None, chunksize=None, out=None, workers=1):
+        """Get the topic distributions of many documents at once, as a dense matrix.
+
+        Unlike :meth:`~gensim.models.ldamodel.LdaModel.get_document_topics`, inference runs on whole chunks of
+        documents (see :meth:`~gensim.models.ldamodel.LdaModel.inference_batch`) and the distributions are written
+        straight into a matrix, without creating a list of tuples per document.
+
+        Parameters
+        ----------
+        corpus : {iterable of list of (int, float), scipy.sparse}
+            Documents in BoW format, or a sparse matrix with the documents as rows, of shape (`num_documents`,
+            `num_terms`), such as :meth:`~gensim.corpora.csrcorpus.CsrCorpus.csr_matrix`.
+        minimum_probability : float, optional
+            Topic probabilities lower than this threshold are set to zero. If None, `self.minimum_probability` is used.
+        chunksize : int, optional
+            Number of documents inferred at once. If None, `self.chunksize` is used.
+        out : {numpy.ndarray, str}, optional
+            Preallocated output matrix of shape (`num_documents`, `num_topics`), e.g. a :class:`numpy.memmap`, or
+            the filename of a memory-mapped float32 matrix to create. If None, a new float32 matrix is allocated.
+        workers : int, optional
+            Number of processes running the inference, each with a copy of the topics.
+            1 (default) runs it in this process.
+
+        Returns
+        -------
+        numpy.ndarray
+            `out`, whose row `i` is the topic distribution of the `i`-th document.
+
+        """
+        if minimum_probability is None:
+            minimum_probability = self.minimum_probability
+        minimum_probability = max(minimum_probability, 1e-8)  # same topics as in the sparse output
+        if chunksize is None:
+            chunksize = self.chunksize
+
+        if scipy.sparse.issparse(corpus):
+            corpus = matutils.resize_columns(corpus, self.num_terms)
+            num_docs = corpus.shape[0]
+            # documents = columns of sparse CSC
+            chunks = (corpus[start:start + chunksize].T for start in range(0, num_docs, chunksize))
+        else:
+            try:
+                num_docs = len(corpus)
+            except TypeError:
+                # convert iterators/generators to plain list, so we have len() etc.
+                corpus = list(corpus)
+                num_docs = len(corpus)
+            chunks = utils.grouper(corpus, chunksize)
+
+        shape = (num_docs, self.num_topics)
+        if out is None:
+            out = np.zeros(shape, dtype=np.float32)
+        elif isinstance(out, six.string_types):
+            out = np.memmap(out, dtype=np.float32, mode='w+', shape=shape)
+        elif out.shape != shape:
+            raise ValueError("expected an output matrix of shape %s, got %s" % (shape, out.shape))
+
+        if workers > 1:
+            model = copy.copy(self)
+            model.dispatcher = None  # may not be picklable
+            model.state = None  # inference only needs the topics
+            pool = multiprocessing.Pool(workers, _init_dense_worker, (model,))
+        else:
+            pool = None
+        try:
+            if pool is None:
+                results = (self._dense_topics(chunk, minimum_probability) for chunk in chunks)
+            else:
+                results = _iter_dense_topics(pool, workers, chunks, minimum_probability)
+            doc_no = 0
+            for topics in results:
+                out[doc_no:doc_no + len(topics)] = topics
+                doc_no += len(topics)
+                logger.info("PROGRESS: inferred topics up to document #%i/%i", doc_no, num_docs)
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+        if doc_no != num_docs:
+            raise RuntimeError("input corpus size changed during inference (don't use generators as input)")
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
+    def _dense_topics(self, chunk, minimum_probability):
+        """Get the normalized topic distributions of a chunk of documents, see
+        :meth:`~gensim.models.ldamodel.LdaModel.get_document_topics_dense`.
+
+        Parameters
+        ----------
+        chunk : {list of list of (int, float), scipy.sparse.csc}
+            The chunk of documents.
+        minimum_probability : float
+            Topic probabilities lower than this threshold are set to zero.
+
+        Returns
+        -------
+        numpy.ndarray
+            Topic distributions, shape (`len(chunk)`, `self.num_topics`).
+
+        """
+        if scipy.sparse.issparse(chunk) and not (getattr(self, 'batch_inference', True) and self.dtype != np.float16):
+            # the per-document inference loop needs documents in BoW format
+            chunk = list(matutils.Sparse2Corpus(chunk))
+        gamma, _ = self.inference(chunk)
+        topics = gamma / gamma.sum(axis=1)[:, np.newaxis]  # normalize distributions
+        topics[topics < minimum_probability] = 0.0
+        return topics
+
     def get_term_topics(self, word_id, minimum_probability=None):
         """Get the most relevant topics to the given word.
 
@@ -1668,3 +1943,32 @@ class LdaModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             except Exception as e:
                 logging.warning("failed to load id2word dictionary from %s: %s", id2word_fname, e)
         return result
+
+
+_dense_model = None  # the model in each worker process of `LdaModel.get_document_topics_dense()`
+
+
+def _init_dense_worker(model):
+    """Keep the model in a worker process of :meth:`~gensim.models.ldamodel.LdaModel.get_document_topics_dense`."""
+    global _dense_model
+    _dense_model = model
+
+
+def _dense_topics_worker(chunk, minimum_probability):
+    """Get the topic distributions of a chunk of documents, in a worker process."""
+    return _dense_model._dense_topics(chunk, minimum_probability)
+
+
+def _iter_dense_topics(pool, workers, chunks, minimum_probability):
+    """Get the topic distributions of `chunks` from the worker processes in `pool`, in order.
+
+    At most `2 * workers` chunks are held in memory at any time.
+
+    """
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.apply_async(_dense_topics_worker, (chunk, minimum_probability)))
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
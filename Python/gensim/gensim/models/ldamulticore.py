@@ -34,6 +34,11 @@ Wall-clock `performance on the English Wikipedia <http://radimrehurek.com/gensim
 (Measured on `this i7 server <http://www.hetzner.de/en/hosting/produkte_rootserver/ex40ssd>`_
 with 4 physical cores, so that optimal `workers=3`, one less than the number of cores.)
 
+With a large vocabulary, shipping the model to the workers and the `num_topics x num_terms` sufficient statistics
+back for every chunk becomes the bottleneck. Use `shared_memory=True` to publish the topics to the workers once
+per M-step through shared memory instead, and have the workers accumulate their statistics in shared memory too.
+Run ``python -m gensim.test.ldaspeed`` to compare the throughput of both modes on your machine.
+
 This module allows both LDA model estimation from a training corpus and inference of topic distribution on new,
 unseen documents. The model can also be updated with new documents for online training.
 
@@ -86,12 +91,12 @@ import logging
 
 import numpy as np
 
-from gensim import utils
+from gensim import utils, matutils
 from gensim.models.ldamodel import LdaModel, LdaState
 
 import six
 from six.moves import queue, range
-from multiprocessing import Pool, Queue, cpu_count
+from multiprocessing import Pool, Queue, RawArray, cpu_count
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +110,8 @@ class LdaMulticore(LdaModel):
                  chunksize=2000, passes=1, batch=False, alpha='symmetric',
                  eta=None, decay=0.5, offset=1.0, eval_every=10, iterations=50,
                  gamma_threshold=0.001, random_state=None, minimum_probability=0.01,
-                 minimum_phi_value=0.01, per_word_topics=False, dtype=np.float32):
+                 minimum_phi_value=0.01, per_word_topics=False, dtype=np.float32, batch_inference=True,
+                 shared_memory=False):
         """
 
         Parameters
@@ -167,10 +173,20 @@ class LdaMulticore(LdaModel):
             each word, along with their phi values multiplied by the feature length (i.e. word count).
         dtype : {numpy.float16, numpy.float32, numpy.float64}, optional
             Data-type to use during calculations inside model. All inputs are also converted.
+        batch_inference : bool, optional
+            If True, workers run the E-step on whole chunks at once
+            (see :meth:`~gensim.models.ldamodel.LdaModel.inference_batch`), otherwise one document after another.
+        shared_memory : bool, optional
+            If True, train with :meth:`~gensim.models.ldamulticore.LdaMulticore.update_shared` instead of
+            passing the model and the sufficient statistics through queues with every chunk.
 
         """
         self.workers = max(1, cpu_count() - 1) if workers is None else workers
         self.batch = batch
+        self.shared_memory = shared_memory
+
+        if shared_memory and dtype == np.float16:
+            raise ValueError("shared memory multicore LDA needs scipy.sparse chunks, which don't support float16")
 
         if isinstance(alpha, six.string_types) and alpha == 'auto':
             raise NotImplementedError("auto-tuning alpha not implemented in multicore LDA; use plain LdaModel.")
@@ -180,7 +196,8 @@ class LdaMulticore(LdaModel):
             id2word=id2word, chunksize=chunksize, passes=passes, alpha=alpha, eta=eta,
             decay=decay, offset=offset, eval_every=eval_every, iterations=iterations,
             gamma_threshold=gamma_threshold, random_state=random_state, minimum_probability=minimum_probability,
-            minimum_phi_value=minimum_phi_value, per_word_topics=per_word_topics, dtype=dtype
+            minimum_phi_value=minimum_phi_value, per_word_topics=per_word_topics, dtype=dtype,
+            batch_inference=batch_inference
         )
 
     def update(self, corpus, chunks_as_numpy=False):
@@ -213,6 +230,9 @@ class LdaMulticore(LdaModel):
             performance hit. For distributed computing it may be desirable to keep the chunks as `numpy.ndarray`.
 
         """
+        if getattr(self, 'shared_memory', False):
+            return self.update_shared(corpus, chunks_as_numpy=chunks_as_numpy)
+
         try:
             lencorpus = len(corpus)
         except TypeError:
@@ -315,6 +335,141 @@ class LdaMulticore(LdaModel):
 
         pool.terminate()
 
+    def update_shared(self, corpus, chunks_as_numpy=False):
+        """Train the model with new documents, exchanging the model state with the workers through shared memory.
+
+        Same as :meth:`~gensim.models.ldamulticore.LdaMulticore.update`, but designed for large vocabularies:
+
+        * `expElogbeta` is published to the workers once per M-step, in a shared buffer, instead of pickling
+          the whole model with every chunk,
+        * chunks are sent to the workers as compact sparse matrices,
+        * each worker accumulates its sufficient statistics into its own shared slab, which the master sums up
+          before each M-step, instead of sending a `num_topics x num_terms` matrix back for every chunk.
+
+        The workers process `workers * chunksize` documents (or the whole corpus, with `batch=True`) between
+        two M-steps, and the M-step waits for all of them, so that the shared topics never change under a running
+        E-step.
+
+        Parameters
+        ----------
+        corpus : {iterable of list of (int, float), scipy.sparse.csc}, optional
+            Stream of document vectors or sparse matrix of shape (`num_terms`, `num_documents`) used to update the
+            model.
+        chunks_as_numpy : bool
+            Whether each chunk should be a np.ndarray or not, before it is converted into a sparse matrix.
+
+        """
+        try:
+            lencorpus = len(corpus)
+        except TypeError:
+            logger.warning("input corpus stream has no len(); counting documents")
+            lencorpus = sum(1 for _ in corpus)
+        if lencorpus == 0:
+            logger.warning("LdaMulticore.update_shared() called with an empty corpus")
+            return
+
+        self.state.numdocs += lencorpus
+
+        if not self.batch:
+            updatetype = "online"
+            updateafter = self.chunksize * self.workers
+        else:
+            updatetype = "batch"
+            updateafter = lencorpus
+        evalafter = min(lencorpus, (self.eval_every or 0) * updateafter)
+
+        updates_per_pass = max(1, lencorpus / updateafter)
+        logger.info(
+            "running %s LDA training over shared memory, %s topics, %i passes over the supplied corpus of "
+            "%i documents, updating every %i documents, evaluating every ~%i documents, "
+            "iterating %ix with a convergence threshold of %f",
+            updatetype, self.num_topics, self.passes, lencorpus, updateafter,
+            evalafter, self.iterations, self.gamma_threshold
+        )
+
+        if updates_per_pass * self.passes < 10:
+            logger.warning(
+                "too few updates, training might not converge; "
+                "consider increasing the number of passes or iterations to improve accuracy"
+            )
+
+        # shared buffers: the current topics, and one sstats slab per worker
+        shape = self.state.sstats.shape
+        itemsize = np.dtype(self.dtype).itemsize
+        expelogbeta_buffer = RawArray('b', int(np.prod(shape)) * itemsize)
+        sstats_buffer = RawArray('b', self.workers * int(np.prod(shape)) * itemsize)
+        shared_expelogbeta = np.frombuffer(expelogbeta_buffer, dtype=self.dtype).reshape(shape)
+        shared_sstats = np.frombuffer(sstats_buffer, dtype=self.dtype).reshape((self.workers,) + shape)
+        shared_expelogbeta[...] = self.expElogbeta
+
+        job_queue = Queue(maxsize=2 * self.workers)
+        result_queue = Queue()
+        worker_ids = Queue()
+        for worker_id in range(self.workers):
+            worker_ids.put(worker_id)
+
+        # rho is the "speed" of updating; TODO try other fncs
+        # pass_ + num_updates handles increasing the starting t for each pass,
+        # while allowing it to "reset" on the first pass of each update
+        def rho():
+            return pow(self.offset + pass_ + (self.num_updates / self.chunksize), -self.decay)
+
+        logger.info("training LDA model using %i processes and shared memory", self.workers)
+        pool = Pool(
+            self.workers, worker_e_step_shared,
+            (job_queue, result_queue, worker_ids, self, expelogbeta_buffer, sstats_buffer,)
+        )
+        for pass_ in range(self.passes):
+            queue_size, reallen = [0], 0
+            other = LdaState(self.eta, shape, dtype=self.dtype)
+
+            def reduce_and_update(force=False):
+                """
+                Wait for all outstanding jobs, sum up the workers' sstats slabs, update the LDA model
+                and publish the new topics to the workers.
+
+                """
+                while queue_size[0] > 0:
+                    other.numdocs += result_queue.get()
+                    queue_size[0] -= 1
+                if not other.numdocs:
+                    return
+                shared_sstats.sum(axis=0, out=other.sstats)
+                shared_sstats[...] = 0
+                self.do_mstep(rho(), other, pass_ > 0)
+                shared_expelogbeta[...] = self.expElogbeta
+                other.reset()
+                if self.eval_every is not None and (
+                        force or (self.eval_every != 0 and (self.num_updates / updateafter) % self.eval_every == 0)):
+                    self.log_perplexity(chunk, total_docs=lencorpus)
+
+            chunk_stream = utils.grouper(corpus, self.chunksize, as_numpy=chunks_as_numpy)
+            for chunk_no, chunk in enumerate(chunk_stream):
+                reallen += len(chunk)  # keep track of how many documents we've processed so far
+                # ship the chunk as a compact sparse matrix; blocks while the workers are busy
+                job = matutils.corpus2csc(
+                    chunk, num_terms=self.num_terms, num_docs=len(chunk), num_nnz=sum(len(doc) for doc in chunk),
+                    dtype=self.dtype
+                )
+                job_queue.put((chunk_no, job))
+                queue_size[0] += 1
+                logger.info(
+                    "PROGRESS: pass %i, dispatched chunk #%i = documents up to #%i/%i, outstanding queue size %i",
+                    pass_, chunk_no, chunk_no * self.chunksize + len(chunk), lencorpus, queue_size[0]
+                )
+                if not self.batch and queue_size[0] * self.chunksize >= updateafter:
+                    reduce_and_update()
+            # endfor single corpus pass
+
+            # wait for all outstanding jobs to finish
+            reduce_and_update(force=True)
+
+            if reallen != lencorpus:
+                raise RuntimeError("input corpus size changed during training (don't use generators as input)")
+        # endfor entire update
+
+        pool.terminate()
+
 
 def worker_e_step(input_queue, result_queue):
     """Perform E-step for each job.
@@ -340,3 +495,39 @@ def worker_e_step(input_queue, result_queue):
         result_queue.put(worker_lda.state)
         del worker_lda  # free up some memory
         logger.debug("result put")
+
+
+def worker_e_step_shared(input_queue, result_queue, worker_ids, worker_lda, expelogbeta_buffer, sstats_buffer):
+    """Perform E-step for each job, reading the topics from and accumulating sstats into shared memory.
+
+    Parameters
+    ----------
+    input_queue : queue of (int, scipy.sparse.csc_matrix)
+        Each element is a job characterized by its ID and the corpus chunk to be processed, of shape
+        (`num_terms`, `num_documents`).
+    result_queue : queue of int
+        After the worker finished the job, the number of processed documents is appended to this queue.
+    worker_ids : queue of int
+        Worker IDs to pick from; the worker accumulates its sufficient statistics into the slab with its ID.
+    worker_lda : :class:`~gensim.models.ldamulticore.LdaMulticore`
+        The model, only its parameters are used; the topics come from `expelogbeta_buffer`.
+    expelogbeta_buffer : :class:`multiprocessing.RawArray`
+        Shared buffer with the current `expElogbeta`, updated by the master after each M-step.
+    sstats_buffer : :class:`multiprocessing.RawArray`
+        Shared buffer with one sufficient statistics slab per worker, reduced by the master before each M-step.
+
+    """
+    worker_id = worker_ids.get()
+    shape = (worker_lda.num_topics, worker_lda.num_terms)
+    worker_lda.expElogbeta = np.frombuffer(expelogbeta_buffer, dtype=worker_lda.dtype).reshape(shape)
+    sstats = np.frombuffer(sstats_buffer, dtype=worker_lda.dtype).reshape((-1,) + shape)[worker_id]
+    # don't let all workers draw the same initial gammas
+    worker_lda.random_state = np.random.RandomState(worker_lda.random_state.randint(2 ** 30) + worker_id)
+    logger.debug("worker process #%i entering shared memory E-step loop", worker_id)
+    while True:
+        chunk_no, chunk = input_queue.get()
+        logger.debug("processing chunk #%i of %i documents", chunk_no, chunk.shape[1])
+        gamma, chunk_sstats = worker_lda.inference_batch(chunk, collect_sstats=True)
+        sstats += chunk_sstats
+        del chunk, chunk_sstats
+        result_queue.put(gamma.shape[0])
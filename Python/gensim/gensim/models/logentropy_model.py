@@ -19,6 +19,9 @@ References
 import logging
 import math
 
+import numpy as np
+from six import itervalues
+
 from gensim import interfaces, matutils, utils
 
 logger = logging.getLogger(__name__)
@@ -147,3 +150,38 @@ class LogEntropyModel(interfaces.TransformationABC):
         if self.normalize:
             vector = matutils.unitvec(vector)
         return vector
+
+    def transform_batch(self, docs):
+        """Get log entropy representation of a batch of documents, without a Python loop over the terms.
+
+        Parameters
+        ----------
+        docs : scipy.sparse.csr_matrix
+            Documents as rows, terms as columns.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Log-entropy vectors as rows.
+
+        """
+        entr = self._entropy_vector()
+        docs = matutils.resize_columns(docs, len(entr)).astype(np.float64)
+        docs.data = np.log(docs.data + 1) * entr[docs.indices]
+        docs.eliminate_zeros()  # unknown (new) terms
+        if self.normalize:
+            docs = matutils.unitvec_rows(docs)
+        return docs
+
+    def _entropy_vector(self):
+        """Get the global weights `self.entr` as a dense array indexed by term id, zero for unknown terms.
+
+        The array is cached, and rebuilt whenever `self.entr` is replaced or changes size.
+
+        """
+        cached = getattr(self, '_entr_cache', None)
+        if cached is None or cached[0] is not self.entr or cached[1] != len(self.entr):
+            vector = np.zeros(max(self.entr) + 1 if self.entr else 0, dtype=np.float64)
+            vector[list(self.entr)] = list(itervalues(self.entr))
+            cached = self._entr_cache = (self.entr, len(self.entr), vector)
+        return cached[2]
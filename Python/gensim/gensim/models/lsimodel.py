@@ -21,7 +21,7 @@ combination of which effectively and transparently allows building LSI models fo
 * corpora that cannot be even temporarily stored: each document can only be
   seen once and must be processed immediately (one-pass algorithm)
 * distributed computing for very large corpora, making use of a cluster of
-  machines
+  machines, or of several processes on a single machine (`workers`), with no network services involved
 
 Wall-clock `performance on the English Wikipedia <http://radimrehurek.com/gensim/wiki.html>`_
 (2G corpus positions, 3.2M documents, 100K features, 0.5G non-zero entries in the final TF-IDF matrix),
@@ -60,7 +60,11 @@ Examples
 """
 
 import logging
+import multiprocessing
 import sys
+import time
+from collections import deque
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 import scipy.linalg
@@ -355,7 +359,7 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
     def __init__(self, corpus=None, num_topics=200, id2word=None, chunksize=20000,
                  decay=1.0, distributed=False, onepass=True,
-                 power_iters=P2_EXTRA_ITERS, extra_samples=P2_EXTRA_DIMS, dtype=np.float64):
+                 power_iters=P2_EXTRA_ITERS, extra_samples=P2_EXTRA_DIMS, dtype=np.float64, workers=1):
         """Construct an `LsiModel` object.
 
         Either `corpus` or `id2word` must be supplied in order to train the model.
@@ -384,8 +388,16 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             Extra samples to be used besides the rank `k`. Can improve accuracy.
         dtype : type, optional
             Enforces a type for elements of the decomposed matrix.
+        workers : int, optional
+            Number of local worker processes decomposing the chunks of the one-pass algorithm in parallel,
+            see :meth:`~gensim.models.lsimodel.LsiModel.add_documents`. Unlike `distributed`, needs no Pyro4
+            or dispatcher/worker daemons. 1 (default) decomposes the chunks serially in this process.
+            With `onepass=False`, this is the number of threads of the multi-pass algorithm instead,
+            see :func:`~gensim.models.lsimodel.stochastic_svd`.
 
         """
+        if distributed and workers > 1:
+            raise ValueError("distributed LSA and local worker processes (workers > 1) are mutually exclusive")
         self.id2word = id2word
         self.num_topics = int(num_topics)
         self.chunksize = int(chunksize)
@@ -397,6 +409,7 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         self.onepass = onepass
         self.extra_samples, self.power_iters = extra_samples, power_iters
         self.dtype = dtype
+        self.workers = int(workers)
 
         if corpus is None and self.id2word is None:
             raise ValueError(
@@ -417,7 +430,14 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
 
         self.numworkers = 1
         if not distributed:
-            logger.info("using serial LSI version on this node")
+            if self.workers > 1:
+                logger.info(
+                    "using %s LSI version on this node, with %i workers",
+                    "multiprocess" if onepass else "multithreaded", self.workers
+                )
+                self.numworkers = self.workers
+            else:
+                logger.info("using serial LSI version on this node")
             self.dispatcher = None
         else:
             if not onepass:
@@ -461,6 +481,8 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         Training proceeds in chunks of `chunksize` documents at a time. The size of `chunksize` is a tradeoff
         between increased speed (bigger `chunksize`) vs. lower memory footprint (smaller `chunksize`).
         If the distributed mode is on, each chunk is sent to a different worker/computer.
+        With `workers` > 1, the one-pass algorithm decomposes the chunks in local worker processes instead,
+        see :meth:`~gensim.models.lsimodel.LsiModel._add_chunks_multiprocess`.
 
         """
         logger.info("updating model with new documents")
@@ -478,13 +500,18 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
                 update.u, update.s = stochastic_svd(
                     corpus, self.num_topics,
                     num_terms=self.num_terms, chunksize=chunksize,
-                    extra_dims=self.extra_samples, power_iters=self.power_iters, dtype=self.dtype
+                    extra_dims=self.extra_samples, power_iters=self.power_iters, dtype=self.dtype,
+                    workers=self.workers
                 )
                 self.projection.merge(update, decay=decay)
                 self.docs_processed += len(corpus) if hasattr(corpus, '__len__') else 0
             else:
                 # the one-pass algo
                 doc_no = 0
+                if self.workers > 1 and not self.dispatcher:
+                    doc_no = self._add_chunks_multiprocess(corpus, chunksize, decay)
+                    self.docs_processed += doc_no
+                    return
                 if self.dispatcher:
                     logger.info('initializing %s workers', self.numworkers)
                     self.dispatcher.reset()
@@ -532,6 +559,78 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             logger.info("processed sparse job of %i documents", corpus.shape[1])
             self.docs_processed += corpus.shape[1]
 
+    def _add_chunks_multiprocess(self, corpus, chunksize, decay):
+        """Update the model with the one-pass algorithm, decomposing the chunks in a pool of worker processes.
+
+        Each chunk is shipped to a worker as a compact sparse matrix, and the workers' chunk
+        :class:`~gensim.models.lsimodel.Projection` s are combined with
+        :meth:`~gensim.models.lsimodel.Projection.merge` in a tree reduction, as they arrive in corpus order.
+        At most `2 * workers` chunks are held in memory at any time.
+
+        The result matches the serial path, decay included: there, every chunk merge scales the existing
+        observations by `decay`, so when merging two blocks of consecutive chunks, the earlier block is weighted
+        by `decay` to the power of the number of chunks in the later block.
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, float)
+            Stream of document vectors.
+        chunksize : int
+            Number of documents in one chunk.
+        decay : float
+            Weight of existing observations relatively to new ones.
+
+        Returns
+        -------
+        int
+            Number of processed documents.
+
+        """
+        stack = []  # (projection, number of chunks in it); chunk counts strictly decrease towards the top
+
+        def push(update, num_chunks):
+            # binary-counter style tree reduction: merge equally sized neighbours as soon as possible
+            while stack and stack[-1][1] <= num_chunks:
+                previous, previous_chunks = stack.pop()
+                previous.merge(update, decay=decay ** num_chunks)
+                update, num_chunks = previous, previous_chunks + num_chunks
+            stack.append((update, num_chunks))
+
+        doc_no, pending = 0, deque()
+        pool = multiprocessing.Pool(self.workers)
+        try:
+            for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+                logger.info("preparing a new chunk of documents")
+                nnz = sum(len(doc) for doc in chunk)
+                job = matutils.corpus2csc(
+                    chunk, num_docs=len(chunk), num_terms=self.num_terms, num_nnz=nnz, dtype=self.dtype)
+                del chunk
+                doc_no += job.shape[1]
+                pending.append(pool.apply_async(
+                    _decompose_chunk, (job, self.num_terms, self.num_topics, self.extra_samples, self.power_iters,
+                                       self.dtype)
+                ))
+                del job
+                logger.debug("dispatched chunk #%i, documents up to #%i", chunk_no, doc_no)
+                while len(pending) >= 2 * self.workers:
+                    push(pending.popleft().get(), 1)
+            while pending:
+                push(pending.popleft().get(), 1)
+        finally:
+            pool.terminate()
+
+        update, num_chunks = None, 0
+        while stack:
+            previous, previous_chunks = stack.pop()
+            if update is not None:
+                previous.merge(update, decay=decay ** num_chunks)
+            update, num_chunks = previous, previous_chunks + num_chunks
+        if update is not None:
+            self.projection.merge(update, decay=decay ** num_chunks)
+        logger.info("processed documents up to #%s in %i chunks", doc_no, num_chunks)
+        self.print_topics(5)
+        return doc_no
+
     def __str__(self):
         """Get a human readable representation of model.
 
@@ -614,6 +713,30 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
             result = matutils.Dense2Corpus(topic_dist)
         return result
 
+    def transform_batch(self, docs, scaled=False):
+        """Get the latent representation of a batch of documents, with a single sparse * dense multiplication.
+
+        Parameters
+        ----------
+        docs : scipy.sparse.csr_matrix
+            Documents as rows, terms as columns.
+        scaled : bool, optional
+            If True - topics will be scaled by the inverse of singular values.
+
+        Returns
+        -------
+        numpy.ndarray
+            Latent representation, documents as rows and topics as columns.
+
+        """
+        assert self.projection.u is not None, "decomposition not initialized yet"
+        u = self.projection.u[:, :self.num_topics]
+        docs = matutils.resize_columns(docs, self.num_terms).astype(u.dtype)
+        topic_dist = np.asarray(docs.dot(u))  # x^T * u, for all documents at once
+        if scaled:
+            topic_dist /= self.projection.s[:self.num_topics]
+        return topic_dist
+
     def get_topics(self):
         """Get the topic vectors.
 
@@ -792,6 +915,8 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         """
         kwargs['mmap'] = kwargs.get('mmap', None)
         result = super(LsiModel, cls).load(fname, *args, **kwargs)
+        if not hasattr(result, 'workers'):
+            result.workers = 1
         projection_fname = utils.smart_extension(fname, '.projection')
         try:
             result.projection = super(LsiModel, cls).load(projection_fname, *args, **kwargs)
@@ -800,6 +925,33 @@ class LsiModel(interfaces.TransformationABC, basemodel.BaseTopicModel):
         return result
 
 
+def _decompose_chunk(job, num_terms, num_topics, extra_samples, power_iters, dtype):
+    """Decompose one chunk of documents, in a worker process of :class:`~gensim.models.lsimodel.LsiModel`.
+
+    Parameters
+    ----------
+    job : scipy.sparse.csc_matrix
+        Chunk of documents, of shape (`num_terms`, num_documents).
+    num_terms : int
+        Number of features (terms).
+    num_topics : int
+        Desired rank of the decomposition.
+    extra_samples : int
+        Extra samples to be used besides the rank `num_topics`.
+    power_iters : int
+        Number of power iteration steps to be used.
+    dtype : numpy.dtype
+        Enforces a type for elements of the decomposed matrix.
+
+    Returns
+    -------
+    :class:`~gensim.models.lsimodel.Projection`
+        Decomposition of the chunk.
+
+    """
+    return Projection(num_terms, num_topics, job, extra_dims=extra_samples, power_iters=power_iters, dtype=dtype)
+
+
 def print_debug(id2token, u, s, topics, num_words=10, num_neg=None):
     """Log the most salient words per topic.
 
@@ -858,8 +1010,163 @@ def print_debug(id2token, u, s, topics, num_words=10, num_neg=None):
         logger.info('topic #%s(%.3f): %s, ..., %s', topic, s[topic], ', '.join(pos), ', '.join(neg))
 
 
+def _iter_csc_chunks(corpus, num_terms, chunksize, dtype):
+    """Iterate over `corpus` in chunks of documents, as sparse matrices.
+
+    Parameters
+    ----------
+    corpus : {iterable of list of (int, float), scipy.sparse, :class:`~gensim.corpora.csrcorpus.CsrCorpus`,
+              :class:`~gensim.corpora.mmcorpus.ParallelMmReader`}
+        Input corpus. Chunks of a sparse matrix or of a :class:`~gensim.corpora.csrcorpus.CsrCorpus` are slices
+        of its arrays and need no decoding, a :class:`~gensim.corpora.mmcorpus.ParallelMmReader` is parsed in
+        blocks by its worker processes (the block sizes are given by its byte ranges, not by `chunksize`).
+    num_terms : int
+        Number of features, rows of the chunks.
+    chunksize : int
+        Number of documents per chunk.
+    dtype : numpy.dtype
+        Data type of the chunks.
+
+    Yields
+    ------
+    scipy.sparse.csc_matrix
+        Chunk of `num_terms` x documents.
+
+    """
+    if scipy.sparse.issparse(corpus):
+        corpus = corpus.tocsc()
+        assert corpus.shape[0] == num_terms, \
+            "mismatch in number of features: %i in sparse matrix vs. %i parameter" % (corpus.shape[0], num_terms)
+        for start in range(0, corpus.shape[1], chunksize):
+            chunk = corpus[:, start:start + chunksize]
+            yield chunk if chunk.dtype == dtype else chunk.astype(dtype)
+    elif hasattr(corpus, 'csr_matrix') and hasattr(corpus, 'iter_chunks'):
+        for block in corpus.iter_chunks(chunksize=chunksize):
+            if block.shape[1] != num_terms:
+                block = matutils.resize_columns(block, num_terms)
+            chunk = block.T  # documents = columns of sparse CSC, a view of the memory-mapped arrays
+            yield chunk if chunk.dtype == dtype else chunk.astype(dtype)
+    elif hasattr(corpus, 'iter_blocks') and corpus.is_splittable():
+        for _, chunk in corpus.iter_blocks(dtype=dtype):
+            if chunk.shape[0] != num_terms:
+                chunk = matutils.resize_columns(chunk.T, num_terms).T
+            yield chunk
+    else:
+        for chunk in utils.grouper(corpus, chunksize):
+            # construct the chunk as a sparse matrix, to minimize memory overhead
+            # definitely avoid materializing it as a dense (num_terms x chunksize) matrix!
+            yield matutils.corpus2csc(chunk, num_terms=num_terms, dtype=dtype)
+
+
+class _ChunkReader(object):
+    """Read a corpus in sparse chunks, once per pass of :func:`~gensim.models.lsimodel.stochastic_svd`.
+
+    The chunks decoded in the first pass are kept in memory, as long as they fit into `max_cache_bytes`,
+    so that the remaining passes don't have to read and decode the input again.
+
+    """
+    def __init__(self, corpus, num_terms, chunksize, dtype, max_cache_bytes=0):
+        self.corpus = corpus
+        self.num_terms = num_terms
+        self.chunksize = chunksize
+        self.dtype = dtype
+        self.max_cache_bytes = max_cache_bytes
+        # slicing an in-memory sparse matrix is cheaper than caching the slices
+        self.cache = [] if max_cache_bytes > 0 and not scipy.sparse.issparse(corpus) else None
+        self.cache_complete = False
+        self.num_docs = 0
+        self.decode_time = 0.0  # seconds spent waiting for the input in the last pass
+        self.from_cache = False  # was the last pass served from memory?
+
+    def __iter__(self):
+        self.decode_time = 0.0
+        self.from_cache = self.cache_complete
+        if self.cache_complete:
+            for chunk in self.cache:
+                yield chunk
+            return
+
+        cache, cache_bytes, doc_no = self.cache, 0, 0
+        chunks = _iter_csc_chunks(self.corpus, self.num_terms, self.chunksize, self.dtype)
+        while True:
+            start = time.time()
+            chunk = next(chunks, None)
+            self.decode_time += time.time() - start
+            if chunk is None:
+                break
+            logger.info('PROGRESS: at document #%i', doc_no)
+            doc_no += chunk.shape[1]
+            if cache is not None:
+                cache_bytes += chunk.data.nbytes + chunk.indices.nbytes + chunk.indptr.nbytes
+                if cache_bytes <= self.max_cache_bytes:
+                    cache.append(chunk)
+                else:
+                    logger.info(
+                        "input exceeds max_cache_bytes=%i, reading it again in every pass", self.max_cache_bytes
+                    )
+                    cache = self.cache = None
+            yield chunk
+        self.num_docs = doc_no
+        if cache is not None:
+            logger.info("keeping %i decoded chunks (%i bytes) in memory for the next passes", len(cache), cache_bytes)
+            self.cache_complete = True
+
+
+def _map_chunks(func, jobs, pool=None, workers=1):
+    """Apply `func` to each tuple of arguments from `jobs`, yielding the results in order.
+
+    With a `pool`, at most `2 * workers` jobs are in flight, so that the next jobs are read (and their chunks decoded)
+    while the pool threads multiply the previous ones.
+
+    """
+    if pool is None:
+        for job in jobs:
+            yield func(*job)
+        return
+
+    pending = deque()
+    for job in jobs:
+        pending.append(pool.apply_async(func, job))
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _range_product(chunk, o, out=None):
+    """Compute `chunk * o` for the action matrix, adding it to `out` if given."""
+    m, n = chunk.shape
+    if out is None:
+        out = np.zeros((m, o.shape[1]), dtype=o.dtype)
+    sparsetools.csc_matvecs(m, n, o.shape[1], chunk.indptr, chunk.indices, chunk.data, o.ravel(), out.ravel())
+    return out
+
+
+def _power_product(chunk, q):
+    """Compute `chunk * chunk.T * q` for a power iteration."""
+    tmp = chunk.T * q
+    return chunk * tmp
+
+
+def _covariance_product(chunk, qt):
+    """Compute `B * B.T` for `B = qt * chunk`, for the covariance matrix."""
+    b = qt * chunk  # dense * sparse matrix multiply
+    return np.dot(b, b.T)  # TODO should call the BLAS routine SYRK, but there is no SYRK wrapper in scipy :(
+
+
+def _record_pass(timings, name, start, decode_time=0.0, cached=False):
+    """Log how long a pass over the input took, appending the timing to `timings` if given."""
+    timing = {'pass': name, 'seconds': time.time() - start, 'decode_seconds': decode_time, 'cached': cached}
+    logger.info(
+        "%s took %.2fs, %.2fs of which waiting for the input%s", name, timing['seconds'], timing['decode_seconds'],
+        " (from memory)" if timing['cached'] else ""
+    )
+    if timings is not None:
+        timings.append(timing)
+
+
 def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
-                   power_iters=0, dtype=np.float64, eps=1e-6):
+                   power_iters=0, dtype=np.float64, eps=1e-6, workers=1, max_cache_bytes=0, timings=None):
     """Run truncated Singular Value Decomposition (SVD) on a sparse input.
 
     Parameters
@@ -882,14 +1189,29 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
         Enforces a type for elements of the decomposed matrix.
     eps: float, optional
         Percentage of the spectrum's energy to be discarded.
+    workers : int, optional
+        Number of threads multiplying the chunks of the input, while the next chunks are being read and decoded.
+        1 (default) multiplies them in this thread.
+    max_cache_bytes : int, optional
+        Memory budget for the decoded input, in bytes. If all chunks of the input fit, they are decoded only once
+        and kept in memory for the power iterations and the second phase, instead of reading the input again.
+        0 (default) reads the input in every pass.
+    timings : list, optional
+        If given, a dict is appended to it for every pass over the input, with the name of the pass ('pass'),
+        its wall-clock time ('seconds'), the time spent waiting for the input ('decode_seconds') and whether
+        the input came from the decoded chunks kept in memory by `max_cache_bytes` ('cached').
 
     Notes
     -----
     The corpus may be larger than RAM (iterator of vectors), if `corpus` is a `scipy.sparse.csc` instead,
-    it is assumed the whole corpus fits into core memory and a different (more efficient) code path is chosen.
-    This may return less than the requested number of top `rank` factors, in case the input itself is of lower rank.
-    The `extra_dims` (oversampling) and especially `power_iters` (power iterations) parameters affect accuracy of the
-    decomposition.
+    it is assumed the whole corpus fits into core memory and a different (more efficient) code path is chosen,
+    unless `workers` > 1. This may return less than the requested number of top `rank` factors, in case the input
+    itself is of lower rank. The `extra_dims` (oversampling) and especially `power_iters` (power iterations)
+    parameters affect accuracy of the decomposition.
+
+    The input can also be a memory-mapped :class:`~gensim.corpora.csrcorpus.CsrCorpus` or a
+    :class:`~gensim.corpora.mmcorpus.ParallelMmReader`, whose chunks are read as sparse matrices, without
+    creating Python objects for the individual documents.
 
     This algorithm uses `2 + power_iters` passes over the input data. In case you can only afford a single pass,
     set `onepass=True` in :class:`~gensim.models.lsimodel.LsiModel` and avoid using this function directly.
@@ -919,7 +1241,8 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
     y = np.zeros(dtype=dtype, shape=(num_terms, samples))
     logger.info("1st phase: constructing %s action matrix", str(y.shape))
 
-    if scipy.sparse.issparse(corpus):
+    if scipy.sparse.issparse(corpus) and workers <= 1:
+        pass_start = time.time()
         m, n = corpus.shape
         assert num_terms == m, "mismatch in number of features: %i in sparse matrix vs. %i parameter" % (m, num_terms)
         o = np.random.normal(0.0, 1.0, (n, samples)).astype(y.dtype)  # draw a random gaussian matrix
@@ -932,74 +1255,84 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
         if y.dtype != dtype:
             y = y.astype(dtype)
 
+        _record_pass(timings, "1st phase", pass_start)
+
         logger.info("orthonormalizing %s action matrix", str(y.shape))
         y = [y]
         q, _ = matutils.qr_destroy(y)  # orthonormalize the range
 
         logger.debug("running %i power iterations", power_iters)
-        for _ in range(power_iters):
+        for power_iter in range(power_iters):
+            pass_start = time.time()
             q = corpus.T * q
             q = [corpus * q]
+            _record_pass(timings, "power iteration #%i" % (power_iter + 1), pass_start)
             q, _ = matutils.qr_destroy(q)  # orthonormalize the range after each power iteration step
-    else:
-        num_docs = 0
-        for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
-            logger.info('PROGRESS: at document #%i', (chunk_no * chunksize))
-            # construct the chunk as a sparse matrix, to minimize memory overhead
-            # definitely avoid materializing it as a dense (num_terms x chunksize) matrix!
-            s = sum(len(doc) for doc in chunk)
-            chunk = matutils.corpus2csc(chunk, num_terms=num_terms, dtype=dtype)  # documents = columns of sparse CSC
-            m, n = chunk.shape
-            assert m == num_terms
-            assert n <= chunksize  # the very last chunk of A is allowed to be smaller in size
-            num_docs += n
-            logger.debug("multiplying chunk * gauss")
-            o = np.random.normal(0.0, 1.0, (n, samples)).astype(dtype)  # draw a random gaussian matrix
-            sparsetools.csc_matvecs(
-                m, n, samples, chunk.indptr, chunk.indices,  # y = y + chunk * o
-                chunk.data, o.ravel(), y.ravel()
-            )
-            del chunk, o
-        y = [y]
-        q, _ = matutils.qr_destroy(y)  # orthonormalize the range
-
-        for power_iter in range(power_iters):
-            logger.info("running power iteration #%i", power_iter + 1)
-            yold = q.copy()
-            q[:] = 0.0
-            for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
-                logger.info('PROGRESS: at document #%i/%i', chunk_no * chunksize, num_docs)
-                # documents = columns of sparse CSC
-                chunk = matutils.corpus2csc(chunk, num_terms=num_terms, dtype=dtype)
-                tmp = chunk.T * yold
-                tmp = chunk * tmp
-                del chunk
-                q += tmp
-            del yold
-            q = [q]
-            q, _ = matutils.qr_destroy(q)  # orthonormalize the range
 
-    qt = q[:, :samples].T.copy()
-    del q
+        qt = q[:, :samples].T.copy()
+        del q
 
-    if scipy.sparse.issparse(corpus):
+        pass_start = time.time()
         b = qt * corpus
+        _record_pass(timings, "2nd phase", pass_start)
         logger.info("2nd phase: running dense svd on %s matrix", str(b.shape))
         u, s, vt = scipy.linalg.svd(b, full_matrices=False)
         del b, vt
     else:
-        # second phase: construct the covariance matrix X = B * B.T, where B = Q.T * A
-        # again, construct X incrementally, in chunks of `chunksize` documents from the streaming
-        # input corpus A, to avoid using O(number of documents) memory
-        x = np.zeros(shape=(qt.shape[0], qt.shape[0]), dtype=dtype)
-        logger.info("2nd phase: constructing %s covariance matrix", str(x.shape))
-        for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
-            logger.info('PROGRESS: at document #%i/%i', chunk_no * chunksize, num_docs)
-            chunk = matutils.corpus2csc(chunk, num_terms=num_terms, dtype=qt.dtype)
-            b = qt * chunk  # dense * sparse matrix multiply
-            del chunk
-            x += np.dot(b, b.T)  # TODO should call the BLAS routine SYRK, but there is no SYRK wrapper in scipy :(
-            del b
+        # the input is read in chunks of `chunksize` documents (much faster than going one-by-one and more memory
+        # friendly than processing all documents at once); with `workers` > 1, the chunk products run in a thread
+        # pool (scipy.sparse and BLAS release the GIL), overlapped with reading the next chunks
+        reader = _ChunkReader(corpus, num_terms, chunksize, dtype, max_cache_bytes=max_cache_bytes)
+        pool = ThreadPool(workers) if workers > 1 else None
+        try:
+            pass_start = time.time()
+            # in a single thread, accumulate straight into `y`; draw the random gaussian matrices in input order
+            # in this thread, so the result doesn't depend on `workers`
+            out = y if pool is None else None
+            jobs = (
+                (chunk, np.random.normal(0.0, 1.0, (chunk.shape[1], samples)).astype(dtype), out)
+                for chunk in reader
+            )
+            for product in _map_chunks(_range_product, jobs, pool, workers):
+                if product is not y:
+                    y += product
+            num_docs = reader.num_docs
+            _record_pass(timings, "1st phase", pass_start, reader.decode_time, reader.from_cache)
+
+            y = [y]
+            q, _ = matutils.qr_destroy(y)  # orthonormalize the range
+
+            for power_iter in range(power_iters):
+                logger.info("running power iteration #%i", power_iter + 1)
+                pass_start = time.time()
+                yold = q.copy()
+                q[:] = 0.0
+                for product in _map_chunks(_power_product, ((chunk, yold) for chunk in reader), pool, workers):
+                    q += product
+                del yold
+                _record_pass(
+                    timings, "power iteration #%i" % (power_iter + 1), pass_start,
+                    reader.decode_time, reader.from_cache
+                )
+                q = [q]
+                q, _ = matutils.qr_destroy(q)  # orthonormalize the range
+
+            qt = q[:, :samples].T.copy()
+            del q
+
+            # second phase: construct the covariance matrix X = B * B.T, where B = Q.T * A
+            # again, construct X incrementally, in chunks of `chunksize` documents from the streaming
+            # input corpus A, to avoid using O(number of documents) memory
+            x = np.zeros(shape=(qt.shape[0], qt.shape[0]), dtype=dtype)
+            logger.info("2nd phase: constructing %s covariance matrix from %i documents", str(x.shape), num_docs)
+            pass_start = time.time()
+            for product in _map_chunks(_covariance_product, ((chunk, qt) for chunk in reader), pool, workers):
+                x += product
+            _record_pass(timings, "2nd phase", pass_start, reader.decode_time, reader.from_cache)
+        finally:
+            if pool is not None:
+                pool.terminate()
+            del reader
 
         # now we're ready to compute decomposition of the small matrix X
         logger.info("running dense decomposition on %s covariance matrix", str(x.shape))
@@ -6,6 +6,8 @@
 
 import logging
 
+import numpy as np
+
 from gensim import interfaces, matutils
 
 logger = logging.getLogger(__name__)
@@ -97,3 +99,19 @@ class NormModel(interfaces.TransformationABC):
 
         """
         return self.normalize(bow)
+
+    def transform_batch(self, docs):
+        """Normalize a batch of documents at once.
+
+        Parameters
+        ----------
+        docs : scipy.sparse.csr_matrix
+            Documents as rows.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Normalized documents as rows.
+
+        """
+        return matutils.unitvec_rows(docs.astype(np.float64), self.norm)
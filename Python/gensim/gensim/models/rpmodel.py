@@ -40,6 +40,7 @@ References
 import logging
 
 import numpy as np
+import scipy.sparse
 
 from gensim import interfaces, matutils, utils
 
@@ -140,12 +141,7 @@ class RpModel(interfaces.TransformationABC):
         if is_corpus:
             return self._apply(bow)
 
-        if getattr(self, 'freshly_loaded', False):
-            # This is a hack to work around a bug in np, where a FORTRAN-order array
-            # unpickled from disk segfaults on using it.
-            self.freshly_loaded = False
-            self.projection = self.projection.copy('F')  # simply making a fresh copy fixes the broken array
-
+        self._fix_loaded_projection()
         vec = matutils.sparse2full(bow, self.num_terms).reshape(self.num_terms, 1) / np.sqrt(self.num_topics)
         vec = np.asfortranarray(vec, dtype=np.float32)
         topic_dist = np.dot(self.projection, vec)  # (k, d) * (d, 1) = (k, 1)
@@ -154,6 +150,34 @@ class RpModel(interfaces.TransformationABC):
             if np.isfinite(topicvalue) and not np.allclose(topicvalue, 0.0)
         ]
 
+    def transform_batch(self, docs):
+        """Get random-projection representation of a batch of documents, with a single matrix multiplication.
+
+        Parameters
+        ----------
+        docs : scipy.sparse.csr_matrix
+            Documents as rows, terms as columns.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Projected documents as rows, without the non-finite and (close to) zero values.
+
+        """
+        self._fix_loaded_projection()
+        docs = matutils.resize_columns(docs, self.num_terms).astype(np.float32) / np.sqrt(self.num_topics)
+        topic_dist = np.asarray(docs.dot(self.projection.T))  # (n, d) * (d, k) = (n, k)
+        topic_dist[~np.isfinite(topic_dist) | np.isclose(topic_dist, 0.0)] = 0.0
+        return scipy.sparse.csr_matrix(topic_dist)
+
+    def _fix_loaded_projection(self):
+        """Make a fresh copy of the projection matrix, if the model was just unpickled."""
+        if getattr(self, 'freshly_loaded', False):
+            # This is a hack to work around a bug in np, where a FORTRAN-order array
+            # unpickled from disk segfaults on using it.
+            self.freshly_loaded = False
+            self.projection = self.projection.copy('F')  # simply making a fresh copy fixes the broken array
+
     def __setstate__(self, state):
         """Sets the internal state and updates freshly_loaded to True, called when unpicked.
 
@@ -17,7 +17,7 @@ import logging
 from functools import partial
 
 from gensim import interfaces, matutils, utils
-from six import iteritems
+from six import iteritems, itervalues
 
 import numpy as np
 
@@ -127,6 +127,10 @@ def precompute_idfs(wglobal, dfs, total_docs):
     """
     # not strictly necessary and could be computed on the fly in TfidfModel__getitem__.
     # this method is here just to speed things up a little.
+    if wglobal is df2idf and dfs:
+        # the default weighting works on whole arrays, no need to call it term by term
+        termids, docfreqs = zip(*iteritems(dfs))
+        return dict(zip(termids, df2idf(np.array(docfreqs, dtype=np.float64), total_docs)))
     return {termid: wglobal(df, total_docs) for termid, df in iteritems(dfs)}
 
 
@@ -158,6 +162,46 @@ def smartirs_wlocal(tf, local_scheme):
         return (1 + np.log2(tf)) / (1 + np.log2(tf.mean(axis=0)))
 
 
+def smartirs_wlocal_csr(docs, local_scheme):
+    """Calculate local term weights for all documents of a sparse matrix at once, in place.
+
+    Vectorized equivalent of calling :func:`~gensim.models.tfidfmodel.smartirs_wlocal` on the term frequencies
+    of each document (row) separately.
+
+    Parameters
+    ----------
+    docs : scipy.sparse.csr_matrix
+        Term frequencies, documents as rows. Must have a floating point dtype.
+    local_scheme : {'n', 'l', 'a', 'b', 'L'}
+        Local transformation scheme.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        `docs`, with local weights instead of the term frequencies.
+
+    """
+    tf = docs.data
+    row_lengths = np.diff(docs.indptr)
+    if local_scheme == "n":
+        pass
+    elif local_scheme == "l":
+        docs.data = 1 + np.log2(tf)
+    elif local_scheme == "a":
+        row_max = np.zeros(docs.shape[0], dtype=tf.dtype)
+        nonempty = row_lengths > 0
+        if len(tf):
+            row_max[nonempty] = np.maximum.reduceat(tf, docs.indptr[:-1][nonempty])
+        docs.data = 0.5 + (0.5 * tf / np.repeat(row_max, row_lengths))
+    elif local_scheme == "b":
+        docs.data = (tf != 0).astype(tf.dtype)
+    elif local_scheme == "L":
+        row_sums = np.bincount(np.repeat(np.arange(docs.shape[0]), row_lengths), weights=tf, minlength=docs.shape[0])
+        row_means = np.where(row_lengths > 0, row_sums / np.maximum(row_lengths, 1), 1.0)  # 1.0 for empty rows
+        docs.data = (1 + np.log2(tf)) / np.repeat(1 + np.log2(row_means), row_lengths)
+    return docs
+
+
 def smartirs_wglobal(docfreq, totaldocs, global_scheme):
     """Calculate global document weight based on the weighting scheme specified in `global_scheme`.
 
@@ -217,6 +261,31 @@ def smartirs_normalize(x, norm_scheme, return_norm=False):
         return matutils.unitvec(x, return_norm=return_norm)
 
 
+def _count_document_frequencies(corpus):
+    """Count in how many documents of `corpus` each term appears.
+
+    Parameters
+    ----------
+    corpus : iterable of iterable of (int, int)
+        Input corpus.
+
+    Returns
+    -------
+    (dict of (int, int), int, int)
+        Document frequencies `{term_id: number of documents}`, number of documents and number of non-zeros.
+
+    """
+    dfs = {}
+    numnnz, docno = 0, -1
+    for docno, bow in enumerate(corpus):
+        if docno % 10000 == 0:
+            logger.info("PROGRESS: processing document #%i", docno)
+        numnnz += len(bow)
+        for termid, _ in bow:
+            dfs[termid] = dfs.get(termid, 0) + 1
+    return dfs, docno + 1, numnnz
+
+
 class TfidfModel(interfaces.TransformationABC):
     """Objects of this class realize the transformation between word-document co-occurrence matrix (int)
     into a locally/globally weighted TF-IDF matrix (positive floats).
@@ -238,7 +307,7 @@ class TfidfModel(interfaces.TransformationABC):
 
     """
     def __init__(self, corpus=None, id2word=None, dictionary=None, wlocal=utils.identity,
-                 wglobal=df2idf, normalize=True, smartirs=None, pivot=None, slope=0.65):
+                 wglobal=df2idf, normalize=True, smartirs=None, pivot=None, slope=0.65, decay=1.0):
         r"""Compute TF-IDF by multiplying a local component (term frequency) with a global component
         (inverse document frequency), and normalizing the resulting documents to unit length.
         Formula for non-normalized weight of term :math:`i` in document :math:`j` in a corpus of :math:`D` documents
@@ -305,6 +374,11 @@ class TfidfModel(interfaces.TransformationABC):
         slope : float, optional
             Parameter required by pivoted document length normalization which determines the slope to which
             the `old normalization` can be tilted. This parameter only works when pivot is defined.
+        decay : float, optional
+            Weight of the document frequencies collected so far relatively to new ones, whenever documents
+            are added with :meth:`~gensim.models.tfidfmodel.TfidfModel.add_documents`. The default 1.0 keeps exact
+            counts; a value like 0.9 turns the frequencies into exponentially time-decayed ones, e.g. for a rolling
+            index updated daily.
 
         """
         self.id2word = id2word
@@ -313,6 +387,7 @@ class TfidfModel(interfaces.TransformationABC):
         self.smartirs = smartirs
         self.slope = slope
         self.pivot = pivot
+        self.decay = decay
         self.eps = 1e-12
 
         # If smartirs is not None, override wlocal, wglobal and normalize
@@ -361,6 +436,8 @@ class TfidfModel(interfaces.TransformationABC):
             model.slope = 0.65
             logger.info('older version of %s loaded without slope arg', cls.__name__)
             logger.info('Setting slope to %s.', model.slope)
+        if not hasattr(model, 'decay'):
+            model.decay = 1.0
         return model
 
     def __str__(self):
@@ -376,27 +453,53 @@ class TfidfModel(interfaces.TransformationABC):
 
         """
         logger.info("collecting document frequencies")
-        dfs = {}
-        numnnz, docno = 0, -1
-
-        for docno, bow in enumerate(corpus):
-            if docno % 10000 == 0:
-                logger.info("PROGRESS: processing document #%i", docno)
-            numnnz += len(bow)
-            for termid, _ in bow:
-                dfs[termid] = dfs.get(termid, 0) + 1
         # keep some stats about the training corpus
-        self.num_docs = docno + 1
-        self.num_nnz = numnnz
-        self.dfs = dfs
+        self.dfs, self.num_docs, self.num_nnz = _count_document_frequencies(corpus)
         # and finally compute the idf weights
-        n_features = max(dfs) if dfs else 0
+        n_features = max(self.dfs) if self.dfs else 0
         logger.info(
             "calculating IDF weights for %i documents and %i features (%i matrix non-zeros)",
             self.num_docs, n_features, self.num_nnz
         )
         self.idfs = precompute_idfs(self.wglobal, self.dfs, self.num_docs)
 
+    def add_documents(self, corpus, decay=None):
+        """Update the document frequencies with new documents, without another pass over the documents seen so far.
+
+        The document frequencies of `corpus` are merged into `self.dfs` and the idf weights are recomputed
+        from the merged frequencies. Because the total number of documents changes, all idfs change, but
+        recomputing them only takes the frequency table, not the old documents.
+
+        Parameters
+        ----------
+        corpus : iterable of iterable of (int, int)
+            New documents.
+        decay : float, optional
+            Weight of the document frequencies (and the number of documents) collected so far relatively
+            to the new ones, will use `self.decay` if not specified.
+
+        """
+        if decay is None:
+            decay = self.decay
+
+        logger.info("collecting document frequencies of new documents")
+        new_dfs, new_num_docs, new_num_nnz = _count_document_frequencies(corpus)
+
+        dfs = getattr(self, 'dfs', None) or {}
+        num_docs, num_nnz = self.num_docs or 0, self.num_nnz or 0
+        if decay != 1.0:
+            dfs = {termid: df * decay for termid, df in iteritems(dfs)}
+            num_docs, num_nnz = num_docs * decay, num_nnz * decay
+        for termid, df in iteritems(new_dfs):
+            dfs[termid] = dfs.get(termid, 0) + df
+
+        self.dfs, self.num_docs, self.num_nnz = dfs, num_docs + new_num_docs, num_nnz + new_num_nnz
+        logger.info(
+            "updating IDF weights with %i new documents and %i new features, now %s documents and %i features",
+            new_num_docs, len(new_dfs), self.num_docs, len(self.dfs)
+        )
+        self.idfs = precompute_idfs(self.wglobal, self.dfs, self.num_docs)
+
     def __getitem__(self, bow, eps=1e-12):
         """Get the tf-idf representation of an input vector and/or corpus.
 
@@ -455,3 +558,109 @@ class TfidfModel(interfaces.TransformationABC):
                 if abs(weight / float(pivoted_norm)) > self.eps
             ]
         return norm_vector
+
+    def transform_batch(self, docs, eps=1e-12):
+        """Get the tf-idf representation of a batch of documents.
+
+        The weighting runs on the whole batch at once: local weighting as ufuncs on the non-zero values,
+        global weighting as a multiplication by the idf of each value's term, and normalization
+        (regular or pivoted) of the rows in place. All SMART schemes are supported, and so are custom `wlocal`
+        functions which are numpy ufuncs. Any other custom `wlocal` or `normalize` function falls back to
+        :meth:`~gensim.models.tfidfmodel.TfidfModel.__getitem__`, one document at a time.
+
+        Parameters
+        ----------
+        docs : scipy.sparse.csr_matrix
+            Documents as rows, terms as columns.
+        eps : float
+            Threshold value, will remove all position that have tfidf-value less than `eps`.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            TfIdf vectors as rows.
+
+        """
+        schemes = self._batch_schemes()
+        if schemes is None:
+            return self._transform_batch_by_document(docs, eps)
+        local_scheme, norm_scheme = schemes
+
+        self.eps = eps
+        docs = docs.tocsr().astype(np.float64)  # always a copy, the weighting happens in place
+        row_lengths = np.diff(docs.indptr)
+
+        # local weighting, over all terms of the documents (known or not, as in __getitem__)
+        if callable(local_scheme):
+            docs.data = local_scheme(docs.data)
+        else:
+            smartirs_wlocal_csr(docs, local_scheme)
+
+        # global weighting; unknown (new) terms and terms with (near) zero idf get no weight at all
+        idfs = self._idf_vector()
+        weights = np.zeros(len(docs.data), dtype=np.float64)
+        known = docs.indices < len(idfs)
+        weights[known] = idfs[docs.indices[known]]
+        docs.data *= weights
+        docs.data[np.abs(weights) <= self.eps] = 0.0
+
+        # normalization
+        if self.pivot is not None:
+            old_norms = np.sqrt(np.bincount(
+                np.repeat(np.arange(docs.shape[0]), row_lengths), weights=docs.data ** 2, minlength=docs.shape[0]
+            ))
+            pivoted_norms = (1 - self.slope) * self.pivot + self.slope * old_norms
+            docs.data /= np.repeat(pivoted_norms, row_lengths)
+        elif norm_scheme == 'c':
+            docs = matutils.unitvec_rows(docs)
+        docs.data[np.abs(docs.data) <= self.eps] = 0.0
+        docs.eliminate_zeros()
+        return docs
+
+    def _batch_schemes(self):
+        """Resolve the local weighting and the normalization of the model for
+        :meth:`~gensim.models.tfidfmodel.TfidfModel.transform_batch`.
+
+        Returns
+        -------
+        (str or numpy.ufunc, str) or None
+            SMART local weighting letter (or a ufunc to apply to the term frequencies) and normalization letter,
+            or None if the model uses custom functions which can only be applied one document at a time.
+
+        """
+        if self.smartirs is not None:
+            local_scheme, _, norm_scheme = resolve_weights(self.smartirs)
+            return local_scheme, norm_scheme
+
+        if self.wlocal is utils.identity:
+            local_scheme = 'n'
+        elif isinstance(self.wlocal, np.ufunc):
+            local_scheme = self.wlocal
+        else:
+            return None
+
+        if self.normalize is True or self.normalize is matutils.unitvec:
+            norm_scheme = 'c'
+        elif self.normalize is False or self.normalize is utils.identity:
+            norm_scheme = 'n'
+        else:
+            return None
+        return local_scheme, norm_scheme
+
+    def _transform_batch_by_document(self, docs, eps):
+        """Apply :meth:`~gensim.models.tfidfmodel.TfidfModel.__getitem__` to the rows of `docs` one by one."""
+        transformed = [self.__getitem__(bow, eps=eps) for bow in matutils.Sparse2Corpus(docs, documents_columns=False)]
+        return matutils.corpus2csc(transformed, num_terms=docs.shape[1]).T
+
+    def _idf_vector(self):
+        """Get the idf weights `self.idfs` as a dense array indexed by term id, zero for unknown terms.
+
+        The array is cached, and rebuilt whenever `self.idfs` is replaced or changes size.
+
+        """
+        cached = getattr(self, '_idf_cache', None)
+        if cached is None or cached[0] is not self.idfs or cached[1] != len(self.idfs):
+            vector = np.zeros(max(self.idfs) + 1 if self.idfs else 0, dtype=np.float64)
+            vector[list(self.idfs)] = list(itervalues(self.idfs))
+            cached = self._idf_cache = (self.idfs, len(self.idfs), vector)
+        return cached[2]
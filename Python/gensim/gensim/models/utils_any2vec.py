@@ -7,6 +7,7 @@
 """General functions used for any2vec models."""
 
 import logging
+import struct
 import numpy as np
 from gensim import utils
 
@@ -17,6 +18,12 @@ from six import iteritems
 
 logger = logging.getLogger(__name__)
 
+MMAP_FORMAT_MAGIC = b'GENSIMKV'
+MMAP_FORMAT_VERSION = 1
+# magic, version, vocab_size, vector_size and the offsets of the vectors, counts, word offsets, sorted ids and words
+MMAP_FORMAT_HEADER = struct.Struct('<8sQQQQQQQQ')
+MMAP_FORMAT_ALIGN = 64
+
 try:
     from gensim.models._utils_any2vec import ft_hash as _ft_hash, compute_ngrams as _compute_ngrams
 except ImportError:
@@ -233,3 +240,116 @@ def _load_word2vec_format(cls, fname, fvocab=None, binary=False, encoding='utf8'
 
     logger.info("loaded %s matrix from %s", result.vectors.shape, fname)
     return result
+
+
+def _save_mmap_format(fname, vocab, vectors):
+    """Store vectors and vocabulary into a single file, that can be memory-mapped by :func:`_load_mmap_format`.
+
+    The file consists of a fixed-size header followed by these sections, each aligned to 64 bytes:
+
+    * the vectors, as a C-contiguous `float32` matrix of shape `(vocab_size, vector_size)`,
+    * word counts, as `int64` (-1 for unknown counts),
+    * `vocab_size + 1` offsets (`uint64`) of the words within the word block, in index order,
+    * word indices (`uint64`) ordered by the utf8 encoding of their word, for binary search,
+    * the word block: all utf8-encoded words concatenated, in index order.
+
+    All numbers are stored little-endian.
+
+    Parameters
+    ----------
+    fname : str
+        The file path used to save the vectors in.
+    vocab : dict
+        The vocabulary of words, `word => Vocab`.
+    vectors : numpy.ndarray
+        The vectors to be stored.
+
+    """
+    vocab_size, vector_size = vectors.shape
+    if len(vocab) != vocab_size:
+        raise ValueError("vocabulary size %i doesn't match vectors shape %s" % (len(vocab), vectors.shape))
+    logger.info("storing %sx%s projection weights into %s", vocab_size, vector_size, fname)
+
+    index2word = [None] * vocab_size
+    counts = np.empty(vocab_size, dtype='<i8')
+    for word, vocab_ in iteritems(vocab):
+        index2word[vocab_.index] = utils.to_utf8(word)
+        counts[vocab_.index] = -1 if vocab_.count is None else vocab_.count
+    word_offsets = np.zeros(vocab_size + 1, dtype='<u8')
+    np.cumsum([len(word) for word in index2word], out=word_offsets[1:])
+    sorted_ids = np.array(sorted(range(vocab_size), key=index2word.__getitem__), dtype='<u8')
+
+    sections = [
+        ascontiguousarray(vectors, dtype='<f4'), counts, word_offsets, sorted_ids,
+        np.frombuffer(b''.join(index2word), dtype=np.uint8),
+    ]
+    offsets, position = [], MMAP_FORMAT_HEADER.size
+    for section in sections:
+        position += -position % MMAP_FORMAT_ALIGN
+        offsets.append(position)
+        position += section.nbytes
+
+    with utils.smart_open(fname, 'wb') as fout:
+        fout.write(MMAP_FORMAT_HEADER.pack(MMAP_FORMAT_MAGIC, MMAP_FORMAT_VERSION, vocab_size, vector_size, *offsets))
+        position = MMAP_FORMAT_HEADER.size
+        for offset, section in zip(offsets, sections):
+            fout.write(b'\0' * (offset - position))
+            fout.write(section.tostring())
+            position = offset + section.nbytes
+
+
+def _load_mmap_format(cls, fname, mmap='r'):
+    """Open a file stored by :func:`_save_mmap_format`.
+
+    Nothing is parsed or copied: the vectors are a :class:`numpy.memmap` view into the file and the vocabulary is
+    looked up lazily, so opening takes constant time regardless of the vocabulary size, and all processes
+    that open the same file share a single copy of it in the OS page cache.
+
+    Parameters
+    ----------
+    cls : type
+        The :class:`~gensim.models.keyedvectors.WordEmbeddingsKeyedVectors` subclass to instantiate.
+    fname : str
+        The file path to the saved file.
+    mmap : {'r', 'c', 'r+'}, optional
+        Memory-map mode, see :class:`numpy.memmap`. Use 'c' (copy-on-write) to be able to modify the vectors
+        in memory, e.g. to normalize them in-place, without touching the file.
+
+    Returns
+    -------
+    object
+        Returns the loaded model as an instance of :class:`cls`. Its `vocab` and `index2word` are read-only.
+
+    """
+    from gensim.models.keyedvectors import MmapVocab, MmapIndex2Word
+    with open(fname, 'rb') as fin:
+        header = fin.read(MMAP_FORMAT_HEADER.size)
+    if len(header) != MMAP_FORMAT_HEADER.size:
+        raise ValueError("%s is not a KeyedVectors mmap file: truncated header" % fname)
+    magic, version, vocab_size, vector_size, vectors_offset, counts_offset, word_offsets_offset, sorted_ids_offset, \
+        words_offset = MMAP_FORMAT_HEADER.unpack(header)
+    if magic != MMAP_FORMAT_MAGIC:
+        raise ValueError("%s is not a KeyedVectors mmap file" % fname)
+    if version > MMAP_FORMAT_VERSION:
+        raise ValueError("unsupported KeyedVectors mmap file version %i in %s" % (version, fname))
+
+    def section(dtype, offset, shape):
+        if not np.prod(shape):
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(fname, dtype=dtype, mode=mmap, offset=offset, shape=shape)
+
+    logger.info("loading projection weights from %s with mmap=%s", fname, mmap)
+    word_offsets = section('<u8', word_offsets_offset, (vocab_size + 1,))
+    vocab = MmapVocab(
+        word_offsets=word_offsets,
+        word_bytes=section(np.uint8, words_offset, (int(word_offsets[-1]),)),
+        sorted_ids=section('<u8', sorted_ids_offset, (vocab_size,)),
+        counts=section('<i8', counts_offset, (vocab_size,)),
+    )
+    result = cls(vector_size)
+    result.vector_size = vector_size
+    result.vectors = section('<f4', vectors_offset, (vocab_size, vector_size))
+    result.vocab = vocab
+    result.index2word = MmapIndex2Word(vocab)
+    logger.info("loaded %s matrix from %s", result.vectors.shape, fname)
+    return result
@@ -124,9 +124,10 @@ import os
 import heapq
 from timeit import default_timer
 from copy import deepcopy
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
 import itertools
+import multiprocessing
 import warnings
 
 from gensim.utils import keep_vocab_item, call_on_class_only
@@ -140,7 +141,8 @@ except ImportError:
 
 from numpy import exp, dot, zeros, random, dtype, float32 as REAL,\
     uint32, seterr, array, uint8, vstack, fromstring, sqrt,\
-    empty, sum as np_sum, ones, logaddexp, log, outer
+    empty, sum as np_sum, ones, logaddexp, log, outer, ndarray, uint64, memmap, fromfile,\
+    load as np_load, save as np_save
 
 from scipy.special import expit
 
@@ -153,6 +155,7 @@ logger = logging.getLogger(__name__)
 
 try:
     from gensim.models.word2vec_inner import train_batch_sg, train_batch_cbow
+    from gensim.models.word2vec_inner import train_batch_sg_encoded, train_batch_cbow_encoded
     from gensim.models.word2vec_inner import score_sentence_sg, score_sentence_cbow
     from gensim.models.word2vec_inner import FAST_VERSION, MAX_WORDS_IN_BATCH
 
@@ -345,6 +348,70 @@ except ImportError:
 
         return log_prob_sentence
 
+    def train_batch_sg_encoded(model, sentences, alpha, work=None, compute_loss=False, sample_ints=None):
+        """Update skip-gram model by training on a sequence of sentences encoded as vocabulary indices.
+
+        This is the non-optimized, pure Python version: the sentences are decoded back to words
+        and trained with :func:`~gensim.models.word2vec.train_batch_sg`.
+
+        Parameters
+        ----------
+        model : :class:`~gensim.models.word2Vec.Word2Vec`
+            The Word2Vec model instance to train.
+        sentences : iterable of numpy.ndarray
+            Sentences as vocabulary indices, see :class:`~gensim.models.word2vec.EncodedCorpus`.
+        alpha : float
+            The learning rate
+        work : object, optional
+            Unused.
+        compute_loss : bool, optional
+            Whether or not the training loss should be computed in this batch.
+        sample_ints : object, optional
+            Unused. For interface compatibility only.
+
+        Returns
+        -------
+        int
+            Number of words in the vocabulary actually used for training.
+
+        """
+        index2word = model.wv.index2word
+        sentences = [[index2word[index] for index in sentence] for sentence in sentences]
+        return train_batch_sg(model, sentences, alpha, work, compute_loss)
+
+    def train_batch_cbow_encoded(model, sentences, alpha, work=None, neu1=None, compute_loss=False, sample_ints=None):
+        """Update CBOW model by training on a sequence of sentences encoded as vocabulary indices.
+
+        This is the non-optimized, pure Python version: the sentences are decoded back to words
+        and trained with :func:`~gensim.models.word2vec.train_batch_cbow`.
+
+        Parameters
+        ----------
+        model : :class:`~gensim.models.word2vec.Word2Vec`
+            The Word2Vec model instance to train.
+        sentences : iterable of numpy.ndarray
+            Sentences as vocabulary indices, see :class:`~gensim.models.word2vec.EncodedCorpus`.
+        alpha : float
+            The learning rate
+        work : object, optional
+            Unused.
+        neu1 : object, optional
+            Unused.
+        compute_loss : bool, optional
+            Whether or not the training loss should be computed in this batch.
+        sample_ints : object, optional
+            Unused. For interface compatibility only.
+
+        Returns
+        -------
+        int
+            Number of words in the vocabulary actually used for training.
+
+        """
+        index2word = model.wv.index2word
+        sentences = [[index2word[index] for index in sentence] for sentence in sentences]
+        return train_batch_cbow(model, sentences, alpha, work, neu1, compute_loss)
+
 try:
     from gensim.models.word2vec_corpusfile import train_epoch_sg, train_epoch_cbow, CORPUSFILE_VERSION
 except ImportError:
@@ -799,7 +866,8 @@ class Word2Vec(BaseWordEmbeddingsModel):
         Parameters
         ----------
         sentences : iterable of list of str
-            Corpus chunk to be used in this training batch.
+            Corpus chunk to be used in this training batch. Sentences from an
+            :class:`~gensim.models.word2vec.EncodedCorpus` are arrays of vocabulary indices instead.
         alpha : float
             The learning rate used in this batch.
         inits : (np.ndarray, np.ndarray)
@@ -813,7 +881,13 @@ class Word2Vec(BaseWordEmbeddingsModel):
         """
         work, neu1 = inits
         tally = 0
-        if self.sg:
+        if sentences and isinstance(sentences[0], ndarray):
+            sample_ints = self._encoded_sample_ints
+            if self.sg:
+                tally += train_batch_sg_encoded(self, sentences, alpha, work, self.compute_loss, sample_ints)
+            else:
+                tally += train_batch_cbow_encoded(self, sentences, alpha, work, neu1, self.compute_loss, sample_ints)
+        elif self.sg:
             tally += train_batch_sg(self, sentences, alpha, work, self.compute_loss)
         else:
             tally += train_batch_cbow(self, sentences, alpha, work, neu1, self.compute_loss)
@@ -856,6 +930,8 @@ class Word2Vec(BaseWordEmbeddingsModel):
             or :class:`~gensim.models.word2vec.LineSentence` in :mod:`~gensim.models.word2vec` module for such examples.
             See also the `tutorial on data streaming in Python
             <https://rare-technologies.com/data-streaming-in-python-generators-iterators-iterables/>`_.
+            For multiple epochs over a large corpus, an :class:`~gensim.models.word2vec.EncodedCorpus`
+            encoded with this model's vocabulary avoids re-tokenizing and looking up every word in every epoch.
         corpus_file : str, optional
             Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
             You may use this argument instead of `sentences` to get performance boost. Only one of `sentences` or
@@ -863,7 +939,8 @@ class Word2Vec(BaseWordEmbeddingsModel):
         total_examples : int
             Count of sentences.
         total_words : int
-            Count of raw words in sentences.
+            Count of raw words in sentences. For an :class:`~gensim.models.word2vec.EncodedCorpus`, out-of-vocabulary
+            words were already dropped, so prefer `total_examples`.
         epochs : int
             Number of iterations (epochs) over the corpus.
         start_alpha : float, optional
@@ -902,10 +979,21 @@ class Word2Vec(BaseWordEmbeddingsModel):
             (1, 30)
 
         """
-        return super(Word2Vec, self).train(
+        kwargs = dict(
             sentences=sentences, corpus_file=corpus_file, total_examples=total_examples, total_words=total_words,
             epochs=epochs, start_alpha=start_alpha, end_alpha=end_alpha, word_count=word_count,
             queue_factor=queue_factor, report_delay=report_delay, compute_loss=compute_loss, callbacks=callbacks)
+        if not isinstance(sentences, EncodedCorpus):
+            return super(Word2Vec, self).train(**kwargs)
+
+        # downsampling thresholds in vocabulary index order, for the index-based training routines;
+        # thresholds of rare words may exceed 2**32, which means "always keep" just like 2**32 - 1 does
+        sample_ints = array([self.wv.vocab[word].sample_int for word in self.wv.index2word], dtype=uint64)
+        self._encoded_sample_ints = sample_ints.clip(0, 2**32 - 1).astype(uint32)
+        try:
+            return super(Word2Vec, self).train(**kwargs)
+        finally:
+            del self._encoded_sample_ints
 
     def score(self, sentences, total_sentences=int(1e6), chunksize=100, queue_factor=2, report_delay=1):
         """Score the log probability for a sequence of sentences.
@@ -1501,6 +1589,103 @@ class PathLineSentences(object):
                         i += self.max_sentence_length
 
 
+class EncodedCorpus(object):
+    """Sentences pre-encoded as `uint32` vocabulary indices, memory-mapped from disk.
+
+    Tokenizing a text corpus and looking up every token in the vocabulary is repeated in every training epoch.
+    Encode the corpus once, with :meth:`~gensim.models.word2vec.EncodedCorpus.serialize`, and train on this
+    corpus instead: each sentence is a slice of a single memory-mapped array, which the optimized training
+    routines consume directly. Out-of-vocabulary words are dropped at encoding time.
+
+    The indices are only valid for the vocabulary they were encoded with -- re-encode the corpus
+    after changing the model vocabulary (e.g. with `build_vocab(..., update=True)`).
+
+    Two files are stored: `fname` holds all indices as a flat little-endian `uint32` array and
+    `fname.offsets.npy` the (`uint64`) start offset of each sentence in that array, plus its total length.
+
+    Examples
+    --------
+    .. sourcecode:: pycon
+
+        >>> from gensim.test.utils import common_texts, get_tmpfile
+        >>> from gensim.models.word2vec import Word2Vec, EncodedCorpus
+        >>>
+        >>> model = Word2Vec(min_count=1)
+        >>> model.build_vocab(common_texts)
+        >>>
+        >>> path = get_tmpfile("common_texts.u4")
+        >>> EncodedCorpus.serialize(path, common_texts, model.wv)
+        >>> corpus = EncodedCorpus(path)
+        >>> model.train(corpus, total_examples=len(corpus), epochs=model.epochs)  # doctest: +ELLIPSIS
+        (...)
+
+    """
+    def __init__(self, fname, mmap='r'):
+        """
+
+        Parameters
+        ----------
+        fname : str
+            Path to the indices, as written by :meth:`~gensim.models.word2vec.EncodedCorpus.serialize`.
+        mmap : {'r', None}, optional
+            Memory-map the indices in this mode, or read them all into RAM if None.
+
+        """
+        self.fname = fname
+        self.offsets = np_load(fname + '.offsets.npy')
+        if not self.offsets[-1]:
+            self.indices = zeros(0, dtype=uint32)  # empty files cannot be memory-mapped
+        elif mmap is None:
+            self.indices = fromfile(fname, dtype='<u4').astype(uint32, copy=False)
+        else:
+            self.indices = memmap(fname, dtype='<u4', mode=mmap).view(ndarray)
+
+    def __len__(self):
+        """Get the number of sentences."""
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        """Iterate over the sentences.
+
+        Yields
+        ------
+        numpy.ndarray
+            Vocabulary indices of the in-vocabulary words of the sentence.
+
+        """
+        indices = self.indices
+        for chunk_start in range(0, len(self), 10000):
+            offsets = self.offsets[chunk_start:chunk_start + 10001].tolist()
+            for start, end in zip(offsets, offsets[1:]):
+                yield indices[start:end]
+
+    @staticmethod
+    def serialize(fname, sentences, wv):
+        """Encode `sentences` with the vocabulary of `wv` and store them to `fname`.
+
+        The sentences are streamed, only the sentence offsets are kept in RAM.
+
+        Parameters
+        ----------
+        fname : str
+            Path to output file.
+        sentences : iterable of list of str
+            The corpus to encode.
+        wv : :class:`~gensim.models.keyedvectors.Word2VecKeyedVectors`
+            Vectors with the vocabulary to encode with, typically `model.wv`.
+
+        """
+        vocab = wv.vocab
+        offsets = [0]
+        with utils.smart_open(fname, 'wb') as fout:
+            for sentence in sentences:
+                encoded = array([vocab[word].index for word in sentence if word in vocab], dtype='<u4')
+                fout.write(encoded.tostring())
+                offsets.append(offsets[-1] + len(encoded))
+        np_save(fname + '.offsets.npy', array(offsets, dtype=uint64))
+        logger.info("encoded %i sentences with %i in-vocabulary words into %s", len(offsets) - 1, offsets[-1], fname)
+
+
 def _scan_vocab_worker(stream, progress_queue, max_vocab_size=None, trim_rule=None):
     """Do an initial scan of all words appearing in stream.
 
@@ -1535,6 +1720,73 @@ def _scan_vocab_worker(stream, progress_queue, max_vocab_size=None, trim_rule=No
     return vocab
 
 
+def _is_compressed(fname):
+    """Can't `fname` be split by byte offsets, because :func:`~gensim.utils.smart_open` decompresses it?"""
+    return os.path.splitext(fname)[1] in ('.gz', '.bz2')
+
+
+def _count_words(sentences):
+    """Count the words in a list of sentences, helper for :meth:`~gensim.models.word2vec.Word2VecVocab.scan_vocab`.
+
+    Parameters
+    ----------
+    sentences : list of list of str
+        Chunk of the corpus.
+
+    Returns
+    -------
+    (dict of (str, int), int, int)
+        Word counts, in order of first occurrence, total number of words and number of sentences.
+
+    """
+    vocab = defaultdict(int)
+    total_words = 0
+    for sentence in sentences:
+        for word in sentence:
+            vocab[word] += 1
+        total_words += len(sentence)
+    return vocab, total_words, len(sentences)
+
+
+def _count_words_in_range(args):
+    """Count the words of the lines starting within a byte range of a :class:`~gensim.models.word2vec.LineSentence`
+    file, helper for :meth:`~gensim.models.word2vec.Word2VecVocab.scan_vocab`.
+
+    Parameters
+    ----------
+    args : (str, int, int, int)
+        Path to the file, start and end byte offsets and maximum sentence length (or None to count each line
+        as one sentence, like :class:`~gensim.models.doc2vec.TaggedLineDocument` does).
+
+    Returns
+    -------
+    (dict of (str, int), int, int)
+        Word counts, in order of first occurrence, total number of words and number of sentences.
+
+    """
+    fname, start, end, max_sentence_length = args
+    vocab = defaultdict(int)
+    total_words = sentence_count = 0
+    with open(fname, 'rb') as fin:
+        if start:
+            # lines belong to the range they start in: skip the tail of the line crossing `start`
+            fin.seek(start - 1)
+            fin.readline()
+        while fin.tell() < end:
+            line = fin.readline()
+            if not line:
+                break
+            words = utils.to_unicode(line).split()
+            for word in words:
+                vocab[word] += 1
+            total_words += len(words)
+            if max_sentence_length is None:
+                sentence_count += 1
+            else:
+                sentence_count += (len(words) + max_sentence_length - 1) // max_sentence_length
+    return vocab, total_words, sentence_count
+
+
 class Word2VecVocab(utils.SaveLoad):
     """Vocabulary used by :class:`~gensim.models.word2vec.Word2Vec`."""
     def __init__(
@@ -1582,12 +1834,140 @@ class Word2VecVocab(utils.SaveLoad):
         self.raw_vocab = vocab
         return total_words, corpus_count
 
+    def _scan_vocab_multiprocess(self, sentences, corpus_file, workers, progress_per,
+                                 words_of=None, max_sentence_length=MAX_WORDS_IN_BATCH, chunksize=10000):
+        """Collect word counts with a pool of `workers` processes.
+
+        A `corpus_file` is split into `workers` byte ranges aligned to line starts, each counted by one process.
+        Iterable `sentences` are read here and sent to the processes in chunks of `chunksize` sentences.
+        Partial counts are merged in corpus order with :func:`~gensim.utils.merge_counts`, so `raw_vocab` is
+        the same as the one collected by a single process. Not used with `max_vocab_size`: pruning depends on
+        the order of the individual sentences, so only the serial scan can prune exactly.
+        Corpora shorter than `chunksize` are counted in the current process, exactly like a serial scan.
+
+        Parameters
+        ----------
+        sentences : iterable of list of str
+            The corpus, used if `corpus_file` isn't given.
+        corpus_file : str
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+        workers : int
+            Number of worker processes.
+        progress_per : int
+            Indicates how many sentences to process before showing/updating the progress.
+        words_of : function, optional
+            Maps each item of `sentences` to its list of words. Called here, in corpus order.
+        max_sentence_length : int, optional
+            Lines of `corpus_file` longer than this are counted as several sentences, like
+            :class:`~gensim.models.word2vec.LineSentence` does. None counts every line as one sentence.
+        chunksize : int, optional
+            Number of sentences sent to a worker at once.
+
+        Returns
+        -------
+        (int, int)
+            Tuple of (total words in the corpus, number of sentences).
+
+        """
+        pool = None
+        try:
+            if corpus_file:
+                file_size = os.path.getsize(corpus_file)
+                offsets = [file_size * i // workers for i in range(workers + 1)]
+                pool = multiprocessing.Pool(workers)
+                partials = pool.imap(_count_words_in_range, [
+                    (corpus_file, start, end, max_sentence_length)
+                    for start, end in zip(offsets, offsets[1:])
+                ])
+            else:
+                chunks = utils.chunkize_serial(
+                    (words_of(sentence) for sentence in sentences) if words_of else sentences, chunksize,
+                    as_numpy=False
+                )
+                first = next(chunks, [])
+                if not words_of and first and isinstance(first[0], string_types):
+                    logger.warning(
+                        "Each 'sentences' item should be a list of words (usually unicode strings). "
+                        "First item here is instead plain %s.",
+                        type(first[0])
+                    )
+                if len(first) < chunksize:
+                    # small corpus: not worth starting any processes
+                    partials = (_count_words([sentence]) for sentence in first)
+                else:
+                    pool = multiprocessing.Pool(workers)
+                    partials = self._imap_chunks(pool, itertools.chain([first], chunks), workers)
+
+            sentence_no = total_words = 0
+            vocab = defaultdict(int)
+            for partial_vocab, partial_words, partial_sentences in partials:
+                utils.merge_counts(vocab, partial_vocab)
+                total_words += partial_words
+                if sentence_no // progress_per != (sentence_no + partial_sentences) // progress_per:
+                    logger.info(
+                        "PROGRESS: at sentence #%i, processed %i words, keeping %i word types",
+                        sentence_no, total_words, len(vocab)
+                    )
+                sentence_no += partial_sentences
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+        self.raw_vocab = vocab
+        return total_words, sentence_no
+
+    @staticmethod
+    def _imap_chunks(pool, chunks, workers):
+        """Count `chunks` of sentences in `pool`, keeping at most `2 * workers` chunks in flight,
+        helper for :meth:`~gensim.models.word2vec.Word2VecVocab._scan_vocab_multiprocess`.
+
+        Yields
+        ------
+        (dict of (str, int), int, int)
+            Word counts, total number of words and number of sentences of each chunk, in corpus order.
+
+        """
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+            pending.append(pool.apply_async(_count_words, (chunk,)))
+        while pending:
+            yield pending.popleft().get()
+
     def scan_vocab(self, sentences=None, corpus_file=None, progress_per=10000, workers=None, trim_rule=None):
-        logger.info("collecting all words and their counts")
-        if corpus_file:
-            sentences = LineSentence(corpus_file)
+        """Create the models Vocabulary: A mapping from unique words in the corpus to their frequency count.
 
-        total_words, corpus_count = self._scan_vocab(sentences, progress_per, trim_rule)
+        Parameters
+        ----------
+        sentences : iterable of list of str, optional
+            The sentences used to create the vocabulary.
+        corpus_file : str, optional
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+            You may use this argument instead of `sentences` to get performance boost. Only one of `sentences` or
+            `corpus_file` arguments need to be passed (not both of them).
+        progress_per : int, optional
+            Progress will be logged every `progress_per` sentences.
+        workers : int, optional
+            Count the words in this many processes, see
+            :meth:`~gensim.models.word2vec.Word2VecVocab._scan_vocab_multiprocess`. The default, None, and 1
+            scan the corpus in the current process, as does any `max_vocab_size`.
+        trim_rule : function, optional
+            Vocabulary trimming rule, used to prune the vocabulary when it exceeds `max_vocab_size`.
+
+        Returns
+        -------
+        (int, int)
+            Tuple of (total words in the corpus, number of sentences).
+
+        """
+        logger.info("collecting all words and their counts")
+        if workers and workers > 1 and not self.max_vocab_size and not (corpus_file and _is_compressed(corpus_file)):
+            total_words, corpus_count = self._scan_vocab_multiprocess(sentences, corpus_file, workers, progress_per)
+        else:
+            if corpus_file:
+                sentences = LineSentence(corpus_file)
+            total_words, corpus_count = self._scan_vocab(sentences, progress_per, trim_rule)
 
         logger.info(
             "collected %i word types from a corpus of %i raw words and %i sentences",
@@ -676,6 +676,201 @@ def train_batch_cbow(model, sentences, alpha, _work, _neu1, compute_loss):
     return effective_words
 
 
+cdef int prepare_encoded_batch(Word2VecConfig *c, model, sentences, _sample_ints) except -1:
+    """Fill the C structures of `c` from sentences already encoded as arrays of vocabulary indices.
+
+    Parameters
+    ----------
+    c : Word2VecConfig *
+        Training configuration, initialized by `init_w2v_config`.
+    model : :class:`~gensim.models.word2Vec.Word2Vec`
+        The Word2Vec model instance to train.
+    sentences : iterable of numpy.ndarray
+        Sentences as `uint32` vocabulary indices, see :class:`~gensim.models.word2vec.EncodedCorpus`.
+    _sample_ints : numpy.ndarray
+        Downsampling thresholds (`sample_int`) of all words, as `uint32`, in vocabulary index order.
+
+    Returns
+    -------
+    int
+        Number of sentences filled in. The number of words is `c.sentence_idx[number of sentences]`.
+
+    """
+    cdef np.uint32_t *sample_ints = <np.uint32_t *>np.PyArray_DATA(_sample_ints)
+    cdef unsigned long long vocab_size = len(_sample_ints)
+    cdef np.uint32_t *sent_data
+    cdef np.uint32_t word_index
+    cdef Py_ssize_t pos, sent_len
+    cdef int effective_words = 0, effective_sentences = 0
+
+    vlookup = model.wv.vocab
+    index2word = model.wv.index2word
+    c[0].sentence_idx[0] = 0  # indices of the first sentence always start at 0
+    for sent in sentences:
+        sent_len = len(sent)
+        if not sent_len:
+            continue  # ignore empty sentences; leave effective_sentences unchanged
+        sent = np.ascontiguousarray(sent, dtype=np.uint32)
+        sent_data = <np.uint32_t *>np.PyArray_DATA(sent)
+        for pos in range(sent_len):
+            word_index = sent_data[pos]
+            if word_index >= vocab_size:
+                raise ValueError(
+                    "word index %i out of vocabulary, was the corpus encoded with another vocabulary?" % word_index)
+            if c[0].sample and sample_ints[word_index] < random_int32(&c[0].next_random):
+                continue
+            c[0].indexes[effective_words] = word_index
+            if c[0].hs:
+                word = vlookup[index2word[word_index]]
+                c[0].codelens[effective_words] = <int>len(word.code)
+                c[0].codes[effective_words] = <np.uint8_t *>np.PyArray_DATA(word.code)
+                c[0].points[effective_words] = <np.uint32_t *>np.PyArray_DATA(word.point)
+            effective_words += 1
+            if effective_words == MAX_SENTENCE_LEN:
+                break  # TODO: log warning, tally overflow?
+
+        # keep track of which words go into which sentence, so we don't train
+        # across sentence boundaries.
+        effective_sentences += 1
+        c[0].sentence_idx[effective_sentences] = effective_words
+
+        if effective_words == MAX_SENTENCE_LEN:
+            break  # TODO: log warning, tally overflow?
+
+    return effective_sentences
+
+
+def train_batch_sg_encoded(model, sentences, alpha, _work, compute_loss, _sample_ints):
+    """Update skip-gram model by training on a batch of sentences encoded as vocabulary indices.
+
+    Same as :func:`~gensim.models.word2vec_inner.train_batch_sg`, but skips the vocabulary lookup of each word.
+    Called internally from :meth:`~gensim.models.word2vec.Word2Vec.train` for
+    :class:`~gensim.models.word2vec.EncodedCorpus`.
+
+    Parameters
+    ----------
+    model : :class:`~gensim.models.word2Vec.Word2Vec`
+        The Word2Vec model instance to train.
+    sentences : iterable of numpy.ndarray
+        Sentences as `uint32` vocabulary indices.
+    alpha : float
+        The learning rate
+    _work : np.ndarray
+        Private working memory for each worker.
+    compute_loss : bool
+        Whether or not the training loss should be computed in this batch.
+    _sample_ints : numpy.ndarray
+        Downsampling thresholds of all words, as `uint32`, in vocabulary index order.
+
+    Returns
+    -------
+    int
+        Number of words in the vocabulary actually used for training (They already existed in the vocabulary
+        and were not discarded by negative sampling).
+
+    """
+    cdef Word2VecConfig c
+    cdef int i, j, k
+    cdef int effective_words = 0, effective_sentences = 0
+    cdef int sent_idx, idx_start, idx_end
+
+    init_w2v_config(&c, model, alpha, compute_loss, _work)
+    effective_sentences = prepare_encoded_batch(&c, model, sentences, _sample_ints)
+    effective_words = c.sentence_idx[effective_sentences]
+
+    # precompute "reduced window" offsets in a single randint() call
+    for i, item in enumerate(model.random.randint(0, c.window, effective_words)):
+        c.reduced_windows[i] = item
+
+    # release GIL & train on all sentences
+    with nogil:
+        for sent_idx in range(effective_sentences):
+            idx_start = c.sentence_idx[sent_idx]
+            idx_end = c.sentence_idx[sent_idx + 1]
+            for i in range(idx_start, idx_end):
+                j = i - c.window + c.reduced_windows[i]
+                if j < idx_start:
+                    j = idx_start
+                k = i + c.window + 1 - c.reduced_windows[i]
+                if k > idx_end:
+                    k = idx_end
+                for j in range(j, k):
+                    if j == i:
+                        continue
+                    if c.hs:
+                        w2v_fast_sentence_sg_hs(c.points[i], c.codes[i], c.codelens[i], c.syn0, c.syn1, c.size, c.indexes[j], c.alpha, c.work, c.word_locks, c.compute_loss, &c.running_training_loss)
+                    if c.negative:
+                        c.next_random = w2v_fast_sentence_sg_neg(c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size, c.indexes[i], c.indexes[j], c.alpha, c.work, c.next_random, c.word_locks, c.compute_loss, &c.running_training_loss)
+
+    model.running_training_loss = c.running_training_loss
+    return effective_words
+
+
+def train_batch_cbow_encoded(model, sentences, alpha, _work, _neu1, compute_loss, _sample_ints):
+    """Update CBOW model by training on a batch of sentences encoded as vocabulary indices.
+
+    Same as :func:`~gensim.models.word2vec_inner.train_batch_cbow`, but skips the vocabulary lookup of each word.
+    Called internally from :meth:`~gensim.models.word2vec.Word2Vec.train` for
+    :class:`~gensim.models.word2vec.EncodedCorpus`.
+
+    Parameters
+    ----------
+    model : :class:`~gensim.models.word2vec.Word2Vec`
+        The Word2Vec model instance to train.
+    sentences : iterable of numpy.ndarray
+        Sentences as `uint32` vocabulary indices.
+    alpha : float
+        The learning rate.
+    _work : np.ndarray
+        Private working memory for each worker.
+    _neu1 : np.ndarray
+        Private working memory for each worker.
+    compute_loss : bool
+        Whether or not the training loss should be computed in this batch.
+    _sample_ints : numpy.ndarray
+        Downsampling thresholds of all words, as `uint32`, in vocabulary index order.
+
+    Returns
+    -------
+    int
+        Number of words in the vocabulary actually used for training (They already existed in the vocabulary
+        and were not discarded by negative sampling).
+
+    """
+    cdef Word2VecConfig c
+    cdef int i, j, k
+    cdef int effective_words = 0, effective_sentences = 0
+    cdef int sent_idx, idx_start, idx_end
+
+    init_w2v_config(&c, model, alpha, compute_loss, _work, _neu1)
+    effective_sentences = prepare_encoded_batch(&c, model, sentences, _sample_ints)
+    effective_words = c.sentence_idx[effective_sentences]
+
+    # precompute "reduced window" offsets in a single randint() call
+    for i, item in enumerate(model.random.randint(0, c.window, effective_words)):
+        c.reduced_windows[i] = item
+
+    # release GIL & train on all sentences
+    with nogil:
+        for sent_idx in range(effective_sentences):
+            idx_start = c.sentence_idx[sent_idx]
+            idx_end = c.sentence_idx[sent_idx + 1]
+            for i in range(idx_start, idx_end):
+                j = i - c.window + c.reduced_windows[i]
+                if j < idx_start:
+                    j = idx_start
+                k = i + c.window + 1 - c.reduced_windows[i]
+                if k > idx_end:
+                    k = idx_end
+                if c.hs:
+                    w2v_fast_sentence_cbow_hs(c.points[i], c.codes[i], c.codelens, c.neu1, c.syn0, c.syn1, c.size, c.indexes, c.alpha, c.work, i, j, k, c.cbow_mean, c.word_locks, c.compute_loss, &c.running_training_loss)
+                if c.negative:
+                    c.next_random = w2v_fast_sentence_cbow_neg(c.negative, c.cum_table, c.cum_table_len, c.codelens, c.neu1, c.syn0, c.syn1neg, c.size, c.indexes, c.alpha, c.work, i, j, k, c.cbow_mean, c.next_random, c.word_locks, c.compute_loss, &c.running_training_loss)
+
+    model.running_training_loss = c.running_training_loss
+    return effective_words
+
+
 def score_sentence_sg(model, sentence, _work):
     """Obtain likelihood score for a single sentence in a fitted skip-gram representation.
 
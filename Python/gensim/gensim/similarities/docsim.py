@@ -84,11 +84,15 @@ logger = logging.getLogger(__name__)
 PARALLEL_SHARDS = False
 try:
     import multiprocessing
+    import multiprocessing.pool
     # by default, don't parallelize queries. uncomment the following line if you want that.
 #    PARALLEL_SHARDS = multiprocessing.cpu_count() # use #parallel processes = #CPus
 except ImportError:
     pass
 
+# shards opened (mmapped) by the current worker process of a ShardQueryPool, keyed by shard filename
+_WORKER_SHARDS = {}
+
 
 class Shard(utils.SaveLoad):
     """A proxy that represents a single shard instance within :class:`~gensim.similarity.docsim.Similarity` index.
@@ -231,6 +235,121 @@ def query_shard(args):
     return result
 
 
+def query_worker_shard(args):
+    """Helper for querying a shard from inside a long-lived worker process, same as shard[query].
+
+    Unlike :func:`~gensim.similarities.docsim.query_shard`, the shard stays open (mmapped) in the worker
+    between calls, so that only the first query against a shard pays for loading it.
+
+    Parameters
+    ---------
+    args : (list of (int, number), :class:`~gensim.similarities.docsim.Shard`)
+        Query and Shard instances
+
+    Returns
+    -------
+    :class:`numpy.ndarray` or :class:`scipy.sparse.csr_matrix`
+        Similarities of the query against documents indexed in this shard.
+
+    """
+    query, shard = args
+    cached = _WORKER_SHARDS.get(shard.fullname())
+    if cached is None or len(cached) != len(shard):
+        # first query against this shard, or the shard was reopened and rewritten since: (re)open it
+        _WORKER_SHARDS[shard.fullname()] = cached = shard
+    cached.num_best, cached.normalize = shard.num_best, shard.normalize
+    return query_shard((query, cached))
+
+
+class ShardQueryPool(object):
+    """Long-lived pool of workers for querying :class:`~gensim.similarities.docsim.Shard` objects.
+
+    The pool is created once and reused by all queries, so that queries don't pay for spawning workers and
+    re-opening shards. Thread workers share the shards (and their mmapped indexes) with the calling process;
+    process workers open each shard once and keep it mmapped, so all workers share one page cache copy.
+
+    """
+    def __init__(self, workers=None, executor='thread'):
+        """
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of workers, if None - use the number of CPUs.
+        executor : {'thread', 'process'}, optional
+            Kind of workers. Threads are cheap and work well because the heavy lifting (BLAS) releases the GIL,
+            processes side-step the GIL completely.
+
+        """
+        if executor not in ('thread', 'process'):
+            raise ValueError("executor must be 'thread' or 'process', got %r" % executor)
+        self.workers = workers or multiprocessing.cpu_count()
+        self.executor = executor
+        logger.info("starting %i query %s workers", self.workers, executor)
+        if executor == 'thread':
+            self.pool = multiprocessing.pool.ThreadPool(self.workers)
+            self.query_fnc = query_shard
+        else:
+            self.pool = multiprocessing.Pool(self.workers)
+            self.query_fnc = query_worker_shard
+
+    def imap(self, args):
+        """Query shards in parallel.
+
+        Parameters
+        ----------
+        args : iterable of (list of (int, number), :class:`~gensim.similarities.docsim.Shard`)
+            Query and Shard instances.
+
+        Returns
+        -------
+        iterator of {:class:`numpy.ndarray`, :class:`scipy.sparse.csr_matrix`, list of (int, float)}
+            Query results, in the same order as `args`.
+
+        """
+        return self.pool.imap(self.query_fnc, args)
+
+    def close(self):
+        """Terminate all workers. The pool is not usable anymore after calling this method."""
+        self.pool.terminate()
+        self.pool.join()
+
+
+def merge_topn(heap, shard_result, offset, topn, counter):
+    """Merge `num_best` results of one shard into a streaming top-n `heap`. Used internally.
+
+    Parameters
+    ----------
+    heap : list of (float, int, int)
+        Min-heap of (similarity, -arrival, document id) for the best documents seen so far, modified in place.
+    shard_result : list of (int, float)
+        Top similarities of a single query against a single shard, with shard-local document ids.
+    offset : int
+        Position of the shard's first document in the whole index.
+    topn : int
+        Number of best documents to keep.
+    counter : iterator of int
+        Shared arrival counter, so that ties are resolved in favour of documents that arrived first
+        (same as :func:`heapq.nlargest` over all shard results in order).
+
+    """
+    if topn <= 0:
+        return
+    for doc_index, sim in shard_result:
+        item = (sim, -next(counter), doc_index + offset)
+        if len(heap) < topn:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            # no early exit: shard results are sorted by absolute similarity, a better (less negative)
+            # similarity may still follow a worse one
+            heapq.heapreplace(heap, item)
+
+
+def heap2sparse(heap):
+    """Convert a top-n heap from :func:`~gensim.similarities.docsim.merge_topn` into sorted (doc id, sim) pairs."""
+    return [(doc_index, sim) for sim, _, doc_index in sorted(heap, reverse=True)]
+
+
 class Similarity(interfaces.SimilarityABC):
     """Compute cosine similarity of a dynamic query against a corpus of documents ('the index').
 
@@ -278,7 +397,8 @@ class Similarity(interfaces.SimilarityABC):
 
     """
 
-    def __init__(self, output_prefix, corpus, num_features, num_best=None, chunksize=256, shardsize=32768, norm='l2'):
+    def __init__(self, output_prefix, corpus, num_features, num_best=None, chunksize=256, shardsize=32768, norm='l2',
+                 workers=None, executor='thread'):
         """
 
         Parameters
@@ -299,6 +419,12 @@ class Similarity(interfaces.SimilarityABC):
             comfortably into your RAM.
         norm : {'l1', 'l2'}, optional
             Normalization to use.
+        workers : int, optional
+            If set, query the shards in parallel using a long-lived pool of `workers` workers, see
+            :class:`~gensim.similarities.docsim.ShardQueryPool`. Corpus queries are also split into chunks of
+            `chunksize` documents, and the chunks are fanned out across the workers.
+        executor : {'thread', 'process'}, optional
+            Kind of workers to use when `workers` is set.
 
         Notes
         -----
@@ -327,6 +453,11 @@ class Similarity(interfaces.SimilarityABC):
         self.shardsize = shardsize
         self.shards = []
         self.fresh_docs, self.fresh_nnz = [], 0
+        if executor not in ('thread', 'process'):
+            raise ValueError("executor must be 'thread' or 'process', got %r" % executor)
+        self.workers = workers
+        self.executor = executor
+        self.query_pool = None  # started lazily, on first query
 
         if corpus is not None:
             self.add_documents(corpus)
@@ -453,6 +584,25 @@ class Similarity(interfaces.SimilarityABC):
         del self.shards[-1]  # remove the shard from index, *but its file on disk is not deleted*
         logger.debug("reopen complete")
 
+    def get_query_pool(self):
+        """Get the long-lived query pool, starting it if needed.
+
+        Returns
+        -------
+        :class:`~gensim.similarities.docsim.ShardQueryPool`
+            Query pool, or None if this index queries its shards serially (`workers` not set).
+
+        """
+        if getattr(self, 'workers', None) and self.query_pool is None:
+            self.query_pool = ShardQueryPool(self.workers, self.executor)
+        return getattr(self, 'query_pool', None)
+
+    def close(self):
+        """Stop the query pool workers, if any. The pool is started again automatically on the next query."""
+        if getattr(self, 'query_pool', None) is not None:
+            self.query_pool.close()
+            self.query_pool = None
+
     def query_shards(self, query):
         """Apply shard[query] to each shard in `self.shards`. Used internally.
 
@@ -468,7 +618,13 @@ class Similarity(interfaces.SimilarityABC):
 
         """
         args = zip([query] * len(self.shards), self.shards)
-        if PARALLEL_SHARDS and PARALLEL_SHARDS > 1:
+        query_pool = self.get_query_pool()
+        if query_pool is not None:
+            # long-lived pool: don't return it, so that the caller doesn't terminate it
+            logger.debug("querying %i shards in %i workers", len(self.shards), query_pool.workers)
+            pool = None
+            result = query_pool.imap(args)
+        elif PARALLEL_SHARDS and PARALLEL_SHARDS > 1:
             logger.debug("spawning %i query processes", PARALLEL_SHARDS)
             pool = multiprocessing.Pool(PARALLEL_SHARDS)
             result = pool.imap(query_shard, args, chunksize=1 + len(self.shards) / PARALLEL_SHARDS)
@@ -478,6 +634,77 @@ class Similarity(interfaces.SimilarityABC):
             result = map(query_shard, args)
         return pool, result
 
+    def iter_query_chunks(self, query):
+        """Split a corpus `query` into chunks of at most `self.chunksize` documents. Used internally.
+
+        Parameters
+        ----------
+        query : {iterable of list of (int, number), :class:`numpy.ndarray`, :class:`scipy.sparse.csr_matrix`}
+            Corpus of query documents, or a matrix with one query document per row.
+
+        Yields
+        ------
+        {list of list of (int, number), :class:`numpy.ndarray`, :class:`scipy.sparse.csr_matrix`}
+            Chunks of the query.
+
+        """
+        if matutils.ismatrix(query):
+            for chunk_start in range(0, query.shape[0], self.chunksize):
+                yield query[chunk_start: min(query.shape[0], chunk_start + self.chunksize)]
+        else:
+            for chunk in utils.grouper(query, self.chunksize):
+                yield chunk
+
+    def query_chunks(self, query):
+        """Query all shards with a corpus `query`, fanning its chunks out across the query pool. Used internally.
+
+        Parameters
+        ----------
+        query : {iterable of list of (int, number), :class:`numpy.ndarray`, :class:`scipy.sparse.csr_matrix`}
+            Corpus of query documents, or a matrix with one query document per row.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or list of list of (int, float)
+            Similarities of each query document against this index.
+
+        """
+        query_pool = self.get_query_pool()
+        offsets = numpy.cumsum([0] + [len(shard) for shard in self.shards])
+        chunks = []  # number of documents in each chunk, filled in lazily as the pool consumes the chunks
+
+        def chunk_args():
+            for chunk in self.iter_query_chunks(query):
+                chunks.append(chunk.shape[0] if matutils.ismatrix(chunk) else len(chunk))
+                for shard in self.shards:
+                    yield chunk, shard
+
+        shard_results = query_pool.imap(chunk_args())
+        result = []
+        chunk_no = 0
+        while True:
+            parts = list(itertools.islice(shard_results, len(self.shards)))
+            if not parts:
+                break
+            if self.num_best is None:
+                # make sure a single-document chunk stays 2d, so that the chunks stack up
+                parts = [numpy.atleast_2d(part) for part in parts]
+                result.append(numpy.hstack(parts))
+            else:
+                if chunks[chunk_no] == 1:
+                    # a single-document chunk may come back as a single document result
+                    parts = [part if len(part) == 1 and isinstance(part[0], list) else [part] for part in parts]
+                counter = itertools.count()
+                for doc_parts in zip(*parts):
+                    heap = []
+                    for shard_no, shard_result in enumerate(doc_parts):
+                        merge_topn(heap, shard_result, offsets[shard_no], self.num_best, counter)
+                    result.append(heap2sparse(heap))
+            chunk_no += 1
+        if self.num_best is None:
+            result = numpy.vstack(result) if result else numpy.zeros((0, len(self)), dtype=numpy.float32)
+        return result
+
     def __getitem__(self, query):
         """Get similarities of the document (or corpus) `query` to all documents in the corpus.
 
@@ -517,6 +744,12 @@ class Similarity(interfaces.SimilarityABC):
             shard.num_best = self.num_best
             shard.normalize = self.norm
 
+        is_corpus, query = utils.is_corpus(query)
+        is_corpus = is_corpus or hasattr(query, 'ndim') and query.ndim > 1 and query.shape[0] > 1
+        if is_corpus and self.get_query_pool() is not None:
+            # batched query with a pool of workers: fan the (chunk, shard) pairs out across all workers
+            return self.query_chunks(query)
+
         # there are 4 distinct code paths, depending on whether input `query` is
         # a corpus (or numpy/scipy matrix) or a single document, and whether the
         # similarity result should be a full array or only num_best most similar
@@ -529,27 +762,24 @@ class Similarity(interfaces.SimilarityABC):
         else:
             # the following uses a lot of lazy evaluation and (optionally) parallel
             # processing, to improve query latency and minimize memory footprint.
+            # shard results are merged into a bounded top-n heap as they arrive.
             offsets = numpy.cumsum([0] + [len(shard) for shard in self.shards])
-
-            def convert(shard_no, doc):
-                return [(doc_index + offsets[shard_no], sim) for doc_index, sim in doc]
-
-            is_corpus, query = utils.is_corpus(query)
-            is_corpus = is_corpus or hasattr(query, 'ndim') and query.ndim > 1 and query.shape[0] > 1
+            counter = itertools.count()
             if not is_corpus:
                 # user asked for num_best most similar and query is a single doc
-                results = (convert(shard_no, result) for shard_no, result in enumerate(shard_results))
-                result = heapq.nlargest(self.num_best, itertools.chain(*results), key=lambda item: item[1])
+                heap = []
+                for shard_no, shard_result in enumerate(shard_results):
+                    merge_topn(heap, shard_result, offsets[shard_no], self.num_best, counter)
+                result = heap2sparse(heap)
             else:
                 # the trickiest combination: returning num_best results when query was a corpus
-                results = []
-                for shard_no, result in enumerate(shard_results):
-                    shard_result = [convert(shard_no, doc) for doc in result]
-                    results.append(shard_result)
-                result = []
-                for parts in zip(*results):
-                    merged = heapq.nlargest(self.num_best, itertools.chain(*parts), key=lambda item: item[1])
-                    result.append(merged)
+                heaps = None
+                for shard_no, shard_result in enumerate(shard_results):
+                    if heaps is None:
+                        heaps = [[] for _ in shard_result]
+                    for heap, doc in zip(heaps, shard_result):
+                        merge_topn(heap, doc, offsets[shard_no], self.num_best, counter)
+                result = [heap2sparse(heap) for heap in heaps or []]
         if pool:
             # gc doesn't seem to collect the Pools, eventually leading to
             # "IOError 24: too many open files". so let's terminate it manually.
@@ -727,11 +957,14 @@ class Similarity(interfaces.SimilarityABC):
         self.close_shard()
         if fname is None:
             fname = self.output_prefix
+        # the query pool cannot be pickled; it is restarted on the first query after load
+        kwargs['ignore'] = frozenset(kwargs.get('ignore', ())) | {'query_pool'}
         super(Similarity, self).save(fname, *args, **kwargs)
 
     def destroy(self):
         """Delete all files under self.output_prefix Index is not usable anymore after calling this method."""
         import glob
+        self.close()
         for fname in glob.glob(self.output_prefix + '*'):
             logger.info("deleting %s", fname)
             os.remove(fname)
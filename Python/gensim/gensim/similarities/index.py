@@ -9,7 +9,8 @@ Intro
 -----
 This module contains integration Annoy with :class:`~gensim.models.word2vec.Word2Vec`,
 :class:`~gensim.models.doc2vec.Doc2Vec`, :class:`~gensim.models.fasttext.FastText` and
-:class:`~gensim.models.keyedvectors.KeyedVectors`.
+:class:`~gensim.models.keyedvectors.KeyedVectors`, as well as :class:`~gensim.similarities.index.IvfIndexer`,
+a built-in approximate nearest neighbour index that only needs NumPy.
 
 
 What is Annoy
@@ -30,15 +31,29 @@ More information about Annoy: `github repository <https://github.com/spotify/ann
 `author in twitter <https://twitter.com/fulhack>`_
 and `annoy-user maillist <https://groups.google.com/forum/#!forum/annoy-user>`_.
 
+
+IVF index
+---------
+:class:`~gensim.similarities.index.IvfIndexer` partitions the normalized vectors into clusters with spherical k-means
+and stores the vectors of each cluster contiguously (an "inverted file"). A query is only compared to the vectors
+of the `num_probes` clusters whose centroids are closest to it, which trades recall for speed. The index is saved
+with :meth:`~gensim.utils.SaveLoad.save` and can be memory-mapped on load. Run `python -m gensim.test.annspeed`
+to measure its recall against exact search.
+
 """
+import logging
 import os
 
+import numpy as np
+import scipy.sparse
+from six.moves import range
 from smart_open import smart_open
 try:
     import cPickle as _pickle
 except ImportError:
     import pickle as _pickle
 
+from gensim import utils
 from gensim.models.doc2vec import Doc2Vec
 from gensim.models.word2vec import Word2Vec
 from gensim.models.fasttext import FastText
@@ -47,9 +62,9 @@ from gensim.models.keyedvectors import WordEmbeddingsKeyedVectors
 try:
     from annoy import AnnoyIndex
 except ImportError:
-    raise ImportError(
-        "Annoy has not been installed, if you wish to use the annoy indexer, please run `pip install annoy`"
-    )
+    AnnoyIndex = None
+
+logger = logging.getLogger(__name__)
 
 
 class AnnoyIndexer(object):
@@ -83,6 +98,10 @@ class AnnoyIndexer(object):
             [('cat', 1.0), ('dog', 0.32011348009109497)]
 
         """
+        if AnnoyIndex is None:
+            raise ImportError(
+                "Annoy has not been installed, if you wish to use the annoy indexer, please run `pip install annoy`"
+            )
         self.index = None
         self.labels = None
         self.model = model
@@ -211,3 +230,208 @@ class AnnoyIndexer(object):
             vector, num_neighbors, include_distances=True)
 
         return [(self.labels[ids[i]], 1 - distances[i] / 2) for i in range(len(ids))]
+
+
+class IvfIndexer(utils.SaveLoad):
+    """Approximate nearest neighbour index over cosine similarity, implemented with NumPy only.
+
+    Can be used as `indexer` in the `most_similar` method of :class:`~gensim.models.word2vec.Word2Vec`,
+    :class:`~gensim.models.doc2vec.Doc2Vec`, :class:`~gensim.models.fasttext.FastText` and
+    :class:`~gensim.models.keyedvectors.Word2VecKeyedVectors`, same as
+    :class:`~gensim.similarities.index.AnnoyIndexer`.
+
+    The vectors are clustered with spherical k-means and stored grouped by cluster (an inverted file).
+    Queries only scan the `num_probes` clusters with the closest centroids.
+
+    """
+    def __init__(self, model=None, num_clusters=None, num_probes=10, num_iterations=10, sample_size=100000, seed=0):
+        """
+        Parameters
+        ----------
+        model : :class:`~gensim.models.base_any2vec.BaseWordEmbeddingsModel`, optional
+            Model, that will be used as source for index.
+        num_clusters : int, optional
+            Number of k-means clusters. More clusters make queries faster but lower the recall for the same
+            `num_probes`. Defaults to `4 * sqrt(number of vectors)`.
+        num_probes : int, optional
+            Number of clusters scanned by each query. Higher values increase recall at the cost of latency.
+            Can also be changed after the index is built.
+        num_iterations : int, optional
+            Number of k-means iterations.
+        sample_size : int, optional
+            Maximum number of vectors used to train the k-means centroids. All vectors are indexed regardless.
+        seed : int, optional
+            Seed for the random centroid initialization and sampling.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.similarities.index import IvfIndexer
+            >>> from gensim.models import Word2Vec
+            >>>
+            >>> sentences = [['cute', 'cat', 'say', 'meow'], ['cute', 'dog', 'say', 'woof']]
+            >>> model = Word2Vec(sentences, min_count=1, seed=1)
+            >>>
+            >>> indexer = IvfIndexer(model, num_clusters=2, num_probes=2)
+            >>> neighbors = model.wv.most_similar("cat", topn=2, indexer=indexer)
+
+        """
+        self.model = model
+        self.num_clusters = num_clusters
+        self.num_probes = num_probes
+        self.num_iterations = num_iterations
+        self.sample_size = sample_size
+        self.seed = seed
+        self.centroids = None  # num_clusters x vector_size
+        self.vectors = None  # indexed vectors, grouped by cluster
+        self.ids = None  # position of each row of `vectors` in the original model
+        self.offsets = None  # rows of cluster `i` are `vectors[offsets[i]:offsets[i + 1]]`
+        self.labels = None
+
+        if model is not None:
+            if isinstance(self.model, Doc2Vec):
+                self.build_from_doc2vec()
+            elif isinstance(self.model, (Word2Vec, FastText)):
+                self.build_from_word2vec()
+            elif isinstance(self.model, (WordEmbeddingsKeyedVectors, KeyedVectors)):
+                self.build_from_keyedvectors()
+            else:
+                raise ValueError("Only a Word2Vec, Doc2Vec, FastText or KeyedVectors instance can be used")
+
+    def build_from_word2vec(self):
+        """Build an IVF index using word vectors from a Word2Vec model."""
+        self.model.init_sims()
+        return self._build_from_model(self.model.wv.vectors_norm, self.model.wv.index2word)
+
+    def build_from_doc2vec(self):
+        """Build an IVF index using document vectors from a Doc2Vec model."""
+        docvecs = self.model.docvecs
+        docvecs.init_sims()
+        labels = [docvecs.index_to_doctag(i) for i in range(0, docvecs.count)]
+        return self._build_from_model(docvecs.vectors_docs_norm, labels)
+
+    def build_from_keyedvectors(self):
+        """Build an IVF index using word vectors from a KeyedVectors model."""
+        self.model.init_sims()
+        return self._build_from_model(self.model.vectors_norm, self.model.index2word)
+
+    def _build_from_model(self, vectors, labels):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        num_vectors = len(vectors)
+        if not num_vectors:
+            raise ValueError("cannot build an index over no vectors")
+        if self.num_clusters is None:
+            self.num_clusters = int(4 * np.sqrt(num_vectors))
+        num_clusters = max(1, min(self.num_clusters, num_vectors))
+
+        random_state = utils.get_random_state(self.seed)
+        sample = vectors
+        if num_vectors > self.sample_size:
+            sample = vectors[np.sort(random_state.choice(num_vectors, self.sample_size, replace=False))]
+        centroids = sample[random_state.choice(len(sample), num_clusters, replace=False)].copy()
+        logger.info(
+            "training %i centroids on %i of %i vectors for %i iterations",
+            num_clusters, len(sample), num_vectors, self.num_iterations
+        )
+        for iteration in range(self.num_iterations):
+            assignment = assign_clusters(sample, centroids)
+            members = scipy.sparse.csr_matrix(
+                (np.ones(len(sample), dtype=np.float32), (assignment, np.arange(len(sample)))),
+                shape=(num_clusters, len(sample))
+            )
+            centroids = np.asarray(members.dot(sample), dtype=np.float32)
+            empty = np.flatnonzero(np.bincount(assignment, minlength=num_clusters) == 0)
+            if len(empty):
+                # restart empty clusters from random vectors
+                centroids[empty] = sample[random_state.choice(len(sample), len(empty), replace=False)]
+            centroids /= np.maximum(np.linalg.norm(centroids, axis=1), 1e-12)[:, np.newaxis]
+
+        assignment = assign_clusters(vectors, centroids)
+        ids = np.argsort(assignment, kind='mergesort')
+        self.centroids = centroids
+        self.vectors = vectors[ids]
+        self.ids = ids
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(assignment, minlength=num_clusters))])
+        self.labels = labels
+        self.num_clusters = num_clusters
+
+    def most_similar(self, vector, num_neighbors):
+        """Find the approximate `num_neighbors` most similar items.
+
+        Parameters
+        ----------
+        vector : numpy.array
+            Vector for word/document.
+        num_neighbors : int
+            Number of most similar items
+
+        Returns
+        -------
+        list of (str, float)
+            List of most similar items in format [(`item`, `cosine_similarity`), ... ]
+
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        vector = vector / max(np.linalg.norm(vector), 1e-12)
+
+        centroid_sims = np.dot(self.centroids, vector)
+        num_probes = min(self.num_probes, len(centroid_sims))
+        probes = np.argpartition(-centroid_sims, num_probes - 1)[:num_probes]
+        rows = np.concatenate([np.arange(self.offsets[probe], self.offsets[probe + 1]) for probe in probes])
+
+        sims = np.dot(self.vectors[rows], vector)
+        num_neighbors = min(num_neighbors, len(sims))
+        if num_neighbors <= 0:
+            return []
+        best = np.argpartition(-sims, num_neighbors - 1)[:num_neighbors]
+        best = best[np.argsort(-sims[best], kind='mergesort')]
+        return [(self.labels[self.ids[rows[i]]], float(sims[i])) for i in best]
+
+    def save(self, fname_or_handle, separately=None, ignore=frozenset(), **kwargs):
+        """Save the index, without the model it was built from.
+
+        The arrays are stored in separate .npy files by default, so that they can be memory-mapped with
+        `IvfIndexer.load(fname, mmap='r')`, sharing the index among processes.
+
+        Parameters
+        ----------
+        fname_or_handle : {str, file-like object}
+            Path to the output file, or an open file-like object.
+        separately : list of str, optional
+            Attributes stored in separate files, defaults to all the index arrays.
+        ignore : frozenset of str, optional
+            Attributes that shouldn't be stored at all, the model is always ignored.
+        **kwargs
+            Other parameters for :meth:`~gensim.utils.SaveLoad.save`.
+
+        """
+        if separately is None:
+            separately = ['centroids', 'vectors', 'ids', 'offsets']
+        super(IvfIndexer, self).save(
+            fname_or_handle, separately=separately, ignore=frozenset(ignore) | {'model'}, **kwargs
+        )
+
+
+def assign_clusters(vectors, centroids, chunksize=4096):
+    """Assign each of the (unit-length) `vectors` to the cluster with the most similar centroid.
+
+    Parameters
+    ----------
+    vectors : numpy.ndarray
+        Vectors, one per row.
+    centroids : numpy.ndarray
+        Cluster centroids, one per row.
+    chunksize : int, optional
+        Number of vectors processed at once, to bound memory use.
+
+    Returns
+    -------
+    numpy.ndarray
+        Cluster index of each vector.
+
+    """
+    assignment = np.empty(len(vectors), dtype=np.intp)
+    for start in range(0, len(vectors), chunksize):
+        assignment[start:start + chunksize] = np.argmax(np.dot(vectors[start:start + chunksize], centroids.T), axis=1)
+    return assignment
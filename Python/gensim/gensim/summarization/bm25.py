@@ -27,6 +27,15 @@ Examples
     ... ]
     >>> result = get_bm25_weights(corpus, n_jobs=-1)
 
+For retrieval over large corpora, use the vectorized :class:`~gensim.summarization.bm25.SparseBM25` engine directly:
+
+.. sourcecode:: pycon
+
+    >>> from gensim.summarization.bm25 import SparseBM25
+    >>> bm25 = SparseBM25(corpus)
+    >>> scores = bm25.get_scores(["cat", "space"])  # score of the query against every document
+    >>> best = bm25.get_top_n(["cat", "space"], topn=2)  # the two best matching documents, as (index, score)
+
 
 Data:
 -----
@@ -42,6 +51,10 @@ from six import iteritems
 from six.moves import range
 from functools import partial
 from multiprocessing import Pool
+
+import numpy as np
+import scipy.sparse
+
 from ..utils import effective_n_jobs
 
 PARAM_K1 = 1.5
@@ -162,30 +175,240 @@ class BM25(object):
         return scores
 
 
-def _get_scores(bm25, document, average_idf):
-    """Helper function for retrieving bm25 scores of given `document` in parallel
+class SparseBM25(object):
+    """Vectorized implementation of Best Matching 25 ranking function, backed by sparse matrices.
+
+    Scores the same as :class:`~gensim.summarization.bm25.BM25`, but instead of per-document dicts of term
+    frequencies it stores the corpus as a CSR term-document matrix, with the term frequency saturation and
+    document length normalization already applied. Scoring a query (or a batch of queries) is then a single
+    sparse matrix product.
+
+    Attributes
+    ----------
+    corpus_size : int
+        Size of corpus (number of documents).
+    avgdl : float
+        Average length of document in `corpus`.
+    token2id : dict of (str, int)
+        Mapping between terms and their row in `weights`.
+    weights : :class:`scipy.sparse.csr_matrix`
+        Term-document matrix of shape (num_terms, corpus_size), holding the length normalized term frequencies
+        `f * (k1 + 1) / (f + k1 * (1 - b + b * doc_len / avgdl))`.
+    df : numpy.ndarray
+        Document frequencies of terms, indexed by term id.
+    idf : numpy.ndarray
+        Inversed document frequencies of terms, indexed by term id.
+    average_idf : float
+        Average idf in corpus.
+    doc_len : numpy.ndarray
+        Document lengths.
+
+    """
+
+    def __init__(self, corpus, dtype=np.float64):
+        """
+        Parameters
+        ----------
+        corpus : iterable of list of str
+            Given corpus.
+        dtype : data-type, optional
+            Data type of the weights and scores.
+
+        """
+        self.dtype = dtype
+        self.token2id = {}
+        indptr, indices, counts, doc_len = [0], [], [], []
+        for document in corpus:
+            frequencies = {}
+            for word in document:
+                wordid = self.token2id.setdefault(word, len(self.token2id))
+                frequencies[wordid] = frequencies.get(wordid, 0) + 1
+            indices.extend(frequencies.keys())
+            counts.extend(frequencies.values())
+            indptr.append(len(indices))
+            doc_len.append(len(document))
+
+        self.corpus_size = len(doc_len)
+        self.doc_len = np.asarray(doc_len, dtype=np.int64)
+        self.avgdl = float(self.doc_len.sum()) / self.corpus_size
+        num_terms = len(self.token2id)
+
+        # document-term matrix of raw frequencies, transposed to the term-document layout below
+        tf = scipy.sparse.csr_matrix(
+            (np.asarray(counts, dtype=dtype), np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+            shape=(self.corpus_size, num_terms)
+        )
+        self.df = np.bincount(tf.indices, minlength=num_terms)
+        self.idf = np.log(self.corpus_size - self.df + 0.5) - np.log(self.df + 0.5)
+        self.average_idf = float(self.idf.sum()) / num_terms if num_terms else 0.0
+
+        # precompute the per-document length normalization once, then saturate all frequencies in one go
+        length_norm = PARAM_K1 * (1 - PARAM_B + PARAM_B * self.doc_len / self.avgdl)
+        length_norm = np.repeat(length_norm, np.diff(tf.indptr))
+        tf.data = tf.data * (PARAM_K1 + 1) / (tf.data + length_norm)
+        self.weights = tf.T.tocsr()
+
+    def __len__(self):
+        return self.corpus_size
+
+    def _queries2csr(self, documents, average_idf=None):
+        """Convert query documents into a CSR matrix of idf-weighted query term counts, one row per query.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            Documents to be scored.
+        average_idf : float, optional
+            Average idf used in place of negative idfs. If None, use the average idf of the corpus.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+            Query matrix of shape (len(documents), num_terms). Terms not in corpus are ignored.
+
+        """
+        if average_idf is None:
+            average_idf = self.average_idf
+        indptr, indices = [0], []
+        for document in documents:
+            indices.extend(self.token2id[word] for word in document if word in self.token2id)
+            indptr.append(len(indices))
+        indices = np.asarray(indices, dtype=np.int64)
+        idf = self.idf.astype(self.dtype)
+        idf[idf < 0] = EPSILON * average_idf
+        # duplicate query terms are summed up by the csr conversion, same as scoring each occurrence
+        queries = scipy.sparse.csr_matrix(
+            (idf[indices], indices, np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(self.token2id))
+        )
+        queries.sum_duplicates()
+        return queries
+
+    def get_scores(self, document, average_idf=None):
+        """Computes and returns BM25 scores of given `document` in relation to every item in corpus.
+
+        Parameters
+        ----------
+        document : list of str
+            Document to be scored.
+        average_idf : float, optional
+            Average idf in corpus, if None - the average idf of `corpus` is used.
+
+        Returns
+        -------
+        numpy.ndarray
+            BM25 scores, one per document in corpus.
+
+        """
+        return self.get_scores_batch([document], average_idf)[0]
+
+    def get_scores_batch(self, documents, average_idf=None):
+        """Computes and returns BM25 scores of every document in `documents` in relation to every item in corpus.
+
+        Parameters
+        ----------
+        documents : list of list of str
+            Documents to be scored.
+        average_idf : float, optional
+            Average idf in corpus, if None - the average idf of `corpus` is used.
+
+        Returns
+        -------
+        numpy.ndarray
+            BM25 scores of shape (len(documents), corpus_size).
+
+        """
+        queries = self._queries2csr(documents, average_idf)
+        return (queries * self.weights).toarray()
+
+    def get_top_n(self, document, topn=10, average_idf=None):
+        """Get the `topn` best matching documents in corpus for `document`.
+
+        Parameters
+        ----------
+        document : list of str
+            Query document.
+        topn : int, optional
+            Number of best matches to return.
+        average_idf : float, optional
+            Average idf in corpus, if None - the average idf of `corpus` is used.
+
+        Returns
+        -------
+        list of (int, float)
+            Index of document in corpus and its BM25 score, ordered by decreasing score.
+
+        """
+        return next(self.get_top_n_batch([document], topn, average_idf))
+
+    def get_top_n_batch(self, documents, topn=10, average_idf=None, chunksize=256):
+        """Get the `topn` best matching documents in corpus for each document in `documents`.
+
+        Parameters
+        ----------
+        documents : iterable of list of str
+            Query documents.
+        topn : int, optional
+            Number of best matches to return per query.
+        average_idf : float, optional
+            Average idf in corpus, if None - the average idf of `corpus` is used.
+        chunksize : int, optional
+            Number of queries scored at once. Bounds memory use to `chunksize x corpus_size` scores.
+
+        Yields
+        ------
+        list of (int, float)
+            Index of document in corpus and its BM25 score, ordered by decreasing score, for each query in turn.
+
+        """
+        topn = min(topn, self.corpus_size)
+        chunk = []
+        for document in documents:
+            chunk.append(document)
+            if len(chunk) == chunksize:
+                for result in self._top_n_chunk(chunk, topn, average_idf):
+                    yield result
+                chunk = []
+        if chunk:
+            for result in self._top_n_chunk(chunk, topn, average_idf):
+                yield result
+
+    def _top_n_chunk(self, documents, topn, average_idf):
+        """Score a chunk of queries and select the `topn` best documents for each with `numpy.argpartition`."""
+        if topn <= 0:
+            return [[] for _ in documents]
+        scores = self.get_scores_batch(documents, average_idf)
+        if topn < self.corpus_size:
+            best = np.argpartition(-scores, topn - 1, axis=1)[:, :topn]
+        else:
+            best = np.tile(np.arange(self.corpus_size), (len(documents), 1))
+        rows = np.arange(len(documents))[:, None]
+        order = np.argsort(-scores[rows, best], axis=1, kind='mergesort')
+        best = best[rows, order]
+        best_scores = scores[rows, best]
+        return [list(zip(ids.tolist(), sims.tolist())) for ids, sims in zip(best, best_scores)]
+
+
+def _get_scores_batch(bm25, documents, average_idf):
+    """Helper function for retrieving bm25 scores of a block of `documents` in parallel
     in relation to every item in corpus.
 
     Parameters
     ----------
-    bm25 : BM25 object
-        BM25 object fitted on the corpus where documents are retrieved.
-    document : list of str
-        Document to be scored.
+    bm25 : SparseBM25 object
+        SparseBM25 object fitted on the corpus where documents are retrieved.
+    documents : list of list of str
+        Documents to be scored.
     average_idf : float
         Average idf in corpus.
 
     Returns
     -------
-    list of float
+    list of list of float
         BM25 scores.
 
     """
-    scores = []
-    for index in range(bm25.corpus_size):
-        score = bm25.get_score(document, index, average_idf)
-        scores.append(score)
-    return scores
+    return bm25.get_scores_batch(documents, average_idf).tolist()
 
 
 def get_bm25_weights(corpus, n_jobs=1):
@@ -204,6 +427,11 @@ def get_bm25_weights(corpus, n_jobs=1):
     list of list of float
         BM25 scores.
 
+    Notes
+    -----
+    Scores are computed by :class:`~gensim.summarization.bm25.SparseBM25`, in blocks of documents. With `n_jobs`,
+    the blocks are scored in parallel processes, each of which receives only the sparse matrices.
+
     Examples
     --------
     .. sourcecode:: pycon
@@ -217,17 +445,22 @@ def get_bm25_weights(corpus, n_jobs=1):
         >>> result = get_bm25_weights(corpus, n_jobs=-1)
 
     """
-    bm25 = BM25(corpus)
-    average_idf = float(sum(val for val in bm25.idf.values())) / len(bm25.idf)
+    bm25 = SparseBM25(corpus)
+    average_idf = bm25.average_idf
+    chunksize = 256
 
     n_processes = effective_n_jobs(n_jobs)
     if n_processes == 1:
-        weights = [bm25.get_scores(doc, average_idf) for doc in corpus]
+        weights = []
+        for chunk_start in range(0, len(corpus), chunksize):
+            weights.extend(_get_scores_batch(bm25, corpus[chunk_start:chunk_start + chunksize], average_idf))
         return weights
 
-    get_score = partial(_get_scores, bm25, average_idf=average_idf)
+    chunksize = min(chunksize, int(math.ceil(float(len(corpus)) / n_processes)))
+    chunks = [corpus[chunk_start:chunk_start + chunksize] for chunk_start in range(0, len(corpus), chunksize)]
+    get_scores = partial(_get_scores_batch, bm25, average_idf=average_idf)
     pool = Pool(n_processes)
-    weights = pool.map(get_score, corpus)
+    weights = [row for block in pool.map(get_scores, chunks) for row in block]
     pool.close()
     pool.join()
 
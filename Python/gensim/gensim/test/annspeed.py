@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s [VECTORS [NUM_QUERIES [NUM_CLUSTERS]]]
+    Measure recall@10 and query speed of IvfIndexer against exact search with `most_similar`,
+    for increasing numbers of probed clusters. VECTORS is a file in the word2vec C format
+    (binary if it ends in `.bin`); the first NUM_QUERIES vectors are used as queries.
+
+    Without VECTORS, 100000 random vectors of dimension 100, drawn around 1000 random centers, are indexed.
+
+Example: ./annspeed.py GoogleNews-vectors-negative300.bin 1000
+"""
+
+import logging
+import os
+import sys
+from time import time
+
+import numpy as np
+
+from gensim.models import KeyedVectors
+from gensim.similarities.index import IvfIndexer
+
+
+def random_vectors(num_vectors=100000, vector_size=100, num_centers=1000, seed=0):
+    """Generate KeyedVectors with vectors scattered around random centers."""
+    random_state = np.random.RandomState(seed)
+    centers = random_state.randn(num_centers, vector_size)
+    vectors = centers[random_state.randint(num_centers, size=num_vectors)]
+    vectors += 0.5 * random_state.randn(num_vectors, vector_size)
+    kv = KeyedVectors(vector_size)
+    kv.add([str(i) for i in range(num_vectors)], vectors.astype(np.float32))
+    return kv
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+    logging.getLogger('gensim.test.annspeed').setLevel(logging.INFO)
+    logger = logging.getLogger('gensim.test.annspeed')
+    logger.info("running %s", " ".join(sys.argv))
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+
+    if len(sys.argv) > 1:
+        kv = KeyedVectors.load_word2vec_format(sys.argv[1], binary=sys.argv[1].endswith('.bin'))
+    else:
+        kv = random_vectors()
+    num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    num_clusters = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    topn = 10
+
+    kv.init_sims()
+    queries = kv.vectors_norm[:num_queries]
+
+    start = time()
+    exact = [set(word for word, _ in kv.most_similar([query], topn=topn)) for query in queries]
+    taken = time() - start
+    logger.info("exact search: %i queries over %i vectors in %.2fs (%.2f queries/s)",
+                len(queries), len(kv.vocab), taken, len(queries) / taken)
+
+    start = time()
+    index = IvfIndexer(kv, num_clusters=num_clusters)
+    logger.info("built index with %i clusters in %.2fs", index.num_clusters, time() - start)
+
+    for num_probes in [1, 2, 5, 10, 20, 50, 100]:
+        if num_probes > index.num_clusters:
+            break
+        index.num_probes = num_probes
+        start = time()
+        approx = [set(word for word, _ in index.most_similar(query, topn)) for query in queries]
+        taken = time() - start
+        recall = np.mean([len(e & a) / float(len(e)) for e, a in zip(exact, approx)])
+        logger.info("num_probes=%i: recall@%i %.3f, %.2f queries/s", num_probes, topn, recall, len(queries) / taken)
+
+    logger.info("finished running %s", program)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s [CORPUS.mm [NUMDOCS [WORKERS]]]
+    Compare training throughput of LdaMulticore with the default queue-based workers
+    vs. shared memory workers (`shared_memory=True`). Only use the first NUMDOCS documents
+    of the corpus (or all if no NUMDOCS is given).
+
+    Without a corpus, a random corpus of 20000 documents over a 200000 term vocabulary is generated,
+    which is where passing the sufficient statistics through queues hurts the most.
+
+Example: ./ldaspeed.py wiki_en_bow.mm 50000 3
+"""
+
+import logging
+import sys
+import itertools
+import os
+from time import time
+
+import numpy as np
+
+import gensim
+from gensim.models import LdaMulticore
+
+
+def random_corpus(num_docs=20000, num_terms=200000, doc_len=100, seed=0):
+    """Generate a bag-of-words corpus with Zipf-distributed term frequencies."""
+    random_state = np.random.RandomState(seed)
+    corpus = []
+    for _ in range(num_docs):
+        ids = np.minimum(random_state.zipf(1.2, size=doc_len), num_terms) - 1
+        ids, counts = np.unique(ids, return_counts=True)
+        corpus.append(list(zip(ids.tolist(), counts.astype(float).tolist())))
+    return corpus, num_terms
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+    logging.getLogger('gensim.test.ldaspeed').setLevel(logging.INFO)
+    logger = logging.getLogger('gensim.test.ldaspeed')
+    logger.info("running %s", " ".join(sys.argv))
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+
+    if len(sys.argv) > 1:
+        mm = gensim.corpora.MmCorpus(sys.argv[1])
+        num_terms = mm.num_terms
+        num_docs = int(sys.argv[2]) if len(sys.argv) > 2 else len(mm)
+        corpus = list(itertools.islice(mm, num_docs))
+    else:
+        corpus, num_terms = random_corpus()
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    id2word = {termid: str(termid) for termid in range(num_terms)}
+
+    for shared_memory in [False, True]:
+        start = time()
+        model = LdaMulticore(
+            corpus, id2word=id2word, num_topics=100, workers=workers, chunksize=2000, passes=1,
+            eval_every=None, random_state=1, shared_memory=shared_memory
+        )
+        taken = time() - start
+        logger.info(
+            "shared_memory=%s, workers=%i: %i documents x %i terms in %.2fs (%.2f docs/s)",
+            shared_memory, model.workers, len(corpus), num_terms, taken, len(corpus) / taken
+        )
+
+    logger.info("finished running %s", program)
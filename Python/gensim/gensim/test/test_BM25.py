@@ -11,7 +11,9 @@ Automated tests for checking transformation algorithms (the models package).
 import logging
 import unittest
 
-from gensim.summarization.bm25 import get_bm25_weights
+import numpy as np
+
+from gensim.summarization.bm25 import BM25, SparseBM25, get_bm25_weights
 from gensim.test.utils import common_texts
 
 
@@ -54,6 +56,46 @@ class TestBM25(unittest.TestCase):
         self.assertAlmostEqual(weights2, weights3)
 
 
+class TestSparseBM25(unittest.TestCase):
+    def setUp(self):
+        self.bm25 = BM25(common_texts)
+        self.average_idf = float(sum(self.bm25.idf.values())) / len(self.bm25.idf)
+        self.sparse_bm25 = SparseBM25(common_texts)
+
+    def test_same_scores_as_bm25(self):
+        """ Vectorized scores should match the per-document dict implementation """
+        queries = common_texts + [['human', 'human', 'trees'], ['unknown', 'words'], []]
+        for query in queries:
+            expected = self.bm25.get_scores(query, self.average_idf)
+            self.assertTrue(np.allclose(expected, self.sparse_bm25.get_scores(query)))
+        expected = [self.bm25.get_scores(query, self.average_idf) for query in queries]
+        self.assertTrue(np.allclose(expected, self.sparse_bm25.get_scores_batch(queries)))
+
+    def test_average_idf(self):
+        self.assertAlmostEqual(self.average_idf, self.sparse_bm25.average_idf)
+        expected = self.bm25.get_scores(common_texts[0], 1.0)
+        self.assertTrue(np.allclose(expected, self.sparse_bm25.get_scores(common_texts[0], average_idf=1.0)))
+
+    def test_top_n(self):
+        """ Top documents should be the highest scoring ones, in decreasing order """
+        for query in common_texts:
+            scores = self.sparse_bm25.get_scores(query)
+            top = self.sparse_bm25.get_top_n(query, topn=3)
+            self.assertEqual(len(top), 3)
+            self.assertTrue(np.allclose(sorted(scores, reverse=True)[:3], [score for _, score in top]))
+            for index, score in top:
+                self.assertAlmostEqual(scores[index], score)
+        self.assertEqual(len(self.sparse_bm25.get_top_n(common_texts[0], topn=100)), len(common_texts))
+        self.assertEqual(self.sparse_bm25.get_top_n(common_texts[0], topn=0), [])
+
+    def test_top_n_batch(self):
+        """ Batches should give the same results regardless of chunking """
+        expected = [self.sparse_bm25.get_top_n(query, topn=2) for query in common_texts]
+        for chunksize in [1, 2, 100]:
+            result = list(self.sparse_bm25.get_top_n_batch(common_texts, topn=2, chunksize=chunksize))
+            self.assertEqual(expected, result)
+
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.DEBUG)
     unittest.main()
@@ -14,13 +14,15 @@ import codecs
 import itertools
 import logging
 import os.path
+import pickle
 import tempfile
 import unittest
 
 import numpy as np
 
 from gensim.corpora import (bleicorpus, mmcorpus, lowcorpus, svmlightcorpus,
-                            ucicorpus, malletcorpus, textcorpus, indexedcorpus, wikicorpus)
+                            ucicorpus, malletcorpus, textcorpus, indexedcorpus, wikicorpus, csrcorpus)
+from gensim import matutils
 from gensim.interfaces import TransformedCorpus
 from gensim.utils import to_unicode
 from gensim.test.utils import datapath, get_tmpfile
@@ -377,6 +379,52 @@ class TestMmCorpusOverflow(CorpusTestCase):
         self.assertRaises(RuntimeError, lambda: self.corpus[3])
 
 
+class TestParallelMmReader(unittest.TestCase):
+    def test_iter(self):
+        fname = datapath('test_mmcorpus_with_index.mm')
+        expected = list(mmcorpus.MmCorpus(fname))
+        # tiny byte ranges: most documents span several ranges before alignment
+        for chunk_bytes in [1, 10, 50, 10000]:
+            corpus = mmcorpus.ParallelMmReader(fname, workers=2, chunk_bytes=chunk_bytes, prefetch=2)
+            self.assertEqual(len(corpus), 9)
+            self.assertEqual(list(corpus), expected)
+            ranges = corpus.byte_ranges()
+            self.assertEqual([end for _, end in ranges[:-1]], [start for start, _ in ranges[1:]])
+
+    def test_empty_documents(self):
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        corpus = [[], [(1, 1.0)], [], [], [(0, 0.5), (2, 1.0)], []]
+        mmcorpus.MmCorpus.serialize(tmpf, corpus)
+        for chunk_bytes in [1, 10000]:
+            reader = mmcorpus.ParallelMmReader(tmpf, workers=2, chunk_bytes=chunk_bytes)
+            self.assertEqual(list(reader), corpus)
+            blocks = list(reader.iter_blocks())
+            self.assertEqual(sum(block.shape[1] for _, block in blocks), len(corpus))
+            self.assertTrue(np.allclose(
+                np.hstack([block.toarray() for _, block in blocks]), matutils.corpus2dense(corpus, 3)
+            ))
+
+    def test_iter_blocks(self):
+        fname = datapath('test_mmcorpus_with_index.mm')
+        expected = matutils.corpus2csc(mmcorpus.MmCorpus(fname)).toarray()
+        corpus = mmcorpus.ParallelMmReader(fname, workers=2, chunk_bytes=30)
+        first_docids, blocks = zip(*corpus.iter_blocks(dtype=np.float32))
+        self.assertEqual(list(first_docids), np.cumsum([0] + [block.shape[1] for block in blocks[:-1]]).tolist())
+        self.assertEqual(blocks[0].dtype, np.float32)
+        self.assertTrue(np.allclose(np.hstack([block.toarray() for block in blocks]), expected))
+
+    def test_compressed(self):
+        fname = datapath('test_mmcorpus_no_index.mm.gz')
+        corpus = mmcorpus.ParallelMmReader(fname, workers=2)
+        self.assertFalse(corpus.is_splittable())
+        self.assertEqual(list(corpus), list(mmcorpus.MmCorpus(fname)))
+        self.assertRaises(ValueError, lambda: list(corpus.iter_blocks()))
+
+    def test_corrupt(self):
+        corpus = mmcorpus.ParallelMmReader(datapath('test_mmcorpus_corrupt.mm'), workers=2, chunk_bytes=20)
+        self.assertRaises(ValueError, lambda: list(corpus))
+
+
 class TestSvmLightCorpus(CorpusTestCase):
     def setUp(self):
         self.corpus_class = svmlightcorpus.SvmLightCorpus
@@ -427,6 +475,90 @@ class TestUciCorpus(CorpusTestCase):
         pass
 
 
+class TestCsrCorpus(CorpusTestCase):
+    def setUp(self):
+        self.corpus_class = csrcorpus.CsrCorpus
+        self.file_extension = '.csr'
+
+    def test_serialize_compressed(self):
+        # CsrCorpus memory-maps the file => doesn't support compressed files
+        pass
+
+    def test_load(self):
+        corpus = self.corpus_class(datapath('testcorpus.csr'))
+        self.assertEqual(list(corpus), list(mmcorpus.MmCorpus(datapath('testcorpus.mm'))))
+        self.assertEqual((corpus.num_docs, corpus.num_terms, corpus.num_nnz), (9, 12, 28))
+        self.assertTrue(isinstance(corpus.data, np.memmap))
+
+        corpus = self.corpus_class(datapath('testcorpus.csr'), mmap=None)
+        self.assertFalse(isinstance(corpus.data, np.memmap))
+        self.assertEqual(list(corpus), list(mmcorpus.MmCorpus(datapath('testcorpus.mm'))))
+
+    def test_indexing(self):
+        corpus = self.corpus_class(datapath('testcorpus.csr'))
+        docs = list(corpus)
+
+        for idx, doc in enumerate(docs):
+            self.assertEqual(doc, corpus[idx])
+            self.assertEqual(doc, corpus[np.int64(idx)])
+
+        self.assertEqual(docs, list(corpus[:]))
+        self.assertEqual(docs[0:-1], list(corpus[0:-1]))
+        self.assertEqual(docs[2:4], list(corpus[2:4]))
+        self.assertEqual(docs[::2], list(corpus[::2]))
+        self.assertEqual(docs[::-1], list(corpus[::-1]))
+        self.assertEqual(docs[2:7][1:3], list(corpus[2:7][1:3]))
+        self.assertEqual(docs[3], corpus[2:7][1])
+        self.assertEqual(len(docs[::2]), len(corpus[::2]))
+        self.assertEqual(sum(len(doc) for doc in docs[2:5]), corpus[2:5].num_nnz)
+
+        # slices are views of the memory-mapped arrays, not copies
+        self.assertTrue(corpus[2:5].data is corpus.data)
+
+        self.assertEqual([docs[1], docs[3], docs[4]], list(corpus[[1, 3, 4]]))
+        self.assertEqual([docs[8], docs[0]], list(corpus[np.asarray([-1, 0])]))
+        self.assertRaises(ValueError, lambda: corpus[{1}])
+        self.assertRaises(ValueError, lambda: corpus[1.0])
+
+        # random access also works through a transformation
+        corpus_ = TransformedCorpus(DummyTransformer(), corpus)
+        self.assertEqual(corpus_[0][0][1], docs[0][0][1] + 1)
+
+    def test_csr_matrix(self):
+        corpus = self.corpus_class(datapath('testcorpus.csr'))
+        dense = matutils.corpus2dense(corpus, corpus.num_terms).T
+
+        self.assertTrue(np.allclose(corpus.csr_matrix().toarray(), dense))
+        self.assertTrue(np.allclose(corpus.csr_matrix(2, 5).toarray(), dense[2:5]))
+        self.assertTrue(np.allclose(corpus[[4, 1, 7]].csr_matrix().toarray(), dense[[4, 1, 7]]))
+        self.assertEqual(corpus.csr_matrix(5, 5).shape, (0, 12))
+
+        blocks = list(corpus.iter_chunks(chunksize=4))
+        self.assertEqual([block.shape for block in blocks], [(4, 12), (4, 12), (1, 12)])
+        self.assertTrue(np.allclose(np.vstack([block.toarray() for block in blocks]), dense))
+        self.assertTrue(np.allclose(blocks[1].T.toarray(), matutils.corpus2csc(corpus[4:8], 12).toarray()))
+
+    def test_pickle(self):
+        corpus = self.corpus_class(datapath('testcorpus.csr'))
+        for corpus_ in [corpus, corpus[2:6], corpus[[5, 1]]]:
+            unpickled = pickle.loads(pickle.dumps(corpus_))
+            self.assertEqual(list(corpus_), list(unpickled))
+            self.assertTrue(isinstance(unpickled.data, np.memmap))
+
+    def test_serialize_num_terms(self):
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        self.corpus_class.serialize(tmpf, self.TEST_CORPUS, id2word={i: str(i) for i in range(5)}, dtype=np.float64)
+        corpus = self.corpus_class(tmpf)
+        self.assertEqual(corpus.num_terms, 5)
+        self.assertEqual(corpus.data.dtype, np.float64)
+        self.assertRaises(ValueError, self.corpus_class.serialize, tmpf, corpus)
+
+    def test_save_metadata(self):
+        tmpf = get_tmpfile('gensim_corpus.tst')
+        self.assertRaises(ValueError, self.corpus_class.save_corpus, tmpf, self.TEST_CORPUS, metadata=True)
+        self.assertRaises(ValueError, self.corpus_class.serialize, tmpf, self.TEST_CORPUS, metadata=True)
+
+
 class TestMalletCorpus(CorpusTestCase):
     TEST_CORPUS = [[(1, 1)], [], [(0, 2), (2, 1)], []]
 
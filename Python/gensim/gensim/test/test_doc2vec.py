@@ -65,6 +65,22 @@ def save_lee_corpus_as_line_sentence(corpus_file):
 
 
 class TestDoc2VecModel(unittest.TestCase):
+    def testParallelScanVocab(self):
+        """Test scanning the vocabulary with several processes gives the same vocabulary and tags"""
+        corpus_file = datapath('lee_background.cor')
+        documents = [doc2vec.TaggedDocument(doc.words, [str(doc.tags[0])]) for doc in list_corpus]
+        for kwargs in [{'corpus_file': corpus_file}, {'documents': documents}]:
+            serial = doc2vec.Doc2Vec(min_count=1, workers=1)
+            serial.build_vocab(**kwargs)
+            parallel = doc2vec.Doc2Vec(min_count=1, workers=3)
+            parallel.build_vocab(**kwargs)
+
+            self.assertEqual(parallel.corpus_count, serial.corpus_count)
+            self.assertEqual(parallel.corpus_total_words, serial.corpus_total_words)
+            self.assertEqual(parallel.wv.index2word, serial.wv.index2word)
+            self.assertEqual(parallel.docvecs.count, serial.docvecs.count)
+            self.assertEqual(parallel.docvecs.offset2doctag, serial.docvecs.offset2doctag)
+
     def test_persistence(self):
         """Test storing/loading the entire model."""
         tmpf = get_tmpfile('gensim_doc2vec.tst')
@@ -16,7 +16,7 @@ import numpy as np
 
 from gensim.corpora import Dictionary
 from gensim.models import KeyedVectors as EuclideanKeyedVectors, TfidfModel
-from gensim.test.utils import datapath
+from gensim.test.utils import datapath, get_tmpfile
 
 
 logger = logging.getLogger(__name__)
@@ -128,6 +128,40 @@ class TestEuclideanKeyedVectors(unittest.TestCase):
         predicted = [result[0] for result in self.vectors.most_similar([input_vector], topn=5)]
         self.assertEqual(expected, predicted)
 
+    def test_most_similar_batch(self):
+        """Test most_similar_batch gives the same results as most_similar for each query."""
+        queries = [
+            'war', self.vectors['conflict'], (['war', 'conflict'], ['terrorism']),
+            ([('war', 2.0), 'conflict'], None), (None, ['holiday']),
+        ]
+        for restrict_vocab in [None, 20]:
+            for topn in [1, 5, 1000]:
+                predicted = self.vectors.most_similar_batch(
+                    queries, topn=topn, restrict_vocab=restrict_vocab, block_size=2)
+                self.assertEqual(len(predicted), len(queries))
+                for query, result in zip(queries, predicted):
+                    if isinstance(query, tuple):
+                        expected = self.vectors.most_similar(*query, topn=topn, restrict_vocab=restrict_vocab)
+                    else:
+                        expected = self.vectors.most_similar([query], topn=topn, restrict_vocab=restrict_vocab)
+                    self.assertEqual([word for word, _ in result], [word for word, _ in expected])
+                    self.assertTrue(np.allclose([sim for _, sim in result], [sim for _, sim in expected]))
+
+        # input words are never returned
+        self.assertFalse('war' in dict(self.vectors.most_similar_batch(['war'], topn=1000)[0]))
+
+        # a matrix of raw query vectors
+        vectors = self.vectors.vectors[:3]
+        predicted = self.vectors.most_similar_batch(vectors, topn=3)
+        for vector, result in zip(vectors, predicted):
+            expected = self.vectors.most_similar([vector], topn=3)
+            self.assertEqual([word for word, _ in result], [word for word, _ in expected])
+            self.assertTrue(np.allclose([sim for _, sim in result], [sim for _, sim in expected]))
+
+        sims = self.vectors.most_similar_batch(['war', 'conflict'], topn=False)
+        self.assertEqual(sims.shape, (2, len(self.vectors.vocab)))
+        self.assertTrue(np.allclose(sims[1], self.vectors.most_similar('conflict', topn=False)))
+
     def test_most_similar_to_given(self):
         """Test most_similar_to_given returns correct results."""
         predicted = self.vectors.most_similar_to_given('war', ['terrorism', 'call', 'waging'])
@@ -256,6 +290,75 @@ class TestEuclideanKeyedVectors(unittest.TestCase):
             self.assertTrue(np.allclose(self.vectors[ent], vector))
 
 
+class TestMmapFormat(unittest.TestCase):
+    def setUp(self):
+        self.vectors = EuclideanKeyedVectors.load_word2vec_format(datapath('euclidean_vectors.bin'), binary=True)
+        self.fname = get_tmpfile('gensim_keyedvectors.kvmm')
+        self.vectors.save_mmap_format(self.fname)
+
+    def test_roundtrip(self):
+        """Test the vectors and vocabulary survive saving and memory-mapping."""
+        loaded = EuclideanKeyedVectors.load_mmap_format(self.fname)
+        self.assertTrue(isinstance(loaded.vectors, np.memmap))
+        self.assertEqual(loaded.vectors.shape, self.vectors.vectors.shape)
+        self.assertTrue(np.array_equal(loaded.vectors, self.vectors.vectors))
+        self.assertEqual(len(loaded.vocab), len(self.vectors.vocab))
+        self.assertEqual(list(loaded.index2word), self.vectors.index2word)
+        self.assertEqual(loaded.index2word[-1], self.vectors.index2word[-1])
+        self.assertEqual(loaded.index2word[2:5], self.vectors.index2word[2:5])
+        for word, vocab in self.vectors.vocab.items():
+            self.assertTrue(word in loaded.vocab)
+            self.assertEqual(loaded.vocab[word].index, vocab.index)
+            self.assertEqual(loaded.vocab[word].count, vocab.count)
+        self.assertEqual(sorted(loaded.vocab), sorted(self.vectors.vocab))
+        self.assertFalse('___no_such_word___' in loaded.vocab)
+        self.assertRaises(KeyError, lambda: loaded['___no_such_word___'])
+
+    def test_queries(self):
+        """Test similarity queries give the same results on memory-mapped vectors."""
+        loaded = EuclideanKeyedVectors.load_mmap_format(self.fname)
+        self.assertTrue(np.allclose(loaded['war'], self.vectors['war']))
+        self.assertAlmostEqual(loaded.similarity('war', 'conflict'), self.vectors.similarity('war', 'conflict'))
+        expected = self.vectors.most_similar('war', topn=5)
+        predicted = loaded.most_similar('war', topn=5)
+        self.assertEqual([word for word, _ in predicted], [word for word, _ in expected])
+
+        loaded = EuclideanKeyedVectors.load_mmap_format(self.fname, mmap='c')
+        loaded.init_sims(replace=True)
+        self.assertTrue(np.allclose(np.linalg.norm(loaded.vectors, axis=1), 1.0, atol=1e-5))
+        self.assertTrue(np.array_equal(EuclideanKeyedVectors.load_mmap_format(self.fname).vectors,
+                                       self.vectors.vectors))
+
+    def test_unicode_and_counts(self):
+        """Test non-ascii words and unknown counts are stored correctly."""
+        kv = EuclideanKeyedVectors(3)
+        words = [u'b\xe9b\xe9', u'zebra', u'\u65e5\u672c', u'a', u'ab']
+        kv.add(words, np.arange(15, dtype=np.float32).reshape(5, 3))
+        kv.vocab[u'zebra'].count = None
+        kv.save_mmap_format(self.fname)
+        loaded = EuclideanKeyedVectors.load_mmap_format(self.fname)
+        self.assertEqual(list(loaded.index2word), words)
+        for index, word in enumerate(words):
+            self.assertEqual(loaded.vocab[word].index, index)
+            self.assertTrue(np.array_equal(loaded[word], kv[word]))
+        self.assertEqual(loaded.vocab[u'zebra'].count, None)
+        self.assertEqual(loaded.vocab[u'a'].count, 1)
+
+    def test_persistence(self):
+        """Test memory-mapped vectors can still be pickled with the usual `save()`."""
+        loaded = EuclideanKeyedVectors.load_mmap_format(self.fname)
+        fname = get_tmpfile('gensim_keyedvectors_mmap.kv')
+        loaded.save(fname)
+        reloaded = EuclideanKeyedVectors.load(fname)
+        self.assertTrue(np.array_equal(reloaded.vectors, self.vectors.vectors))
+        self.assertEqual(reloaded.vocab['war'].index, self.vectors.vocab['war'].index)
+        self.assertEqual(reloaded.index2word[:3], self.vectors.index2word[:3])
+
+    def test_invalid_file(self):
+        """Test other formats are rejected."""
+        self.assertRaises(ValueError, EuclideanKeyedVectors.load_mmap_format, datapath('euclidean_vectors.bin'))
+
+
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
     unittest.main()
@@ -18,7 +18,7 @@ import numpy as np
 from numpy.testing import assert_allclose
 
 from gensim.corpora import mmcorpus, Dictionary
-from gensim.models import ldamodel, ldamulticore
+from gensim.models import lda_connection, ldamodel, ldamulticore
 from gensim import matutils, utils
 from gensim.test import basetmtests
 from gensim.test.utils import datapath, get_tmpfile, common_texts
@@ -491,6 +491,48 @@ class TestLdaModel(unittest.TestCase, basetmtests.TestBaseTopicModel):
         topics = model[test_doc]
         self.assertTrue(np.allclose(expected_topics, topics))
 
+    def testBatchInference(self):
+        chunk = corpus + [[]] + [np.array(doc, dtype=np.float64) for doc in corpus[:3]]
+        for dtype in [np.float32, np.float64]:
+            model = self.class_(corpus, id2word=dictionary, num_topics=3, passes=2, dtype=dtype)
+            for iterations in [0, 1, 50]:
+                model.iterations = iterations
+                model.random_state = np.random.RandomState(0)
+                gamma, sstats = model.inference_batch(chunk, collect_sstats=True)
+                model.batch_inference = False
+                model.random_state = np.random.RandomState(0)
+                expected_gamma, expected_sstats = model.inference(chunk, collect_sstats=True)
+                model.batch_inference = True
+                self.assertEqual(gamma.dtype, dtype)
+                self.assertEqual(sstats.dtype, dtype)
+                assert_allclose(expected_gamma, gamma, rtol=1e-5)
+                assert_allclose(expected_sstats, sstats, rtol=1e-5, atol=1e-6)
+
+    def testGetDocumentTopicsDense(self):
+        model = self.class_(corpus, id2word=dictionary, num_topics=3, passes=2, minimum_probability=0.1)
+        model.random_state = np.random.RandomState(0)
+        expected = np.vstack([matutils.sparse2full(model.get_document_topics(doc), 3) for doc in corpus])
+        model.random_state = np.random.RandomState(0)
+        got = model.get_document_topics_dense(corpus, chunksize=4)
+        self.assertEqual(got.dtype, np.float32)
+        self.assertEqual(got.shape, (len(corpus), 3))
+        assert_allclose(got, expected, atol=1e-5)
+
+        # documents as rows of a sparse matrix, into a memory-mapped matrix
+        csr = matutils.corpus2csc(corpus, num_terms=len(dictionary)).T.tocsr()
+        fname = get_tmpfile('gensim_lda_topics.mm')
+        model.random_state = np.random.RandomState(0)
+        got = model.get_document_topics_dense(csr, chunksize=4, out=fname)
+        self.assertTrue(isinstance(got, np.memmap))
+        assert_allclose(got, expected, atol=1e-5)
+
+        # in worker processes, each starting from its own random initialization
+        expected = model.get_document_topics_dense(corpus, minimum_probability=0.0)
+        got = model.get_document_topics_dense(csr, minimum_probability=0.0, chunksize=2, workers=2)
+        assert_allclose(got, expected, atol=1e-2)
+
+        self.assertRaises(ValueError, model.get_document_topics_dense, corpus, out=np.zeros((2, 3)))
+
 # endclass TestLdaModel
 
 
@@ -504,10 +546,69 @@ class TestLdaMulticore(TestLdaModel):
     def testAlphaAuto(self):
         self.assertRaises(RuntimeError, self.class_, alpha='auto')
 
+    def testSharedMemory(self):
+        for batch in [False, True]:
+            passed = False
+            for i in range(5):  # restart at most 5 times
+                model = self.class_(
+                    id2word=dictionary, num_topics=2, passes=100, workers=2, chunksize=3, batch=batch,
+                    shared_memory=True
+                )
+                model.update(self.corpus)
+                self.assertEqual(model.state.numdocs, len(self.corpus))
+
+                vec = matutils.sparse2full(model[list(corpus)[0]], 2)
+                passed = np.allclose(sorted(vec), sorted([0.13, 0.87]), atol=1e-1)
+                if passed:
+                    break
+            self.assertTrue(passed)
+
+    def testSharedMemoryFloat16(self):
+        self.assertRaises(ValueError, self.class_, id2word=dictionary, dtype=np.float16, shared_memory=True)
+
 
 # endclass TestLdaMulticore
 
 
+class TestLdaConnection(unittest.TestCase):
+    def setUp(self):
+        self.dispatcher = lda_connection.ConnectionDispatcher(workers=2, maxsize=2)
+
+    def tearDown(self):
+        self.dispatcher.exit()
+
+    def testEstep(self):
+        """Test the workers collect the same sufficient statistics as a serial E step."""
+        params = dict(id2word=dictionary, num_topics=2, iterations=1000, gamma_threshold=1e-10)
+        self.dispatcher.initialize(distributed=False, **params)
+        self.assertEqual(self.dispatcher.getworkers(), [0, 1])
+        model = ldamodel.LdaModel(random_state=0, **params)
+        model.sync_state()  # the topics including eta, as sent to the workers
+
+        expected = ldamodel.LdaState(model.eta, model.state.sstats.shape)
+        model.do_estep(corpus, expected)
+        for _ in range(2):  # the second time, the workers keep their topics
+            self.dispatcher.reset(model.state)
+            for start in range(0, len(corpus), 2):
+                self.dispatcher.putjob(corpus[start:start + 2])
+            got = self.dispatcher.getstate()
+            self.assertEqual(self.dispatcher.jobsdone(), 5)
+            self.assertEqual(got.numdocs, len(corpus))
+            assert_allclose(got.sstats, expected.sstats, rtol=1e-3, atol=1e-4)
+
+    def testTraining(self):
+        model = ldamodel.LdaModel(
+            corpus, id2word=dictionary, num_topics=2, passes=2, chunksize=3,
+            distributed=True, dispatcher=self.dispatcher
+        )
+        self.assertEqual(model.numworkers, 2)
+        self.assertEqual(model.get_topics().shape, (2, len(dictionary)))
+        self.assertTrue(np.allclose(model.get_topics().sum(axis=1), 1.0, atol=1e-3))
+
+
+# endclass TestLdaConnection
+
+
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
     unittest.main()
@@ -13,6 +13,7 @@ import logging
 import unittest
 import numpy as np
 
+from gensim import matutils
 from gensim.corpora.mmcorpus import MmCorpus
 from gensim.models import logentropy_model
 from gensim.test.utils import datapath, get_tmpfile
@@ -38,6 +39,13 @@ class TestLogEntropyModel(unittest.TestCase):
         ]
         self.assertTrue(np.allclose(transformed, expected))
 
+    def testTransformBatch(self):
+        for normalize in [False, True]:
+            model = logentropy_model.LogEntropyModel(self.corpus_ok, normalize=normalize)
+            got = model.transform_batch(matutils.corpus2csc(self.corpus_small).T)
+            expected = matutils.corpus2dense([model[doc] for doc in self.corpus_small], got.shape[1]).T
+            self.assertTrue(np.allclose(got.toarray(), expected))
+
     def testPersistence(self):
         fname = get_tmpfile('gensim_models_logentry.tst')
         model = logentropy_model.LogEntropyModel(self.corpus_ok, normalize=True)
@@ -16,8 +16,9 @@ import numpy as np
 import scipy.linalg
 
 from gensim import matutils
+from gensim.corpora.csrcorpus import CsrCorpus
 from gensim.corpora.mmcorpus import MmCorpus
-from gensim.models import lsimodel
+from gensim.models import lsimodel, tfidfmodel
 from gensim.test import basetmtests
 from gensim.test.utils import datapath, get_tmpfile
 
@@ -80,6 +81,64 @@ class TestLsiModel(unittest.TestCase, basetmtests.TestBaseTopicModel):
         ])
         self.assertTrue(np.allclose(abs(got), abs(expected)))  # must equal up to sign
 
+    def testChainedCorpusTransform(self):
+        """Test lsi[tfidf[corpus]] runs on batches and matches the transformation of single documents."""
+        tfidf = tfidfmodel.TfidfModel(self.corpus)
+        model = lsimodel.LsiModel(tfidf[self.corpus], num_topics=2)
+        transformed = model._apply(tfidf[self.corpus], chunksize=4)
+        batches = list(transformed.iter_batches())
+        self.assertEqual([batch.shape for batch in batches], [(4, 2), (4, 2), (1, 2)])
+
+        got = np.vstack([matutils.sparse2full(doc, 2) for doc in transformed])
+        expected = np.vstack([matutils.sparse2full(model[tfidf[doc]], 2) for doc in self.corpus])
+        self.assertTrue(np.allclose(got, expected))
+        self.assertTrue(np.allclose(np.vstack(batches), expected))
+
+    def testMultiprocess(self):
+        """Test the one-pass algorithm with local worker processes matches the serial one, decay included."""
+        for decay in [1.0, 0.5]:
+            serial = lsimodel.LsiModel(self.corpus, num_topics=9, chunksize=2, decay=decay)
+            model = lsimodel.LsiModel(self.corpus, num_topics=9, chunksize=2, decay=decay, workers=2)
+            self.assertEqual(model.numworkers, 2)
+            self.assertEqual(model.docs_processed, len(self.corpus))
+            self.assertTrue(np.allclose(model.projection.s[:3], serial.projection.s[:3], rtol=1e-3))
+            got = np.abs(model.projection.u[:, :3])
+            expected = np.abs(serial.projection.u[:, :3])
+            self.assertTrue(np.allclose(got, expected, atol=1e-3))
+
+        self.assertRaises(ValueError, lsimodel.LsiModel, self.corpus, distributed=True, workers=2)
+
+    def testStochasticSvd(self):
+        """Test the chunked, multithreaded and cached variants of stochastic_svd find the same decomposition."""
+        csc = matutils.corpus2csc(self.corpus, num_terms=12)
+        expected = scipy.linalg.svd(csc.toarray(), compute_uv=False)[:3]
+        csr_fname = get_tmpfile('gensim_lsi.csr')
+        CsrCorpus.serialize(csr_fname, self.corpus)
+
+        for corpus in [self.corpus, csc, CsrCorpus(csr_fname)]:
+            for workers, max_cache_bytes in [(1, 0), (2, 0), (1, 10 ** 6), (2, 10 ** 6)]:
+                timings = []
+                u, s = lsimodel.stochastic_svd(
+                    corpus, 3, num_terms=12, chunksize=2, extra_dims=9, power_iters=2,
+                    workers=workers, max_cache_bytes=max_cache_bytes, timings=timings
+                )
+                self.assertEqual(u.shape, (12, 3))
+                self.assertTrue(np.allclose(s, expected))
+                self.assertEqual(
+                    [timing['pass'] for timing in timings],
+                    ['1st phase', 'power iteration #1', 'power iteration #2', '2nd phase']
+                )
+                cached = max_cache_bytes > 0 and corpus is not csc
+                self.assertEqual([timing['cached'] for timing in timings], [False] + [cached] * 3)
+
+        # a cache budget too small for the input: read it again in every pass
+        timings = []
+        lsimodel.stochastic_svd(self.corpus, 3, num_terms=12, chunksize=2, max_cache_bytes=100, timings=timings)
+        self.assertEqual([timing['cached'] for timing in timings], [False, False])
+
+        model = lsimodel.LsiModel(self.corpus, num_topics=3, onepass=False, workers=2)
+        self.assertTrue(np.allclose(model.projection.s, expected, rtol=1e-3))
+
     def testOnlineTransform(self):
         corpus = list(self.corpus)
         doc = corpus[0]  # use the corpus' first document for testing
@@ -155,6 +155,55 @@ def manual_unitvec(vec):
         return vec
 
 
+class TestCorpus2Csc(unittest.TestCase):
+    def setUp(self):
+        self.corpus = [[(0, 1.0), (3, 2.0)], [], [(1, 0.5)], [(4, 1.5), (2, 3.0), (0, 0.25)], []]
+        self.expected = np.array([
+            [1.0, 0.0, 0.0, 0.25, 0.0],
+            [0.0, 0.0, 0.5, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 3.0, 0.0],
+            [2.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 1.5, 0.0],
+        ])
+
+    def test_corpus2csc(self):
+        result = matutils.corpus2csc(iter(self.corpus), dtype=np.float32)
+        self.assertEqual(result.dtype, np.float32)
+        self.assertTrue(np.allclose(result.toarray(), self.expected))
+
+        # the code path with a known number of documents and non-zeros
+        result = matutils.corpus2csc(self.corpus, num_terms=6, num_docs=5, num_nnz=6)
+        self.assertEqual(result.shape, (6, 5))
+        self.assertTrue(np.allclose(result.toarray()[:5], self.expected))
+
+        self.assertEqual(matutils.corpus2csc([]).shape, (0, 0))
+        self.assertEqual(matutils.corpus2csc([[], []], num_terms=3).shape, (3, 2))
+
+    def test_rows2corpus(self):
+        rows = matutils.corpus2csc(self.corpus).T
+        self.assertEqual(matutils.rows2corpus(rows), self.corpus)
+        dense = matutils.rows2corpus(rows.toarray())
+        self.assertEqual([[(int(i), float(w)) for i, w in doc] for doc in dense], [sorted(doc) for doc in self.corpus])
+
+    def test_unitvec_rows(self):
+        rows = matutils.corpus2csc(self.corpus).T
+        for norm in ['l1', 'l2']:
+            expected = [matutils.unitvec(doc, norm) for doc in self.corpus]
+            self.assertTrue(np.allclose(
+                matutils.unitvec_rows(rows.copy(), norm).toarray(), matutils.corpus2dense(expected, 5).T
+            ))
+            self.assertTrue(np.allclose(
+                matutils.unitvec_rows(rows.toarray(), norm), matutils.corpus2dense(expected, 5).T
+            ))
+
+    def test_resize_columns(self):
+        rows = matutils.corpus2csc(self.corpus).T
+        self.assertEqual(matutils.resize_columns(rows, 8).shape, (5, 8))
+        cropped = matutils.resize_columns(rows, 3)
+        self.assertEqual(cropped.shape, (5, 3))
+        self.assertTrue(np.allclose(cropped.toarray(), self.expected.T[:, :3]))
+
+
 class UnitvecTestCase(unittest.TestCase):
     # test unitvec
     def test_sparse_npfloat32(self):
@@ -16,6 +16,7 @@ import numpy as np
 from scipy.sparse import csr_matrix
 from scipy.sparse import issparse
 
+from gensim import matutils
 from gensim.corpora import mmcorpus
 from gensim.models import normmodel
 from gensim.test.utils import datapath, get_tmpfile
@@ -125,6 +126,12 @@ class TestNormModel(unittest.TestCase):
         # Test if error is raised on unsupported input type
         self.assertRaises(ValueError, lambda model, doc: model.normalize(doc), self.model_l2, [1, 2, 3])
 
+    def testTransformBatch(self):
+        docs = matutils.corpus2csc(self.corpus).T
+        for model in [self.model_l1, self.model_l2]:
+            expected = matutils.corpus2dense([model[doc] for doc in self.corpus], docs.shape[1]).T
+            self.assertTrue(np.allclose(model.transform_batch(docs).toarray(), expected))
+
     def testInit(self):
         """Test if error messages raised on unsupported norm"""
         self.assertRaises(ValueError, normmodel.NormModel, self.corpus, 'l0')
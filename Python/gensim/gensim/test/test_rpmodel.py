@@ -38,6 +38,13 @@ class TestRpModel(unittest.TestCase):
         expected = np.array([-0.70710677, 0.70710677])
         self.assertTrue(np.allclose(vec, expected))  # transformed entries must be equal up to sign
 
+    def testTransformBatch(self):
+        model = rpmodel.RpModel(self.corpus, num_topics=5)
+        got = model.transform_batch(matutils.corpus2csc(self.corpus).T)
+        expected = matutils.corpus2dense([model[doc] for doc in self.corpus], 5).T
+        self.assertTrue(np.allclose(got.toarray(), expected))
+        self.assertEqual(list(model._apply(self.corpus, chunksize=2)), matutils.rows2corpus(got))
+
     def testPersistence(self):
         fname = get_tmpfile('gensim_models.tst')
         model = rpmodel.RpModel(self.corpus, num_topics=2)
@@ -268,6 +268,63 @@ class TestShardedCorpus(unittest.TestCase):
         self.assertEqual(2, len(corpus))
         self.assertEqual(1, corpus[0][0])
 
+    def test_shard_cache(self):
+
+        corpus = ShardedCorpus(self.tmp_fname, self.data, shardsize=100,
+                               dim=self.dim, cache_size=3)
+
+        for offset in [5, 105, 205, 7, 107, 305, 5]:
+            self.assertTrue(np.array_equal(corpus[offset], self.corpus[offset]))
+
+        # Shards 0, 1, 2 and 3 are read once, shard 3 evicts shard 2.
+        stats = corpus.shard_stats()
+        self.assertEqual(stats['misses'], 4)
+        self.assertEqual(stats['hits'], 3)
+        self.assertAlmostEqual(stats['hit_rate'], 3 / 7.0)
+
+        corpus.reset_shard_stats()
+        self.assertEqual(corpus.shard_stats()['hit_rate'], 0.0)
+
+    def test_prefetch(self):
+
+        corpus = ShardedCorpus(self.tmp_fname, self.data, shardsize=100,
+                               dim=self.dim, prefetch=True)
+
+        for i, item in enumerate(corpus):
+            self.assertTrue(np.array_equal(item, self.corpus[i]))
+
+        stats = corpus.shard_stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['prefetch_hits'], corpus.n_shards - 1)
+        self.assertTrue(stats['stall_time'] >= 0.0)
+
+        corpus.save()
+        loaded_corpus = ShardedCorpus.load(self.tmp_fname)
+        self.assertTrue(loaded_corpus.prefetch)
+        self.assertTrue(np.array_equal(loaded_corpus[250:350], self.corpus[250:350]))
+
+    def test_mmap_shards(self):
+
+        for sparse_serialization in [False, True]:
+            fname = self.tmp_fname + '.mmap' + str(sparse_serialization)
+            corpus = ShardedCorpus(fname, self.data, shardsize=100, dim=self.dim,
+                                   sparse_serialization=sparse_serialization, mmap_shards=True)
+
+            self.assertTrue(np.array_equal(corpus[130:131], self.corpus[130:131]))
+            self.assertTrue(np.array_equal(corpus[50:250], self.corpus[50:250]))
+            if not sparse_serialization:
+                self.assertTrue(isinstance(corpus.current_shard, np.memmap))
+
+            # The on-disk format and the shard size are remembered when re-opening the dataset.
+            reopened = ShardedCorpus(fname, None, dim=self.dim, sparse_serialization=sparse_serialization)
+            self.assertTrue(reopened.mmap_shards)
+            self.assertEqual(reopened.shardsize, 100)
+            self.assertTrue(np.array_equal(reopened[130:131], self.corpus[130:131]))
+
+            corpus.resize_shards(250)
+            self.assertEqual(4, corpus.n_shards)
+            self.assertTrue(np.array_equal(corpus[130:400], self.corpus[130:400]))
+
 
 if __name__ == '__main__':
     suite = unittest.TestSuite()
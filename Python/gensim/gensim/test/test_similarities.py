@@ -528,6 +528,77 @@ class TestSimilarity(unittest.TestCase, _TestSimilarityABC):
         self.assertTrue(numpy.allclose(expected, sims))
         index.destroy()
 
+    def testNumBestNegativeSimilarity(self):
+        """shard results are clipped by absolute similarity, a negative one must not hide better documents"""
+        docs = [[(0, 1), (1, 0.2)], [(0, 1), (1, 0.3)], [(0, -1)], [(0, 1), (1, 0.1)]]
+        index = self.cls(None, docs, num_features=2, num_best=2, shardsize=2)
+        sims = index[[(0, 1)]]
+        self.assertEqual([doc_index for doc_index, _ in sims], [3, 0])
+        self.assertTrue(numpy.allclose([sim for _, sim in sims], [1 / numpy.sqrt(1.01), 1 / numpy.sqrt(1.04)]))
+        index.destroy()
+
+
+class TestSimilarityQueryPool(unittest.TestCase):
+    def setUp(self):
+        self.serial = similarities.Similarity(None, corpus, num_features=len(dictionary), shardsize=2)
+
+    def tearDown(self):
+        self.serial.destroy()
+
+    def _check_pool(self, executor):
+        for num_best in [None, 0, 1, 3, 1000]:
+            self.serial.num_best = num_best
+            index = similarities.Similarity(
+                None, corpus, num_features=len(dictionary), shardsize=2, chunksize=2, num_best=num_best,
+                workers=2, executor=executor
+            )
+            try:
+                for _ in range(2):  # second round reuses the same pool and open shards
+                    for query in [corpus[0], corpus, corpus[:1], numpy.eye(len(dictionary))[:3]]:
+                        expected, sims = self.serial[query], index[query]
+                        if num_best is None:
+                            self.assertTrue(numpy.allclose(expected, sims))
+                        else:
+                            self.assertEqual(len(expected), len(sims))
+                            for exp, sim in zip(expected, sims):
+                                self.assertTrue(numpy.allclose(exp, sim))
+                self.assertTrue(index.query_pool is not None)
+            finally:
+                index.destroy()
+            self.assertTrue(index.query_pool is None)
+
+    def testThreadPool(self):
+        self._check_pool('thread')
+
+    def testProcessPool(self):
+        self._check_pool('process')
+
+    def testReopen(self):
+        index = similarities.Similarity(
+            None, corpus[:5], num_features=len(dictionary), shardsize=9, workers=2, executor='process'
+        )
+        _ = index[corpus]  # noqa:F841 forces shard close, and opens the shard in workers
+        index.add_documents(corpus[5:])
+        self.assertTrue(numpy.allclose(self.serial[corpus], index[corpus]))
+        index.destroy()
+
+    def testPersistency(self):
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        index = similarities.Similarity(None, corpus, num_features=len(dictionary), shardsize=2, workers=2)
+        expected = index[corpus]
+        index.save(fname)
+        index2 = similarities.Similarity.load(fname)
+        self.assertTrue(index2.query_pool is None)
+        self.assertTrue(numpy.allclose(expected, index2[corpus]))
+        index2.close()
+        index.destroy()
+
+    def testMergeTopn(self):
+        heap, counter = [], iter(range(100))
+        similarities.docsim.merge_topn(heap, [(0, 0.9), (1, 0.5), (2, 0.1)], 0, 3, counter)
+        similarities.docsim.merge_topn(heap, [(0, 0.7), (1, 0.5)], 10, 3, counter)
+        self.assertEqual(similarities.docsim.heap2sparse(heap), [(0, 0.9), (10, 0.7), (1, 0.5)])
+
 
 class TestWord2VecAnnoyIndexer(unittest.TestCase):
 
@@ -684,6 +755,92 @@ class TestDoc2VecAnnoyIndexer(unittest.TestCase):
         self.assertEqual(self.index.num_trees, self.index2.num_trees)
 
 
+class TestIvfIndexer(unittest.TestCase):
+
+    def setUp(self):
+        from gensim.similarities.index import IvfIndexer
+        self.indexer = IvfIndexer
+
+    def testWord2Vec(self):
+        model = word2vec.Word2Vec(texts, min_count=1)
+        index = self.indexer(model, num_clusters=3, num_probes=3)
+
+        self.assertVectorIsSimilarToItself(model.wv, index)
+        self.assertApproxNeighborsMatchExact(model.wv, index)
+        self.assertLoadedIndexEqual(index, model.wv)
+
+    def testKeyedVectors(self):
+        model = KeyedVectors.load_word2vec_format(datapath('lee_fasttext.vec'))
+        index = self.indexer(model, num_clusters=10, num_probes=10)
+
+        self.assertEqual(index.num_clusters, 10)
+        self.assertEqual(sorted(index.ids), list(range(len(model.vocab))))
+        self.assertVectorIsSimilarToItself(model, index)
+        self.assertApproxNeighborsMatchExact(model, index)
+        self.assertLoadedIndexEqual(index, model)
+
+    def testDoc2Vec(self):
+        model = doc2vec.Doc2Vec(sentences, min_count=1)
+        index = self.indexer(model, num_clusters=2, num_probes=2)
+        vector = model.docvecs.vectors_docs_norm[0]
+
+        doc, similarity = index.most_similar(vector, 1)[0]
+        self.assertEqual(doc, 0)
+        self.assertAlmostEqual(similarity, 1.0, places=5)
+
+        approx_neighbors = model.docvecs.most_similar([vector], topn=5, indexer=index)
+        exact_neighbors = model.docvecs.most_similar(positive=[vector], topn=5)
+        self.assertEqual([n[0] for n in approx_neighbors], [n[0] for n in exact_neighbors])
+
+    def testRecall(self):
+        model = KeyedVectors.load_word2vec_format(datapath('lee_fasttext.vec'))
+        model.init_sims()
+        index = self.indexer(model, num_clusters=20, num_probes=1)
+        recalls = []
+        for num_probes in [1, 5, 20]:
+            index.num_probes = num_probes
+            hits = 0
+            for vector in model.vectors_norm[:50]:
+                exact = {word for word, _ in model.most_similar([vector], topn=10)}
+                hits += len(exact & {word for word, _ in index.most_similar(vector, 10)})
+            recalls.append(hits / 500.0)
+        self.assertEqual(recalls, sorted(recalls))
+        self.assertEqual(recalls[-1], 1.0)
+
+    def testBadModel(self):
+        self.assertRaises(ValueError, self.indexer, model=object())
+
+    def assertVectorIsSimilarToItself(self, wv, index):
+        vector = wv.vectors_norm[0]
+        label = wv.index2word[0]
+        word, similarity = index.most_similar(vector, 1)[0]
+
+        self.assertEqual(word, label)
+        self.assertAlmostEqual(similarity, 1.0, places=5)
+
+    def assertApproxNeighborsMatchExact(self, wv, index):
+        # with all clusters probed, the search is exact
+        vector = wv.vectors_norm[0]
+        approx_neighbors = wv.most_similar([vector], topn=5, indexer=index)
+        exact_neighbors = wv.most_similar(positive=[vector], topn=5)
+
+        self.assertEqual([n[0] for n in approx_neighbors], [n[0] for n in exact_neighbors])
+        self.assertTrue(numpy.allclose([n[1] for n in approx_neighbors], [n[1] for n in exact_neighbors]))
+
+    def assertLoadedIndexEqual(self, index, wv):
+        fname = get_tmpfile('gensim_similarities.tst.ivf')
+        index.save(fname)
+        index2 = self.indexer.load(fname, mmap='r')
+
+        self.assertTrue(isinstance(index2.vectors, numpy.memmap))
+        self.assertEqual(index2.model, None)
+        self.assertEqual(list(index.labels), list(index2.labels))
+        self.assertEqual(index.num_probes, index2.num_probes)
+        self.assertTrue(numpy.array_equal(index.centroids, index2.centroids))
+        vector = wv.vectors_norm[1]
+        self.assertEqual(index.most_similar(vector, 5), index2.most_similar(vector, 5))
+
+
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
     unittest.main()
@@ -9,11 +9,13 @@ Automated tests for checking transformation algorithms (the models package).
 """
 
 
+import itertools
 import logging
 import unittest
 
 import numpy as np
 
+from gensim import matutils
 from gensim.corpora.mmcorpus import MmCorpus
 from gensim.models import tfidfmodel
 from gensim.test.utils import datapath, get_tmpfile, common_dictionary, common_corpus
@@ -51,6 +53,62 @@ class TestTfidfModel(unittest.TestCase):
         expected = [(0, 0.57735026918962573), (1, 0.57735026918962573), (2, 0.57735026918962573)]
         self.assertTrue(np.allclose(transformed, expected))
 
+    def test_transform_batch(self):
+        all_kwargs = [{'normalize': True}, {'normalize': False}, {'pivot': 10}, {'wlocal': np.log1p}]
+        for smartirs in itertools.product('nlabL', 'ntp', 'nc'):
+            all_kwargs.append({'smartirs': ''.join(smartirs)})
+            all_kwargs.append({'smartirs': ''.join(smartirs), 'pivot': 5, 'slope': 0.5})
+        for kwargs in all_kwargs:
+            model = tfidfmodel.TfidfModel(self.corpus, **kwargs)
+            expected = [model[doc] for doc in self.corpus]
+            got = list(model._apply(self.corpus, chunksize=4))
+            self.assertEqual(len(got), len(expected))
+            for doc_got, doc_expected in zip(got, expected):
+                self.assertEqual([termid for termid, _ in doc_got], [termid for termid, _ in doc_expected])
+                self.assertTrue(np.allclose([w for _, w in doc_got], [w for _, w in doc_expected]))
+
+        # unknown terms get no weight
+        model = tfidfmodel.TfidfModel(self.corpus)
+        got = matutils.rows2corpus(model.transform_batch(matutils.corpus2csc([[(0, 1.0), (100, 2.0)]]).T))
+        self.assertEqual([termid for termid, _ in got[0]], [0])
+        self.assertTrue(np.allclose(got[0], model[[(0, 1.0), (100, 2.0)]]))
+
+    def test_add_documents(self):
+        docs = list(self.corpus)
+        expected = tfidfmodel.TfidfModel(docs)
+
+        model = tfidfmodel.TfidfModel(docs[:4])
+        model.add_documents(docs[4:])
+        self.assertEqual(model.num_docs, expected.num_docs)
+        self.assertEqual(model.num_nnz, expected.num_nnz)
+        self.assertEqual(model.dfs, expected.dfs)
+        self.assertEqual(sorted(model.idfs), sorted(expected.idfs))
+        for termid in expected.idfs:
+            self.assertAlmostEqual(model.idfs[termid], expected.idfs[termid])
+        self.assertTrue(np.allclose(model[docs[0]], expected[docs[0]]))
+
+        # an empty model can be built up incrementally too
+        model = tfidfmodel.TfidfModel()
+        model.add_documents(docs[:4])
+        model.add_documents(docs[4:])
+        self.assertEqual(model.dfs, expected.dfs)
+
+    def test_add_documents_decay(self):
+        docs = list(self.corpus)
+        model = tfidfmodel.TfidfModel(docs[:4], decay=0.5)
+        old_dfs = dict(model.dfs)
+        model.add_documents(docs[4:])
+
+        new_dfs = tfidfmodel.TfidfModel(docs[4:]).dfs
+        self.assertAlmostEqual(model.num_docs, 0.5 * 4 + 5)
+        for termid, df in model.dfs.items():
+            self.assertAlmostEqual(df, 0.5 * old_dfs.get(termid, 0) + new_dfs.get(termid, 0))
+            self.assertAlmostEqual(model.idfs[termid], tfidfmodel.df2idf(df, model.num_docs))
+
+        # an explicit decay overrides the model's one
+        model.add_documents(docs[:1], decay=1.0)
+        self.assertAlmostEqual(model.num_docs, 0.5 * 4 + 5 + 1)
+
     def test_init(self):
         # create the transformation model by analyzing a corpus
         # uses the global `corpus`!
@@ -141,6 +141,61 @@ class TestWord2VecModel(unittest.TestCase):
         self.assertEqual(model.wv.vocab['minors'].count, 3)
         self.assertEqual(model.wv.vocab['system'].count, 4)
 
+    def testParallelScanVocab(self):
+        """Test scanning the vocabulary with several processes gives the same raw vocabulary"""
+        corpus_file = datapath('lee_background.cor')
+        serial = word2vec.Word2VecVocab()
+        expected = serial.scan_vocab(corpus_file=corpus_file)
+
+        parallel = word2vec.Word2VecVocab()
+        self.assertEqual(parallel.scan_vocab(corpus_file=corpus_file, workers=3), expected)
+        self.assertEqual(list(parallel.raw_vocab.items()), list(serial.raw_vocab.items()))
+
+        sentences = list(word2vec.LineSentence(corpus_file))
+        parallel = word2vec.Word2VecVocab()
+        result = parallel._scan_vocab_multiprocess(sentences, None, 3, 10000, chunksize=7)
+        self.assertEqual(result, expected)
+        self.assertEqual(list(parallel.raw_vocab.items()), list(serial.raw_vocab.items()))
+
+        # with max_vocab_size, the pruned raw vocabulary is the same as well
+        long_sentences = sentences * 40  # long enough to be split into chunks
+        for kwargs in [dict(corpus_file=corpus_file), dict(sentences=long_sentences)]:
+            serial = word2vec.Word2VecVocab(max_vocab_size=1000)
+            expected = serial.scan_vocab(**kwargs)
+            parallel = word2vec.Word2VecVocab(max_vocab_size=1000)
+            self.assertEqual(parallel.scan_vocab(workers=3, **kwargs), expected)
+            self.assertEqual(list(parallel.raw_vocab.items()), list(serial.raw_vocab.items()))
+
+        model = word2vec.Word2Vec(corpus_file=corpus_file, workers=3, iter=1)
+        self.assertEqual(model.wv.index2word, word2vec.Word2Vec(sentences, workers=1, iter=1).wv.index2word)
+
+    def testEncodedCorpus(self):
+        """Test training on a pre-encoded corpus matches training on the raw sentences"""
+        corpus = list_corpus[:30]  # fits into a single job, so both runs draw the same random numbers
+        model = word2vec.Word2Vec(size=20, min_count=2, seed=42, workers=1)
+        model.build_vocab(corpus)
+
+        tmpf = get_tmpfile('gensim_word2vec.u4')
+        word2vec.EncodedCorpus.serialize(tmpf, corpus + [['oov-word']], model.wv)
+        encoded = word2vec.EncodedCorpus(tmpf)
+        self.assertEqual(len(encoded), len(corpus) + 1)
+        for sentence, indices in zip(corpus + [[]], encoded):
+            self.assertEqual([model.wv.index2word[index] for index in indices],
+                             [word for word in sentence if word in model.wv.vocab])
+        self.assertEqual(
+            [indices.tolist() for indices in word2vec.EncodedCorpus(tmpf, mmap=None)],
+            [indices.tolist() for indices in encoded])
+
+        for sg, hs, negative in [(0, 1, 0), (0, 0, 5), (1, 1, 0), (1, 0, 5)]:
+            raw_model = word2vec.Word2Vec(size=20, min_count=2, seed=42, workers=1, sg=sg, hs=hs, negative=negative)
+            raw_model.build_vocab(corpus)
+            encoded_model = word2vec.Word2Vec(size=20, min_count=2, seed=42, workers=1, sg=sg, hs=hs, negative=negative)
+            encoded_model.build_vocab(corpus)
+            raw_model.train(corpus, total_examples=len(corpus), epochs=1)
+            encoded_model.train(encoded, total_examples=len(encoded), epochs=1)
+            self.assertTrue(np.allclose(raw_model.wv.vectors, encoded_model.wv.vectors))
+            self.assertFalse(hasattr(encoded_model, '_encoded_sample_ints'))
+
     def testTotalWordCount(self):
         model = word2vec.Word2Vec(size=10, min_count=0, seed=42)
         total_words = model.vocabulary.scan_vocab(sentences)[0]
@@ -606,6 +661,16 @@ class TestWord2VecModel(unittest.TestCase):
         self.assertIn('correct', first_section)
         self.assertIn('incorrect', first_section)
 
+    def testEvaluateWordAnalogiesMatchesAccuracy(self):
+        """Test the batched analogy evaluation gives the same answers as one most_similar query per analogy"""
+        model = word2vec.Word2Vec(LeeCorpus())
+        _, sections = model.wv.evaluate_word_analogies(datapath('questions-words.txt'), restrict_vocab=30000)
+        expected = model.wv.accuracy(datapath('questions-words.txt'), restrict_vocab=30000)
+        self.assertEqual(len(sections), len(expected))
+        for section, expected_section in zip(sections, expected):
+            self.assertEqual(section['correct'], expected_section['correct'])
+            self.assertEqual(section['incorrect'], expected_section['incorrect'])
+
     def testEvaluateWordPairs(self):
         """Test Spearman and Pearson correlation coefficients give sane results on similarity datasets"""
         corpus = word2vec.LineSentence(datapath('head500.noblanks.cor.bz2'))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s [CORPUS.mm [NUMDOCS [CHUNKSIZE]]]
+    Compare the throughput of TfidfModel applied one document at a time (`__getitem__`)
+    vs. in sparse-matrix batches of CHUNKSIZE documents (`transform_batch`), for several
+    SMART weighting schemes. Only use the first NUMDOCS documents of the corpus (or all if
+    no NUMDOCS is given).
+
+    Without a corpus, a random corpus of 100000 short documents over a 100000 term vocabulary is generated.
+
+Example: ./tfidfspeed.py wiki_en_bow.mm 100000 10000
+"""
+
+import logging
+import sys
+import itertools
+import os
+from time import time
+
+import numpy as np
+
+import gensim
+from gensim.models import TfidfModel
+
+
+def random_corpus(num_docs=100000, num_terms=100000, doc_len=20, seed=0):
+    """Generate a bag-of-words corpus of short documents with Zipf-distributed term frequencies."""
+    random_state = np.random.RandomState(seed)
+    corpus = []
+    for _ in range(num_docs):
+        ids = np.minimum(random_state.zipf(1.2, size=doc_len), num_terms) - 1
+        ids, counts = np.unique(ids, return_counts=True)
+        corpus.append(list(zip(ids.tolist(), counts.astype(float).tolist())))
+    return corpus
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+    logging.getLogger('gensim.test.tfidfspeed').setLevel(logging.INFO)
+    logger = logging.getLogger('gensim.test.tfidfspeed')
+    logger.info("running %s", " ".join(sys.argv))
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+
+    if len(sys.argv) > 1:
+        mm = gensim.corpora.MmCorpus(sys.argv[1])
+        num_docs = int(sys.argv[2]) if len(sys.argv) > 2 else len(mm)
+        corpus = list(itertools.islice(mm, num_docs))
+    else:
+        corpus = random_corpus()
+    chunksize = int(sys.argv[3]) if len(sys.argv) > 3 else 10000
+
+    for smartirs, pivot in [(None, None), ('ntc', None), ('lpn', None), ('atc', None), ('Ltc', None), ('ntc', 10.0)]:
+        model = TfidfModel(corpus, smartirs=smartirs, pivot=pivot)
+
+        start = time()
+        for doc in corpus:
+            model[doc]
+        taken_single = time() - start
+
+        start = time()
+        for doc in model._apply(corpus, chunksize=chunksize):
+            pass
+        taken_batch = time() - start
+
+        logger.info(
+            "smartirs=%s, pivot=%s: %i documents one by one in %.2fs (%.0f docs/s), "
+            "in batches of %i in %.2fs (%.0f docs/s), speedup %.1fx",
+            smartirs, pivot, len(corpus), taken_single, len(corpus) / taken_single,
+            chunksize, taken_batch, len(corpus) / taken_batch, taken_single / taken_batch
+        )
+
+    logger.info("finished running %s", program)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s [TEXT8 [EPOCHS [WORKERS]]]
+    Compare per-epoch Word2Vec training throughput on the raw text8 corpus (tokenized and looked up
+    in the vocabulary again in every epoch) vs. the same corpus pre-encoded once into an
+    :class:`~gensim.models.word2vec.EncodedCorpus` of memory-mapped vocabulary indices.
+
+    TEXT8 defaults to the `text8` file from `Data/` in the repository root, see http://mattmahoney.net/dc/text8.zip.
+
+Example: ./w2vspeed.py text8 5 3
+"""
+
+import logging
+import sys
+import os
+import copy
+from time import time
+
+from gensim.models.word2vec import Word2Vec, Text8Corpus, EncodedCorpus
+from gensim.test.utils import get_tmpfile
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.WARNING)
+    logging.getLogger('gensim.test.w2vspeed').setLevel(logging.INFO)
+    logger = logging.getLogger('gensim.test.w2vspeed')
+    logger.info("running %s", " ".join(sys.argv))
+
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    default_text8 = os.path.join(module_dir, '..', '..', '..', '..', 'Data', 'text8')
+    fname = sys.argv[1] if len(sys.argv) > 1 else default_text8
+    epochs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    sentences = Text8Corpus(fname)
+    model = Word2Vec(size=100, min_count=5, workers=workers, seed=1)
+    model.build_vocab(sentences)
+    logger.info("vocabulary of %i words over %i sentences", len(model.wv.vocab), model.corpus_count)
+
+    start = time()
+    encoded_fname = get_tmpfile('w2vspeed.u4')
+    EncodedCorpus.serialize(encoded_fname, sentences, model.wv)
+    encoded = EncodedCorpus(encoded_fname)
+    logger.info("encoded the corpus in %.2fs", time() - start)
+
+    for name, corpus in [('raw', sentences), ('encoded', encoded)]:
+        trained = copy.deepcopy(model)
+        start = time()
+        trained_words, _ = trained.train(corpus, total_examples=model.corpus_count, epochs=epochs)
+        taken = time() - start
+        logger.info(
+            "%s corpus, workers=%i: %.2fs per epoch (%.0f effective words/s)",
+            name, workers, taken / epochs, trained_words / taken
+        )
+
+    logger.info("finished running %s", program)